@@ -17,15 +17,19 @@ continue to work unchanged::
 ``obsidian_python_bridge/`` package directory.
 """
 
+from typing import TYPE_CHECKING, Any
+
 # Trigger module-level side effects (event env parsing) on import.
 # This must happen before anything else so that the global event state
 # is available to user scripts immediately.
 import obsidian_python_bridge._events  # noqa: F401
 
-# Re-export the public API that user scripts depend on.
-from obsidian_python_bridge._client import ObsidianPluginDevPythonToJS
-from obsidian_python_bridge._exceptions import ObsidianCommError
-from obsidian_python_bridge._settings import _handle_cli_args, define_settings
+# Re-export the public API that user scripts depend on.  The client and
+# the exception class are resolved lazily (PEP 562), like in the package.
+from obsidian_python_bridge import _handle_cli_args, define_settings
+
+if TYPE_CHECKING:
+    from obsidian_python_bridge import ObsidianCommError, ObsidianPluginDevPythonToJS
 
 __all__ = [
     "ObsidianCommError",
@@ -33,3 +37,13 @@ __all__ = [
     "_handle_cli_args",
     "define_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in ("ObsidianCommError", "ObsidianPluginDevPythonToJS"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import obsidian_python_bridge
+
+    value = getattr(obsidian_python_bridge, name)
+    globals()[name] = value
+    return value
@@ -5,20 +5,54 @@ Obsidian Python Bridge — client library package.
 Public symbols are re-exported here for convenience, and also through the
 backward-compatible shim ``ObsidianPluginDevPythonToJS.py`` at the
 repository root so that existing user scripts continue to work unchanged.
+
+Only the settings-discovery helpers are imported eagerly.  The client and
+the other public symbols are loaded on first access (PEP 562), so a script
+spawned with ``--get-settings-json`` exits before the HTTP stack is ever
+imported.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Trigger module-level side effects (event env parsing) on import.
 import obsidian_python_bridge._events  # noqa: F401
 
-from ._client import ObsidianPluginDevPythonToJS
-from ._exceptions import ObsidianCommError
 from ._settings import _handle_cli_args, define_settings
 from ._version import __version__
 
+if TYPE_CHECKING:
+    from ._client import ObsidianPluginDevPythonToJS
+    from ._exceptions import ObsidianCommError
+    from ._patch import content_hash
+
+#: Lazily loaded public symbols and the submodule defining each of them.
+_LAZY_ATTRIBUTES = {
+    "ObsidianCommError": "._exceptions",
+    "ObsidianPluginDevPythonToJS": "._client",
+    "content_hash": "._patch",
+}
+
 __all__ = [
     "ObsidianCommError",
     "ObsidianPluginDevPythonToJS",
     "__version__",
     "_handle_cli_args",
+    "content_hash",
     "define_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__.
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -13,27 +13,78 @@ object, preserving the original interface that user scripts rely on::
 The ``__init__`` method handles port validation, ``requests.Session``
 creation, execution-mode detection, script-path discovery, and an early
 connection test.  All subsequent HTTP communication is delegated to
-:func:`~obsidian_python_bridge._transport.send_receive`.
+:func:`~obsidian_python_bridge._transport.send_receive` (or
+:func:`~obsidian_python_bridge._transport.send_stream` for streaming actions
+and :func:`~obsidian_python_bridge._transport.send_binary` for raw file bytes).
+
+``requests`` and the transport layer are only imported when a client is
+created: importing this module must stay cheap for settings discovery,
+where scripts exit in ``_handle_cli_args()`` before creating a client.
+
+A client can be shared between threads (see
+:meth:`~obsidian_python_bridge._parallel.ParallelMixin.map_notes`): its
+connection pool holds ``max_connections`` connections, and identical
+read-only requests made concurrently share one round trip.
 """
 
 from __future__ import annotations
 
+import json
 import os
 import sys
-from typing import Any
-
-import requests
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 from ._config import HTTP_PORT
+from ._context import MISSING, load_context, lookup
 from ._editor import EditorMixin
 from ._events_api import EventsMixin
 from ._frontmatter import FrontmatterMixin
 from ._links import LinksMixin
 from ._notes import NotesMixin
-from ._transport import send_receive, test_connection
+from ._parallel import ParallelMixin
+from ._read_cache import ReadCache
+from ._single_flight import SingleFlight
 from ._ui import UIMixin
 from ._vault import VaultMixin
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+#: Read-only actions whose concurrent identical requests are sent only once.
+_SINGLE_FLIGHT_ACTIONS = frozenset(
+    {
+        "check_path_exists",
+        "get_active_note_absolute_path",
+        "get_active_note_content",
+        "get_active_note_frontmatter",
+        "get_active_note_relative_path",
+        "get_active_note_snapshot",
+        "get_active_note_title",
+        "get_all_note_paths",
+        "get_all_tags",
+        "get_backlinks",
+        "get_changes_since",
+        "get_context_snapshot",
+        "get_current_vault_absolute_path",
+        "get_editor_context",
+        "get_line",
+        "get_links",
+        "get_note_content",
+        "get_note_frontmatter",
+        "get_note_hashes",
+        "get_obsidian_language",
+        "get_script_settings",
+        "get_selected_text",
+        "get_tag_index",
+        "get_theme_mode",
+        "get_vault_name",
+        "list_files",
+        "list_folder",
+        "list_tree",
+    }
+)
+
 
 class ObsidianPluginDevPythonToJS(
     NotesMixin,
@@ -43,6 +94,7 @@ class ObsidianPluginDevPythonToJS(
     EventsMixin,
     FrontmatterMixin,
     LinksMixin,
+    ParallelMixin,
 ):
     """Client library to interact with the Obsidian Python Bridge plugin via HTTP.
 
@@ -61,18 +113,41 @@ class ObsidianPluginDevPythonToJS(
         http_port: int = HTTP_PORT,
         connect_timeout: float = 2.0,
         request_timeout: float = 10.0,
+        read_cache_size: int = 64,
+        max_connections: int = 10,
     ) -> None:
         # --- Port validation ---
         if not isinstance(http_port, int) or not (1024 <= http_port <= 65535):
             raise ValueError(f"http_port must be an integer between 1024 and 65535. Received: {http_port}")
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be at least 1. Received: {max_connections}")
 
         self.http_port = http_port
         self.base_url = f"http://127.0.0.1:{self.http_port}/"
         self.connect_timeout = connect_timeout
         self.request_timeout = request_timeout
+        self.max_connections = max_connections
+
+        # Deferred imports (see the module docstring)
+        import requests
+        from requests.adapters import HTTPAdapter
 
-        # Connection pooling via requests.Session
+        from ._transport import test_connection
+
+        # Connection pooling via requests.Session, sized for concurrent use:
+        # threads beyond max_connections wait for a free connection instead
+        # of opening (and discarding) extra ones.
         self.session = requests.Session()
+        self.session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=max_connections, pool_block=True),
+        )
+
+        # --- Concurrent identical reads share one request ---
+        self._single_flight = SingleFlight()
+        # Bumped after every other request: a read only joins requests
+        # started after the caller's previous writes completed.
+        self._write_generation = 0
 
         # --- Execution mode (normal or discovery) ---
         self._execution_mode = os.environ.get("OBSIDIAN_BRIDGE_MODE", "normal")
@@ -93,6 +168,12 @@ class ObsidianPluginDevPythonToJS(
                 file=sys.stderr,
             )
 
+        # --- Context snapshot injected at spawn time (may be None) ---
+        self._context: dict[str, Any] | None = load_context()
+
+        # --- Versioned copies of recent note reads (0 disables caching) ---
+        self._read_cache = ReadCache(read_cache_size)
+
         print(f"Initializing Obsidian client for URL: {self.base_url}")
 
         # --- Early connection test (fail fast) ---
@@ -111,13 +192,145 @@ class ObsidianPluginDevPythonToJS(
         """Delegate to the module-level transport function.
 
         This is the single method that all mixins call to communicate
-        with the Obsidian plugin.
+        with the Obsidian plugin.  Read-only actions go through
+        single-flight deduplication; other actions bump the write
+        generation once they complete.
         """
-        return send_receive(
-            self.session,
-            self.base_url,
-            action,
-            payload,
-            timeout if timeout is not None else self.request_timeout,
-            execution_mode=self._execution_mode,
-        )
+        from ._transport import send_receive
+
+        def _send() -> Any:
+            return send_receive(
+                self.session,
+                self.base_url,
+                action,
+                payload,
+                timeout if timeout is not None else self.request_timeout,
+                execution_mode=self._execution_mode,
+            )
+
+        if action in _SINGLE_FLIGHT_ACTIONS:
+            key = (action, json.dumps(payload, sort_keys=True, default=str), timeout, self._write_generation)
+            return self._single_flight.do(key, _send)
+        try:
+            return _send()
+        finally:
+            # Not atomic, but a lost increment still changes the generation.
+            self._write_generation += 1
+
+    def _send_stream(
+        self,
+        action: str,
+        payload: dict[str, Any] | None,
+        items: Iterable[dict[str, Any]],
+        timeout: float | None = None,
+    ) -> Any:
+        """Delegate a streaming request to the module-level transport function.
+
+        Used by mixins whose actions consume a sequence of items over one
+        long-lived request instead of one round trip per item.
+        """
+        from ._transport import send_stream
+
+        try:
+            return send_stream(
+                self.session,
+                self.base_url,
+                action,
+                payload,
+                items,
+                timeout if timeout is not None else self.request_timeout,
+                execution_mode=self._execution_mode,
+            )
+        finally:
+            self._write_generation += 1  # Streaming actions modify notes
+
+    def _send_binary(
+        self,
+        action: str,
+        path: str,
+        data: bytes | bytearray | memoryview | None = None,
+        *,
+        into: Any = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Delegate a raw-bytes request to the module-level transport function.
+
+        Used for attachments, whose content travels as the request or
+        response body instead of inside JSON.
+        """
+        if self.script_relative_path:
+            headers = {"X-Obsidian-Script": quote(self.script_relative_path, safe=""), **(headers or {})}
+        from ._transport import send_binary
+
+        try:
+            return send_binary(
+                self.session,
+                self.base_url,
+                action,
+                path,
+                data,
+                timeout if timeout is not None else self.request_timeout,
+                into=into,
+                headers=headers,
+                execution_mode=self._execution_mode,
+            )
+        finally:
+            if action != "read_binary":
+                self._write_generation += 1
+
+    def _send_conditional(self, action: str, path: str) -> Any:
+        """Perform a version-checked read of *path* through the read cache.
+
+        The version of the cached copy (if any) is sent as
+        ``known_version``; the plugin only returns the full result when
+        that copy is out of date.
+        """
+        key = (action, path)
+        known_version = self._read_cache.version(key)
+        result = self._send_receive(action, {"path": path, "known_version": known_version})
+        try:
+            return self._read_cache.resolve(key, result)
+        except KeyError:
+            # Evicted between the request and the response: read again in full.
+            result = self._send_receive(action, {"path": path, "known_version": None})
+            return self._read_cache.resolve(key, result)
+
+    # ------------------------------------------------------------------
+    # Context snapshot
+    # ------------------------------------------------------------------
+
+    def _context_get(self, key: str, refresh: bool = False) -> Any:
+        """Return a snapshot value, or ``MISSING`` if absent or *refresh* is set."""
+        return MISSING if refresh else lookup(self._context, key)
+
+    def _context_put(self, key: str, value: Any) -> None:
+        """Store a freshly fetched value so later calls see it too."""
+        if self._context is not None:
+            self._context[key] = value
+
+    def _contextual(self, key: str, action: str, refresh: bool = False) -> Any:
+        """Serve *key* from the context snapshot, or fetch it with *action*."""
+        value = self._context_get(key, refresh)
+        if value is MISSING:
+            value = self._send_receive(action)
+            self._context_put(key, value)
+        return value
+
+    def refresh_context(self) -> dict[str, Any]:
+        """Re-read the whole context snapshot from Obsidian in one request.
+
+        Methods such as :meth:`get_vault_name`, :meth:`get_theme_mode` or
+        :meth:`get_script_settings` answer from a snapshot taken when the
+        script was spawned.  Call this when the script runs long enough for
+        that state (active note, theme, settings, ...) to change.
+
+        Returns:
+            A copy of the new snapshot.
+
+        Raises:
+            ObsidianCommError: If the request fails.
+        """
+        payload = {"scriptPath": self.script_relative_path} if self.script_relative_path else {}
+        self._context = self._send_receive("get_context_snapshot", payload)
+        return dict(self._context or {})
@@ -0,0 +1,63 @@
+# --- obsidian_python_bridge/_context.py ---
+"""
+Spawn-time context snapshot.
+
+When the Obsidian plugin spawns a script it sets ``OBSIDIAN_BRIDGE_CONTEXT``
+to a JSON object with the values scripts usually request right after
+connecting:
+
+* ``vault_path`` / ``vault_name``
+* ``active_note_relative_path`` / ``active_note_absolute_path`` /
+  ``active_note_title``
+* ``theme_mode`` / ``language``
+* ``script_path`` / ``script_settings``
+
+The client serves these locally instead of making one HTTP request each.
+The snapshot reflects the state *at spawn time*; pass ``refresh=True`` to
+the relevant methods, or call ``refresh_context()``, to re-read them from
+Obsidian.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Any
+
+#: Sentinel returned by :func:`lookup` when a value is not in the snapshot.
+MISSING: Any = object()
+
+
+def load_context() -> dict[str, Any] | None:
+    """Parse the ``OBSIDIAN_BRIDGE_CONTEXT`` environment variable.
+
+    Returns:
+        The snapshot dict, or ``None`` if the variable is missing or invalid
+        (the client then falls back to regular API calls).
+    """
+    raw = os.environ.get("OBSIDIAN_BRIDGE_CONTEXT")
+    if not raw:
+        return None
+    try:
+        context = json.loads(raw)
+    except json.JSONDecodeError as e:
+        print(f"WARNING: Could not parse OBSIDIAN_BRIDGE_CONTEXT: {e}", file=sys.stderr)
+        return None
+    if not isinstance(context, dict):
+        print("WARNING: OBSIDIAN_BRIDGE_CONTEXT is not a JSON object. Ignoring it.", file=sys.stderr)
+        return None
+    return context
+
+
+def lookup(context: dict[str, Any] | None, key: str) -> Any:
+    """Return ``context[key]``, or :data:`MISSING` if absent or ``None``.
+
+    ``None`` values (e.g. no active note at spawn time) are treated as
+    missing so that callers fall back to a live request, which reports the
+    condition the same way as without a snapshot.
+    """
+    if context is None:
+        return MISSING
+    value = context.get(key)
+    return MISSING if value is None else value
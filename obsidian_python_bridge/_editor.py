@@ -4,18 +4,23 @@ Editor-related API methods.
 
 This mixin provides methods for interacting with the active Markdown
 editor: reading or replacing the selection, getting/setting the cursor,
-reading or replacing individual lines, and scrolling ranges into view.
+reading or replacing individual lines, scrolling ranges into view, and
+streaming incrementally generated text into the note.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 
 class EditorMixin:
     """Mixin: active editor manipulation methods.
 
-    Requires the host class to expose ``_send_receive(action, payload)``.
+    Requires the host class to expose ``_send_receive(action, payload)``
+    and ``_send_stream(action, payload, items)``.
     """
 
     # ------------------------------------------------------------------
@@ -114,3 +119,57 @@ class EditorMixin:
         if to_ch is not None:
             payload["to_ch"] = to_ch
         self._send_receive("scroll_into_view", payload)  # type: ignore[attr-defined]
+
+    # ------------------------------------------------------------------
+    # Streaming insertion
+    # ------------------------------------------------------------------
+
+    def stream_insert(  # type: ignore[misc]
+        self,
+        chunks: Iterable[str],
+        at: str | tuple[int, int] = "cursor",
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Insert incrementally generated text into the active editor.
+
+        All chunks travel over a single streaming request.  The plugin
+        inserts them strictly in order at an anchor that advances with the
+        inserted text, batches bursts of chunks into one editor update per
+        frame, and stops reading from the connection while it catches up,
+        so a fast producer (e.g. a local model) is throttled rather than
+        flooding Obsidian.
+
+        Args:
+            chunks: Iterable of text fragments, consumed lazily.  Empty
+                    fragments are skipped.
+            at: Where to start inserting: ``"cursor"`` (default),
+                ``"end"`` of the note, or an explicit ``(line, ch)``
+                position (0-based).
+            timeout: Seconds to wait for the final response once the last
+                     chunk was sent (defaults to the client's request timeout).
+
+        Returns:
+            A dict with ``chunks`` (number applied), ``inserted`` (number of
+            characters) and ``end`` (``{line, ch}`` of the anchor after the
+            last insertion).
+
+        Raises:
+            ValueError: If *at* is invalid.
+            ObsidianCommError: If no editor is active, the text right before
+                the insertion point is edited mid-stream, or the request
+                fails.
+        """
+        payload: dict[str, Any]
+        if at in ("cursor", "end"):
+            payload = {"at": at}
+        elif isinstance(at, tuple) and len(at) == 2 and all(isinstance(v, int) for v in at):
+            payload = {"at": "position", "line": at[0], "ch": at[1]}
+        else:
+            raise ValueError("at must be 'cursor', 'end', or a (line, ch) tuple of integers.")
+
+        def _items() -> Iterator[dict[str, str]]:
+            for chunk in chunks:
+                if chunk:
+                    yield {"text": chunk}
+
+        return self._send_stream("stream_insert", payload, _items(), timeout)  # type: ignore[attr-defined]
@@ -7,12 +7,15 @@ When the Obsidian plugin triggers a script in response to a vault event
 the Python process:
 
 * ``OBSIDIAN_EVENT_NAME``  — the Obsidian event identifier (e.g. ``"vault-modify"``)
-* ``OBSIDIAN_EVENT_PAYLOAD`` — a JSON string with event-specific data
-
-This module parses those variables **at import time** so the state is
-available immediately.  User scripts can check :func:`is_handling_event`
-early in their ``__main__`` guard to decide whether to process the event
-or exit.
+* ``OBSIDIAN_EVENT_PAYLOAD`` — a JSON string with event-specific data, or
+  ``OBSIDIAN_EVENT_PAYLOAD_FILE`` — the path of a temporary file holding it,
+  for payloads too large for an environment variable (e.g. with the note
+  content requested at registration)
+
+The event name is read **at import time** so user scripts can check
+:func:`is_handling_event` early in their ``__main__`` guard to decide
+whether to process the event or exit.  The payload is only read and parsed
+on the first :func:`get_event_payload` call.
 """
 
 from __future__ import annotations
@@ -29,27 +32,41 @@ from typing import Any
 _is_handling_event: bool = False
 _event_name: str | None = None
 _event_payload: dict[str, Any] | None = None
-
-# ---------------------------------------------------------------------------
-# Parse event environment variables at import time
-# ---------------------------------------------------------------------------
+_event_payload_loaded: bool = False
 
 _event_name_from_env: str | None = os.environ.get("OBSIDIAN_EVENT_NAME")
 if _event_name_from_env:
     _is_handling_event = True
     _event_name = _event_name_from_env
 
-    _payload_str: str = os.environ.get("OBSIDIAN_EVENT_PAYLOAD", "{}")
+
+def _load_event_payload() -> dict[str, Any] | None:
+    """Read and parse the event payload from the environment (or its file)."""
+    if not _is_handling_event:
+        return None
+    payload_file = os.environ.get("OBSIDIAN_EVENT_PAYLOAD_FILE")
+    if payload_file:
+        try:
+            with open(payload_file, encoding="utf-8") as f:
+                payload_str = f.read()
+        except OSError as e:
+            print(
+                f"ERROR: Failed to read event payload file for event '{_event_name}': {e}",
+                file=sys.stderr,
+            )
+            return {"error": "Failed to read payload file", "payload_file": payload_file}
+    else:
+        payload_str = os.environ.get("OBSIDIAN_EVENT_PAYLOAD", "{}")
     try:
-        _event_payload = json.loads(_payload_str)
+        return json.loads(payload_str)
     except json.JSONDecodeError:
         print(
-            f"ERROR: Failed to parse event payload JSON for event '{_event_name}'. Payload: '{_payload_str}'",
+            f"ERROR: Failed to parse event payload JSON for event '{_event_name}'. Payload: '{payload_str}'",
             file=sys.stderr,
         )
-        _event_payload = {
+        return {
             "error": "Failed to parse payload",
-            "raw_payload": _payload_str,
+            "raw_payload": payload_str,
         }
 
 
@@ -69,5 +86,13 @@ def get_event_name() -> str | None:
 
 
 def get_event_payload() -> dict[str, Any] | None:
-    """Return the parsed event payload dictionary, or ``None``."""
+    """Return the parsed event payload dictionary, or ``None``.
+
+    Besides the event data (``path``, ``oldPath``, ``type``), the payload has
+    the note fields requested with ``register_event_listener(..., fields=...)``.
+    """
+    global _event_payload, _event_payload_loaded
+    if not _event_payload_loaded:
+        _event_payload = _load_event_payload()
+        _event_payload_loaded = True
     return _event_payload
@@ -5,11 +5,14 @@ Event listener registration API methods.
 This mixin allows a script to register or unregister itself for Obsidian
 vault events (note modification, deletion, rename, etc.).  When an event
 fires, the plugin re-executes the script with ``OBSIDIAN_EVENT_NAME`` and
-``OBSIDIAN_EVENT_PAYLOAD`` environment variables set.
+``OBSIDIAN_EVENT_PAYLOAD`` (or ``OBSIDIAN_EVENT_PAYLOAD_FILE``) environment
+variables set.
 """
 
 from __future__ import annotations
 
+from typing import Any
+
 from ._exceptions import ObsidianCommError
 
 
@@ -20,13 +23,24 @@ class EventsMixin:
     and ``_script_relative_path_for_api``.
     """
 
-    def register_event_listener(self, event_name: str) -> None:  # type: ignore[misc]
+    def register_event_listener(self, event_name: str, fields: list[str] | None = None) -> None:  # type: ignore[misc]
         """Register this script to listen for an Obsidian vault event.
 
         Supported events include: ``"vault-modify"``, ``"vault-delete"``,
         ``"vault-rename"``, ``"metadata-changed"``, ``"layout-change"``,
         ``"active-leaf-change"``.
 
+        Args:
+            event_name: The event to listen for.
+            fields: Data about the event's file to add to the payload, saving
+                the requests a handler would otherwise make: ``"mtime"`` and
+                ``"size"`` (any file), ``"content"``, ``"frontmatter"``,
+                ``"hash"`` (as in ``get_note_hashes``) and ``"diff"`` (a
+                unified diff against the note's content at the previous event
+                delivered with a diff, ``None`` the first time; applies with
+                ``patch_note``) for notes.  Fields that do not apply are
+                ``None``.  Registering again replaces the fields.
+
         Raises:
             ObsidianCommError: If the script path is unknown or the request fails.
             ValueError: If *event_name* is empty.
@@ -40,13 +54,13 @@ class EventsMixin:
                 "variable is set.",
                 action="register_event_listener",
             )
-        self._send_receive(  # type: ignore[attr-defined]
-            "register_event_listener",
-            {
-                "eventName": event_name,
-                "scriptPath": self._script_relative_path_for_api,  # type: ignore[attr-defined]
-            },
-        )
+        payload: dict[str, Any] = {
+            "eventName": event_name,
+            "scriptPath": self._script_relative_path_for_api,  # type: ignore[attr-defined]
+        }
+        if fields is not None:
+            payload["fields"] = list(fields)
+        self._send_receive("register_event_listener", payload)  # type: ignore[attr-defined]
         print(f"Event listener registration request sent for: {event_name}")
 
     def unregister_event_listener(self, event_name: str) -> None:  # type: ignore[misc]
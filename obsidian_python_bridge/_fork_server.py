@@ -0,0 +1,285 @@
+# --- obsidian_python_bridge/_fork_server.py ---
+"""
+Fork server: a warm interpreter the plugin forks one child from per script run.
+
+Started by the plugin (``python -m obsidian_python_bridge._fork_server``
+from the plugin folder) when the "fork server" setting is enabled, on
+POSIX systems only.  The slow imports (``requests``, ``yaml``, the bridge
+itself) happen once here; each run then costs a ``fork()`` instead of a
+full interpreter start-up.
+
+Protocol — one JSON object per line in each direction.
+
+Requests (stdin)::
+
+    {"id": 1, "script": "/abs/script.py", "args": [], "cwd": "...", "env": {...}}
+
+Messages (stdout)::
+
+    {"id": 1, "pid": 4242}
+    {"id": 1, "stream": "stdout", "data": "<base64>"}
+    {"id": 1, "exit": 0, "signal": null}
+    {"id": 1, "error": "..."}
+
+A run's ``exit`` message is only sent once both of its output streams are
+drained, so the plugin sees all output before the exit, as with a
+regular child process.
+
+The child replaces the environment, working directory, ``sys.argv`` and
+``sys.path`` with those of the run, and forgets the bridge modules: they
+read the environment (port, event, context) at import time, so the script
+re-imports them (a few milliseconds; their dependencies stay loaded).
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import contextlib
+import importlib
+import json
+import os
+import runpy
+import selectors
+import signal
+import sys
+import threading
+import traceback
+from typing import Any
+
+#: Modules imported once by the server so that runs do not pay for them.
+PRELOAD_MODULES = (
+    "argparse",
+    "datetime",
+    "difflib",
+    "hashlib",
+    "json",
+    "requests",
+    "yaml",
+    "obsidian_python_bridge",
+    "obsidian_python_bridge._client",
+    "obsidian_python_bridge._transport",
+)
+
+#: Modules removed from ``sys.modules`` in each child (see the module docstring).
+BRIDGE_MODULES = ("obsidian_python_bridge", "ObsidianPluginDevPythonToJS")
+
+_READ_SIZE = 65536
+
+
+def _preload() -> None:
+    for name in PRELOAD_MODULES:
+        # Optional dependencies (e.g. yaml) may be missing: scripts report that themselves.
+        with contextlib.suppress(ImportError):
+            importlib.import_module(name)
+
+
+def _base_sys_path() -> list[str]:
+    """``sys.path`` without the entries specific to the server process."""
+    own = set(filter(None, os.environ.get("PYTHONPATH", "").split(os.pathsep)))
+    return [p for p in sys.path[1:] if p not in own]
+
+
+def _exit_code(status: int) -> tuple[int | None, str | None]:
+    """Convert a wait status to ``(exit code, signal name)`` like Node.js does."""
+    if os.WIFSIGNALED(status):
+        return None, signal.Signals(os.WTERMSIG(status)).name
+    return os.waitstatus_to_exitcode(status), None
+
+
+class _Run:
+    """A forked script run and its open output pipes."""
+
+    __slots__ = ("exit", "id", "pid", "streams")
+
+    def __init__(self, run_id: int, pid: int) -> None:
+        self.id = run_id
+        self.pid = pid
+        self.streams = 2
+        self.exit: tuple[int | None, str | None] | None = None
+
+
+class ForkServer:
+    """Single-threaded event loop: requests, child output and child exits."""
+
+    def __init__(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._runs: dict[int, _Run] = {}
+        self._runs_by_pid: dict[int, _Run] = {}
+        self._stdin_buffer = b""
+        self._base_path = _base_sys_path()
+        # SIGCHLD wakes the selector through a self-pipe.
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_w, False)
+        signal.signal(signal.SIGCHLD, lambda *_: None)
+        signal.set_wakeup_fd(self._wakeup_w)
+
+    def serve(self) -> None:
+        """Run until stdin is closed (the plugin stopped or went away)."""
+        self._selector.register(sys.stdin.fileno(), selectors.EVENT_READ, "stdin")
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, "wakeup")
+        self._send({"ready": True, "pid": os.getpid()})
+        while True:
+            for key, _ in self._selector.select():
+                if key.data == "stdin":
+                    if not self._read_requests():
+                        return
+                elif key.data == "wakeup":
+                    os.read(self._wakeup_r, _READ_SIZE)
+                    self._reap()
+                else:
+                    run, stream = key.data
+                    self._relay(run, stream, key.fd)
+
+    # --- Requests ---------------------------------------------------------
+
+    def _read_requests(self) -> bool:
+        data = os.read(sys.stdin.fileno(), _READ_SIZE)
+        if not data:
+            return False
+        *lines, self._stdin_buffer = (self._stdin_buffer + data).split(b"\n")
+        for line in lines:
+            if not line.strip():
+                continue
+            request: Any = None
+            try:
+                request = json.loads(line)
+                self._start(request)
+            except Exception as e:  # Report it and keep serving.
+                self._send({"id": request.get("id") if isinstance(request, dict) else None, "error": str(e)})
+        return True
+
+    def _start(self, request: dict[str, Any]) -> None:
+        stdout_r, stdout_w = os.pipe()
+        stderr_r, stderr_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(stdout_r)
+                os.close(stderr_r)
+                self._become_child(request, stdout_w, stderr_w)
+            finally:
+                os._exit(70)  # Only reached if setting up the child failed.
+        os.close(stdout_w)
+        os.close(stderr_w)
+        run = _Run(request["id"], pid)
+        self._runs[run.id] = run
+        self._runs_by_pid[pid] = run
+        self._selector.register(stdout_r, selectors.EVENT_READ, (run, "stdout"))
+        self._selector.register(stderr_r, selectors.EVENT_READ, (run, "stderr"))
+        self._send({"id": run.id, "pid": pid})
+
+    # --- Child output and exit --------------------------------------------
+
+    def _relay(self, run: _Run, stream: str, fd: int) -> None:
+        data = os.read(fd, _READ_SIZE)
+        if data:
+            self._send({"id": run.id, "stream": stream, "data": base64.b64encode(data).decode("ascii")})
+            return
+        self._selector.unregister(fd)
+        os.close(fd)
+        run.streams -= 1
+        self._finish(run)
+
+    def _reap(self) -> None:
+        while self._runs_by_pid:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            run = self._runs_by_pid.pop(pid, None)
+            if run is not None:
+                run.exit = _exit_code(status)
+                self._finish(run)
+
+    def _finish(self, run: _Run) -> None:
+        if run.exit is None or run.streams:
+            return
+        code, signal_name = run.exit
+        del self._runs[run.id]
+        self._send({"id": run.id, "exit": code, "signal": signal_name})
+
+    def _send(self, message: dict[str, Any]) -> None:
+        data = (json.dumps(message) + "\n").encode("utf-8")
+        while data:
+            written = os.write(sys.stdout.fileno(), data)
+            data = data[written:]
+
+    # --- Child side -------------------------------------------------------
+
+    def _become_child(self, request: dict[str, Any], stdout_w: int, stderr_w: int) -> None:
+        """Turn the forked process into the script run; never returns."""
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+        # Standard streams: /dev/null, then the pipes the server relays.
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(stdout_w, 1)
+        os.dup2(stderr_w, 2)
+        os.closerange(3, os.sysconf("SC_OPEN_MAX") if hasattr(os, "sysconf") else 1024)
+
+        env: dict[str, str] = request.get("env") or {}
+        os.environ.clear()
+        os.environ.update(env)
+        os.chdir(request.get("cwd") or os.path.dirname(request["script"]))
+
+        encoding = sys.stdout.encoding
+        unbuffered = bool(env.get("PYTHONUNBUFFERED"))
+        sys.stdin = open(0, encoding=encoding, closefd=False)  # noqa: SIM115
+        sys.stdout = open(1, "w", encoding=encoding, errors=sys.stdout.errors, closefd=False)  # noqa: SIM115
+        sys.stdout.reconfigure(write_through=unbuffered)
+        sys.stderr = open(2, "w", encoding=encoding, errors="backslashreplace", closefd=False, buffering=1)  # noqa: SIM115
+
+        script = request["script"]
+        python_path = [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+        sys.argv = [script, *request.get("args", [])]
+        sys.path[:] = [os.path.dirname(script), *python_path, *self._base_path]
+        sys.dont_write_bytecode = bool(env.get("PYTHONDONTWRITEBYTECODE"))
+        sys.pycache_prefix = env.get("PYTHONPYCACHEPREFIX") or None
+        for name in list(sys.modules):
+            if name.split(".")[0] in BRIDGE_MODULES:
+                del sys.modules[name]
+
+        os._exit(_run_script(script))
+
+
+def _run_script(script: str) -> int:
+    """Run *script* as ``__main__`` and return the exit code the interpreter would."""
+    if not os.path.isfile(script):
+        print(f"{sys.executable}: can't open file {script!r}: [Errno 2] No such file or directory", file=sys.stderr)
+        return 2
+    code = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException as e:  # Like the interpreter's top-level handler.
+        # Hide the server and runpy frames, as in a direct run.
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename != script:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb)
+        code = 1
+    # Interpreter shutdown: wait for non-daemon threads, run atexit handlers.
+    for thread in threading.enumerate():
+        if thread is not threading.main_thread() and not thread.daemon:
+            thread.join()
+    atexit._run_exitfuncs()
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(Exception):  # The pipe may be closed.
+            stream.flush()
+    return code
+
+
+if __name__ == "__main__":
+    _preload()
+    ForkServer().serve()
@@ -3,13 +3,16 @@
 YAML frontmatter property management methods.
 
 This mixin provides ``manage_properties_key`` and
-``manage_properties_value`` for manipulating frontmatter keys and values
-directly at the file level.  It requires **PyYAML** to be installed.
-
-The two public methods share a lot of internal logic (reading/parsing the
-frontmatter, reconstructing the note content, saving).  This has been
-DRY-ed into three private helpers so that each method focuses purely on
-its *action* semantics.
+``manage_properties_value`` for manipulating frontmatter keys and values,
+plus ``process_frontmatter`` / ``process_frontmatter_batch`` for sending
+raw property operations for one or many notes in a single request.
+
+With ``use_vault_modify=True`` (the default) the operations are applied by
+the plugin through Obsidian's ``fileManager.processFrontMatter``: only the
+operation list travels over the wire.  With ``use_vault_modify=False`` the
+file is edited directly on disk, which requires **PyYAML**; that path
+shares its read/parse/reconstruct/save logic through three private
+helpers so that each method focuses purely on its *action* semantics.
 """
 
 from __future__ import annotations
@@ -105,39 +108,40 @@ def _reconstruct_note(frontmatter: dict[str, Any] | None, main_content: str) ->
     return f"---\n{yaml_str}\n---{separator}{main_content}"
 
 
-def _save_note(
-    file_path: str,
-    updated_content: str,
-    *,
-    use_vault_modify: bool,
-    modify_fn: Any,
-) -> dict[str, Any]:
-    """Persist note content either via the Obsidian API or direct write.
+def _save_note(file_path: str, updated_content: str) -> dict[str, Any]:
+    """Write note content directly to disk (``use_vault_modify=False``).
 
     Args:
         file_path: Absolute path to the note.
         updated_content: The full file content to write.
-        use_vault_modify: If ``True``, use the Obsidian HTTP API;
-                          otherwise write directly to disk (risky).
-        modify_fn: The bound ``modify_note_content`` method on the client
-                   instance, used when *use_vault_modify* is ``True``.
 
     Returns:
         ``{"success": True}`` on success, or
         ``{"success": False, "error": "..."}`` on failure.
     """
-    if use_vault_modify:
-        try:
-            modify_fn(file_path, updated_content)
-        except ObsidianCommError as e:
-            return {"success": False, "error": f"Obsidian API error during save: {e}"}
-    else:
-        try:
-            with open(file_path, "w", encoding="utf-8") as fh:
-                fh.write(updated_content)
-        except OSError as e:
-            return {"success": False, "error": f"Direct file write failed: {e}"}
+    try:
+        with open(file_path, "w", encoding="utf-8") as fh:
+            fh.write(updated_content)
+    except OSError as e:
+        return {"success": False, "error": f"Direct file write failed: {e}"}
+
+    return {"success": True}
+
 
+def _plugin_result_to_dict(result: dict[str, Any]) -> dict[str, Any]:
+    """Convert a per-file ``process_frontmatter`` result to the helper result format.
+
+    Args:
+        result: One entry of the plugin's ``process_frontmatter`` response.
+
+    Returns:
+        ``{"success": True}``, ``{"success": True, "message": "No changes needed."}``
+        or ``{"success": False, "error": "..."}``.
+    """
+    if not result.get("success"):
+        return {"success": False, "error": result.get("error", "Unknown error.")}
+    if not result.get("changed"):
+        return {"success": True, "message": "No changes needed."}
     return {"success": True}
 
 
@@ -149,9 +153,72 @@ def _save_note(
 class FrontmatterMixin:
     """Mixin: YAML frontmatter key and value management.
 
-    Requires the host class to expose ``modify_note_content(file_path, content)``.
+    Requires the host class to expose ``_send_receive(action, payload)``.
     """
 
+    # ------------------------------------------------------------------
+    # Server-side operations
+    # ------------------------------------------------------------------
+
+    def process_frontmatter(self, path: str, ops: list[dict[str, Any]]) -> dict[str, Any]:  # type: ignore[misc]
+        """Apply property operations to one note through Obsidian.
+
+        See :meth:`process_frontmatter_batch` for the operation format.
+
+        Args:
+            path: Vault-relative path of the note.
+            ops: The operations to apply, in order.
+
+        Returns:
+            ``{"path", "success", "changed"}`` plus ``"error"`` on failure.
+
+        Raises:
+            ObsidianCommError: If the request fails.
+        """
+        return self.process_frontmatter_batch({path: ops})[0]
+
+    def process_frontmatter_batch(  # type: ignore[misc]
+        self,
+        files: dict[str, list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Apply property operations to many notes in a single request.
+
+        Each operation is a dict with an ``"op"`` and a ``"key"``:
+
+        * ``{"op": "add_key", "key": k}`` / ``{"op": "remove_key", "key": k}``
+        * ``{"op": "rename_key", "key": k, "new_key": k2}``
+        * ``{"op": "add_value", "key": k, "value": v}`` — append to a list
+          (or set a missing/null key)
+        * ``{"op": "remove_value", "key": k, "value": v}``
+        * ``{"op": "update_value", "key": k, "new_value": v2}`` — for lists,
+          also pass ``"index"`` or the old ``"value"``
+
+        The plugin applies each note's operations atomically with
+        ``fileManager.processFrontMatter``; a failing note is left untouched
+        and does not stop the rest of the batch.
+
+        Args:
+            files: Mapping of vault-relative note path to its operation list.
+
+        Returns:
+            One ``{"path", "success", "changed"[, "error"]}`` dict per note,
+            in the order of *files*.
+
+        Raises:
+            ValueError: If *files* is empty.
+            ObsidianCommError: If the request fails.
+        """
+        if not files:
+            raise ValueError("files cannot be empty.")
+        payload = {"files": [{"path": path, "ops": ops} for path, ops in files.items()]}
+        return self._send_receive("process_frontmatter", payload)  # type: ignore[attr-defined]
+
+    def _process_frontmatter_abs(self, file_path: str, op: dict[str, Any]) -> dict[str, Any]:
+        """Apply one operation to a note given by absolute path; helper result format."""
+        payload = {"files": [{"filePath": file_path, "ops": [op]}]}
+        results = self._send_receive("process_frontmatter", payload)  # type: ignore[attr-defined]
+        return _plugin_result_to_dict(results[0])
+
     # ------------------------------------------------------------------
     # Key-level management
     # ------------------------------------------------------------------
@@ -171,7 +238,8 @@ class FrontmatterMixin:
             action: ``'add'``, ``'remove'``, or ``'rename'``.
             key: Key to act upon (required).
             new_key: New key name for ``'rename'``.
-            use_vault_modify: Use Obsidian API (``True``) or direct write.
+            use_vault_modify: Apply via Obsidian's ``processFrontMatter`` (``True``)
+                or edit the file directly on disk (``False``, needs PyYAML).
 
         Returns:
             ``{'success': True}`` or ``{'success': False, 'error': '...'}``.
@@ -190,6 +258,15 @@ class FrontmatterMixin:
         if action == "rename" and not new_key:
             return {"success": False, "error": "'new_key' argument is required for 'rename'."}
 
+        if use_vault_modify:
+            op: dict[str, Any] = {"op": f"{action}_key", "key": key}
+            if action == "rename":
+                op["new_key"] = new_key
+            try:
+                return self._process_frontmatter_abs(file_path, op)
+            except ObsidianCommError as e:
+                return {"success": False, "error": f"Obsidian API error during save: {e}"}
+
         try:
             allow_create = action == "add"
             fm = _read_and_parse_frontmatter(file_path, allow_create=allow_create)
@@ -235,12 +312,7 @@ class FrontmatterMixin:
                 return {"success": True, "message": "No changes needed."}
 
             updated_content = _reconstruct_note(frontmatter, main_content)
-            return _save_note(
-                file_path,
-                updated_content,
-                use_vault_modify=use_vault_modify,
-                modify_fn=self.modify_note_content,  # type: ignore[attr-defined]
-            )
+            return _save_note(file_path, updated_content)
 
         except NameError as e:
             return {"success": False, "error": str(e)}
@@ -278,7 +350,8 @@ class FrontmatterMixin:
             value: Value to add/remove, or old value for list update.
             new_value: New value for ``'update'``.
             index: Index for list update.
-            use_vault_modify: Use Obsidian API (``True``) or direct write.
+            use_vault_modify: Apply via Obsidian's ``processFrontMatter`` (``True``)
+                or edit the file directly on disk (``False``, needs PyYAML).
 
         Returns:
             ``{'success': True}`` or ``{'success': False, 'error': '...'}``.
@@ -293,6 +366,13 @@ class FrontmatterMixin:
         if action not in ("add", "remove", "update"):
             return {"success": False, "error": f"Invalid action '{action}'. Must be 'add', 'remove', or 'update'."}
 
+        if use_vault_modify:
+            op = {"op": f"{action}_value", "key": key, "value": value, "new_value": new_value, "index": index}
+            try:
+                return self._process_frontmatter_abs(file_path, op)
+            except ObsidianCommError as e:
+                return {"success": False, "error": f"Obsidian API error during save: {e}"}
+
         try:
             allow_create = action == "add"
             fm = _read_and_parse_frontmatter(file_path, allow_create=allow_create)
@@ -380,12 +460,7 @@ class FrontmatterMixin:
                 return {"success": True, "message": "No changes needed."}
 
             updated_content = _reconstruct_note(frontmatter, main_content)
-            return _save_note(
-                file_path,
-                updated_content,
-                use_vault_modify=use_vault_modify,
-                modify_fn=self.modify_note_content,  # type: ignore[attr-defined]
-            )
+            return _save_note(file_path, updated_content)
 
         except NameError as e:
             return {"success": False, "error": str(e)}
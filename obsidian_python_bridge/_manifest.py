@@ -0,0 +1,65 @@
+# --- obsidian_python_bridge/_manifest.py ---
+"""
+Change detection against a locally stored manifest of note hashes.
+
+``get_note_hashes`` returns ``{path: {"hash", "mtime", "size"}}`` computed
+(and cached) by the plugin.  Scripts that export or index notes can keep
+the ``{path: hash}`` manifest from their previous run and use
+:func:`diff_manifest` to fetch only the notes that actually changed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+
+class ManifestDiff(NamedTuple):
+    """Difference between a stored manifest and the current note hashes."""
+
+    added: list[str]
+    """Paths present now but not in the stored manifest."""
+    modified: list[str]
+    """Paths whose content hash changed."""
+    removed: list[str]
+    """Paths in the stored manifest that no longer exist."""
+    manifest: dict[str, str]
+    """The current ``{path: hash}`` manifest, to store for the next run."""
+
+    @property
+    def changed(self) -> list[str]:
+        """Paths to (re)process: ``added + modified``."""
+        return self.added + self.modified
+
+
+def diff_manifest(
+    previous: dict[str, Any],
+    current: dict[str, dict[str, Any] | None],
+    paths: list[str] | None = None,
+) -> ManifestDiff:
+    """Compare a stored manifest with the result of ``get_note_hashes``.
+
+    Args:
+        previous: The stored manifest, ``{path: hash}`` (entries of the
+            ``{path: {"hash": ...}}`` form returned by ``get_note_hashes``
+            are accepted too).
+        current: The result of ``get_note_hashes``.
+        paths: The paths that were queried, or ``None`` if all notes were.
+            Only these paths can be reported as removed.
+
+    Returns:
+        A :class:`ManifestDiff`; lists are sorted.
+    """
+    manifest = {path: info["hash"] for path, info in current.items() if info is not None}
+    added: list[str] = []
+    modified: list[str] = []
+    for path, digest in manifest.items():
+        old = previous.get(path)
+        if isinstance(old, dict):
+            old = old.get("hash")
+        if old is None:
+            added.append(path)
+        elif old != digest:
+            modified.append(path)
+    candidates = previous.keys() if paths is None else paths
+    removed = [path for path in candidates if path in previous and path not in manifest]
+    return ManifestDiff(sorted(added), sorted(modified), sorted(removed), manifest)
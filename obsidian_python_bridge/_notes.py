@@ -13,7 +13,9 @@ import os
 import sys
 from typing import Any
 
+from ._context import MISSING
 from ._exceptions import ObsidianCommError
+from ._patch import compute_patch_ops, content_hash, utf16_len
 
 
 class NotesMixin:
@@ -27,12 +29,17 @@ class NotesMixin:
     # Script settings
     # ------------------------------------------------------------------
 
-    def get_script_settings(self) -> dict[str, Any]:  # type: ignore[misc]
+    def get_script_settings(self, refresh: bool = False) -> dict[str, Any]:  # type: ignore[misc]
         """Retrieve the current user-configured values for this script's settings.
 
         The script's relative path is read from the
         ``OBSIDIAN_SCRIPT_RELATIVE_PATH`` environment variable that the
-        Obsidian plugin sets when spawning the script.
+        Obsidian plugin sets when spawning the script.  The values are
+        served from the spawn-time context snapshot unless *refresh* is
+        ``True``.
+
+        Args:
+            refresh: Re-read the values from Obsidian instead of the snapshot.
 
         Returns:
             A dict mapping setting keys to their current values.
@@ -49,6 +56,10 @@ class NotesMixin:
                 action="get_script_settings",
             )
 
+        cached = self._context_get("script_settings", refresh)  # type: ignore[attr-defined]
+        if cached is not MISSING and self._context_get("script_path") == self.script_relative_path:  # type: ignore[attr-defined]
+            return dict(cached)
+
         payload = {"scriptPath": self.script_relative_path}  # type: ignore[attr-defined]
         settings_values = self._send_receive("get_script_settings", payload)  # type: ignore[attr-defined]
 
@@ -59,6 +70,7 @@ class NotesMixin:
                 file=sys.stderr,
             )
             return {}
+        self._context_put("script_settings", settings_values)  # type: ignore[attr-defined]
         return settings_values
 
     # ------------------------------------------------------------------
@@ -82,21 +94,55 @@ class NotesMixin:
             raise ValueError("return_format must be either 'string' or 'lines'.")
         return self._send_receive("get_active_note_content", {"return_format": return_format})  # type: ignore[attr-defined]
 
+    def get_active_note_snapshot(self, fields: list[str] | None = None) -> dict[str, Any]:  # type: ignore[misc]
+        """Read several properties of the active note in a single request.
+
+        All fields are read in one step on the plugin side, so they always
+        describe the same note and the same buffer state (no torn reads
+        between separate calls).  ``content`` is the live editor buffer,
+        including unsaved edits.
+
+        Args:
+            fields: Any of ``"content"``, ``"frontmatter"``,
+                ``"relative_path"``, ``"absolute_path"``, ``"title"``,
+                ``"editor_context"``, ``"selection"``.  Defaults to all.
+
+        Returns:
+            A dict with the requested fields plus ``"version"``, the SHA-256
+            of the buffer content (usable as ``base_hash`` for
+            :meth:`patch_note` once the buffer is saved).
+
+        Raises:
+            ObsidianCommError: If no Markdown note is active, a field name is
+                invalid, or the request fails.
+        """
+        payload = {"fields": list(fields)} if fields is not None else {}
+        return self._send_receive("get_active_note_snapshot", payload)  # type: ignore[attr-defined]
+
     def get_active_note_frontmatter(self) -> dict[str, Any] | None:  # type: ignore[misc]
         """Return the parsed YAML frontmatter of the active note, or ``None``."""
         return self._send_receive("get_active_note_frontmatter")  # type: ignore[attr-defined]
 
-    def get_active_note_absolute_path(self) -> str:  # type: ignore[misc]
-        """Return the absolute filesystem path of the active note."""
-        return self._send_receive("get_active_note_absolute_path")  # type: ignore[attr-defined]
+    def get_active_note_absolute_path(self, refresh: bool = False) -> str:  # type: ignore[misc]
+        """Return the absolute filesystem path of the active note.
+
+        Served from the spawn-time context snapshot unless *refresh* is ``True``.
+        """
+        return self._contextual("active_note_absolute_path", "get_active_note_absolute_path", refresh)  # type: ignore[attr-defined]
+
+    def get_active_note_relative_path(self, refresh: bool = False) -> str:  # type: ignore[misc]
+        """Return the vault-relative path of the active note.
+
+        Served from the spawn-time context snapshot unless *refresh* is ``True``.
+        """
+        return self._contextual("active_note_relative_path", "get_active_note_relative_path", refresh)  # type: ignore[attr-defined]
 
-    def get_active_note_relative_path(self) -> str:  # type: ignore[misc]
-        """Return the vault-relative path of the active note."""
-        return self._send_receive("get_active_note_relative_path")  # type: ignore[attr-defined]
+    def get_active_note_title(self, refresh: bool = False) -> str:  # type: ignore[misc]
+        """Return the title (filename without extension) of the active note.
 
-    def get_active_note_title(self) -> str:  # type: ignore[misc]
-        """Return the title (filename without extension) of the active note."""
-        return self._send_receive("get_active_note_title")  # type: ignore[attr-defined]
+        Served from the spawn-time context snapshot unless *refresh* is ``True``.
+        """
+        return self._contextual("active_note_title", "get_active_note_title", refresh)  # type: ignore[attr-defined]
 
     # ------------------------------------------------------------------
     # All notes
@@ -127,16 +173,23 @@ class NotesMixin:
     # ------------------------------------------------------------------
 
     def get_note_content(self, path: str) -> str:  # type: ignore[misc]
-        """Return the full content of a note by its vault-relative path."""
+        """Return the full content of a note by its vault-relative path.
+
+        Recently read notes are cached by version: a repeat read of an
+        unchanged note only transfers a "not modified" answer.
+        """
         if not path:
             raise ValueError("Path cannot be empty.")
-        return self._send_receive("get_note_content", {"path": path})  # type: ignore[attr-defined]
+        return self._send_conditional("get_note_content", path)  # type: ignore[attr-defined]
 
     def get_note_frontmatter(self, path: str) -> dict[str, Any] | None:  # type: ignore[misc]
-        """Return the parsed frontmatter of a note by its vault-relative path."""
+        """Return the parsed frontmatter of a note by its vault-relative path.
+
+        Uses the same version-checked read cache as :meth:`get_note_content`.
+        """
         if not path:
             raise ValueError("Path cannot be empty.")
-        return self._send_receive("get_note_frontmatter", {"path": path})  # type: ignore[attr-defined]
+        return self._send_conditional("get_note_frontmatter", path)  # type: ignore[attr-defined]
 
     def modify_note_content(self, file_path: str, content: str) -> None:  # type: ignore[misc]
         """Replace the entire content of a note using its absolute path.
@@ -152,6 +205,73 @@ class NotesMixin:
         self._send_receive("modify_note_content", {"filePath": file_path, "content": content})  # type: ignore[attr-defined]
         print(f"Note modification request sent for: {file_path}")
 
+    def patch_note(  # type: ignore[misc]
+        self,
+        path: str,
+        ops: list[dict[str, Any]] | str | None = None,
+        base_hash: str | None = None,
+        *,
+        old_text: str | None = None,
+        new_text: str | None = None,
+    ) -> dict[str, Any]:
+        """Apply a small edit to a note without re-uploading its full content.
+
+        The plugin applies the edit atomically (``vault.process``).  When
+        *base_hash* is given, the edit is rejected if the note no longer
+        matches that version, instead of silently overwriting concurrent
+        changes.
+
+        Either pass explicit edits via *ops*, or pass both *old_text* and
+        *new_text* and let the client compute the operations (line-level
+        diff).  In the latter case *base_hash* defaults to the hash of
+        *old_text*.
+
+        Args:
+            path: Vault-relative path of the note (e.g. ``"Logs/2024.md"``).
+            ops: A list of operations, each one of
+                ``{"op": "insert", "start", "text"}``,
+                ``{"op": "delete", "start", "end"}`` or
+                ``{"op": "replace", "start", "end", "text"}``, with offsets
+                into the current content in UTF-16 code units; or a unified
+                diff string (e.g. from ``difflib.unified_diff``).
+            base_hash: Expected SHA-256 of the current content
+                (see :func:`~obsidian_python_bridge.content_hash`).
+            old_text: The content the edit was made against.
+            new_text: The desired new content.
+
+        Returns:
+            ``{"applied": int, "hash": str, "length": int}`` — ``hash`` is the
+            new content hash, usable as *base_hash* for the next patch.
+
+        Raises:
+            ValueError: If the arguments are inconsistent.
+            ObsidianCommError: If the note is missing, the base hash does not
+                match (conflict), or the request fails.
+        """
+        if not path:
+            raise ValueError("Path cannot be empty.")
+        if (old_text is None) != (new_text is None):
+            raise ValueError("old_text and new_text must be given together.")
+        if old_text is not None and new_text is not None:
+            if ops is not None:
+                raise ValueError("Pass either ops or old_text/new_text, not both.")
+            ops = compute_patch_ops(old_text, new_text)
+            if base_hash is None:
+                base_hash = content_hash(old_text)
+            if not ops:
+                return {"applied": 0, "hash": content_hash(new_text), "length": utf16_len(new_text)}
+        if ops is None:
+            raise ValueError("Either ops or old_text/new_text is required.")
+
+        payload: dict[str, Any] = {"path": path}
+        if isinstance(ops, str):
+            payload["diff"] = ops
+        else:
+            payload["ops"] = ops
+        if base_hash is not None:
+            payload["base_hash"] = base_hash
+        return self._send_receive("patch_note", payload)  # type: ignore[attr-defined]
+
     def open_note(self, path: str, new_leaf: bool = False) -> None:  # type: ignore[misc]
         """Open a note in Obsidian using its vault-relative link path.
 
@@ -0,0 +1,256 @@
+# --- obsidian_python_bridge/_parallel.py ---
+"""
+Concurrent processing of notes with a thread pool or a process pool.
+
+The client can be shared between threads: the ``requests`` session's
+connection pool is sized for ``max_connections`` parallel requests, the read
+cache is locked, and identical read requests in flight at the same time are
+sent once (see :mod:`~obsidian_python_bridge._single_flight`).  This mixin
+offers the common case — run a function over many notes — without writing
+the executor code: :meth:`ParallelMixin.map_notes` for I/O-bound work, and
+:meth:`ParallelMixin.vault_map` for CPU-bound work, spread over processes
+that read the notes themselves.
+
+``multiprocessing`` and ``concurrent.futures`` are imported where they are
+used: the client imports this module, and importing it must stay cheap for
+scripts that never call these methods (settings discovery in particular).
+"""
+
+from __future__ import annotations
+
+import os
+import traceback
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+class VaultMapResult(NamedTuple):
+    """Outcome of :meth:`ParallelMixin.vault_map` for one note."""
+
+    path: str
+    """Vault-relative path of the note."""
+    value: Any
+    """What the function returned (``None`` if it failed)."""
+    error: BaseException | None
+    """The exception raised while reading or processing the note, if any."""
+    traceback: str | None
+    """The formatted traceback of *error*, from the worker process."""
+
+    @property
+    def ok(self) -> bool:
+        """``True`` if the note was processed without error."""
+        return self.error is None
+
+
+# ---------------------------------------------------------------------------
+# vault_map worker processes
+# ---------------------------------------------------------------------------
+
+#: Per-process state set by _init_worker: the function and how to read notes.
+_worker: dict[str, Any] = {}
+
+
+def _picklable(error: BaseException) -> BaseException:
+    """Return *error*, or a RuntimeError describing it if it cannot be pickled."""
+    import pickle
+
+    try:
+        pickle.dumps(error)
+    except Exception:
+        # Sent back to the parent process, so it must be picklable.
+        return RuntimeError(f"{type(error).__name__}: {error}")
+    return error
+
+
+def _init_worker(fn: Callable[[str, str], Any], source: str, vault_path: str, client_options: dict[str, Any]) -> None:
+    """Pool initializer: keep the function and a note reader for this process.
+
+    Never raises: a worker whose initializer fails is replaced by the pool,
+    endlessly.  A failure (e.g. the client's connection test) is kept and
+    reported as the error of every note this worker gets.
+    """
+    _worker["fn"] = fn
+    _worker["init_error"] = None
+    if source == "client":
+        # One pooled client per process, connection-tested once.
+        from ._client import ObsidianPluginDevPythonToJS
+
+        try:
+            _worker["read"] = ObsidianPluginDevPythonToJS(**client_options).get_note_content
+        except Exception as e:
+            _worker["init_error"] = (_picklable(e), traceback.format_exc())
+    else:
+
+        def _read_from_disk(path: str) -> str:
+            with open(os.path.join(vault_path, path), encoding="utf-8") as f:
+                return f.read()
+
+        _worker["read"] = _read_from_disk
+
+
+def _process_note(path: str) -> VaultMapResult:
+    """Read and process one note in a worker; failures are returned, not raised."""
+    if _worker["init_error"] is not None:
+        error, formatted_traceback = _worker["init_error"]
+        return VaultMapResult(path, None, error, formatted_traceback)
+    try:
+        return VaultMapResult(path, _worker["fn"](path, _worker["read"](path)), None, None)
+    except Exception as e:
+        return VaultMapResult(path, None, _picklable(e), traceback.format_exc())
+
+
+def _run_pool(
+    paths: list[str],
+    processes: int,
+    chunksize: int,
+    initargs: tuple[Any, ...],
+) -> Iterator[VaultMapResult]:
+    """Yield the results of a vault_map run; the pool stops when closed."""
+    import multiprocessing
+
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+        yield from pool.imap_unordered(_process_note, paths, chunksize)
+
+
+class ParallelMixin:
+    """Mixin: concurrent per-note processing.
+
+    Requires the host class to expose ``get_all_note_paths``,
+    ``get_note_content``, ``iter_files``, ``get_current_vault_absolute_path``
+    and its connection options (``http_port``, timeouts, ``max_connections``).
+    """
+
+    def map_notes(  # type: ignore[misc]
+        self,
+        fn: Callable[..., Any],
+        paths: Iterable[str] | None = None,
+        workers: int | None = None,
+        *,
+        with_content: bool = True,
+    ) -> list[Any]:
+        """Call *fn* for each note from a pool of threads.
+
+        Suited to I/O-bound work (requests to Obsidian, network, disk): the
+        threads share this client, so *fn* can call its methods too.  For
+        CPU-heavy analysis, threads are limited by the GIL.
+
+        Args:
+            fn: Called as ``fn(path, content)``, or ``fn(path)`` when
+                *with_content* is ``False``.
+            paths: Vault-relative note paths.  Defaults to all notes.
+            workers: Number of threads.  Defaults to the client's
+                ``max_connections``; more threads than connections only
+                wait for a free connection.
+            with_content: Read each note's content (in the worker thread)
+                and pass it to *fn*.
+
+        Returns:
+            The results of *fn*, in the order of *paths*.
+
+        Raises:
+            ValueError: If *workers* is less than 1.
+            Exception: The first exception raised by *fn* or by a read, in
+                the order of *paths*.  Pending calls are cancelled.
+        """
+        if workers is None:
+            workers = self.max_connections  # type: ignore[attr-defined]
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        note_paths = list(paths) if paths is not None else self.get_all_note_paths()  # type: ignore[attr-defined]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _call(path: str) -> Any:
+            if with_content:
+                return fn(path, self.get_note_content(path))  # type: ignore[attr-defined]
+            return fn(path)
+
+        with ThreadPoolExecutor(max_workers=min(workers, max(len(note_paths), 1))) as executor:
+            futures = [executor.submit(_call, path) for path in note_paths]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def vault_map(  # type: ignore[misc]
+        self,
+        fn: Callable[[str, str], Any],
+        paths_or_glob: Iterable[str] | str | None = None,
+        processes: int | None = None,
+        chunksize: int | None = None,
+        *,
+        source: str = "disk",
+    ) -> Iterator[VaultMapResult]:
+        """Run ``fn(path, content)`` over notes in a pool of processes.
+
+        Suited to CPU-heavy analysis, which threads cannot spread over
+        cores.  Each worker process reads the notes it processes, so note
+        contents are not sent through this process.  Results are yielded
+        as they complete; a note whose read or *fn* call fails yields a
+        result with ``error`` set, and the run goes on (with
+        ``source="client"``, a worker that cannot connect reports that error
+        for each of its notes).
+
+        *fn* is sent to the workers, so it must be picklable: a function
+        defined at module level (not a lambda).  Where processes are
+        spawned rather than forked (Windows, macOS), the script's main code
+        must be under ``if __name__ == "__main__":``.
+
+        Args:
+            fn: Called as ``fn(path, content)`` in a worker process.  Its
+                return value must be picklable.
+            paths_or_glob: Vault-relative note paths, or a glob matched by
+                the plugin (e.g. ``"Journal/**/*.md"``, Markdown notes
+                only).  Defaults to all notes.
+            processes: Number of worker processes.  Defaults to the number
+                of CPUs.
+            chunksize: Notes handed to a worker at a time.  Defaults to
+                about four chunks per process; larger chunks cost less
+                overhead but yield results in bigger batches.
+            source: ``"disk"`` to read the note files directly from the
+                vault folder (fastest; unsaved editor changes are not
+                seen), or ``"client"`` to read them through one client per
+                worker process.
+
+        Returns:
+            An iterator of one :class:`VaultMapResult` per note, in
+            completion order.  Closing it early (e.g. ``break`` out of a
+            ``for`` loop, then drop it) terminates the workers.
+
+        Raises:
+            ValueError: If *source* is unknown or *processes* / *chunksize*
+                is less than 1.
+            ObsidianCommError: If listing the notes fails.
+        """
+        if source not in ("disk", "client"):
+            raise ValueError("source must be either 'disk' or 'client'.")
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError("processes must be at least 1.")
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be at least 1.")
+
+        if paths_or_glob is None:
+            paths = self.get_all_note_paths()  # type: ignore[attr-defined]
+        elif isinstance(paths_or_glob, str):
+            paths = [f["path"] for f in self.iter_files(glob=paths_or_glob, extensions=["md"])]  # type: ignore[attr-defined]
+        else:
+            paths = list(paths_or_glob)
+        if not paths:
+            return iter(())
+        if chunksize is None:
+            chunksize = max(1, -(-len(paths) // (processes * 4)))
+
+        vault_path = self.get_current_vault_absolute_path() if source == "disk" else ""  # type: ignore[attr-defined]
+        client_options = {
+            "http_port": self.http_port,  # type: ignore[attr-defined]
+            "connect_timeout": self.connect_timeout,  # type: ignore[attr-defined]
+            "request_timeout": self.request_timeout,  # type: ignore[attr-defined]
+            "max_connections": 1,
+        }
+        return _run_pool(paths, min(processes, len(paths)), chunksize, (fn, source, vault_path, client_options))
@@ -0,0 +1,84 @@
+# --- obsidian_python_bridge/_patch.py ---
+"""
+Helpers for diff-based note writes.
+
+:func:`content_hash` produces the version token the plugin uses to detect
+conflicting edits, and :func:`compute_patch_ops` turns an old/new pair of
+note contents into the compact edit operations understood by the plugin's
+``patch_note`` action.
+
+Offsets in the operations are expressed in **UTF-16 code units**, the unit
+JavaScript strings are indexed by, so that they line up with the note
+content as seen by the plugin even for text outside the Basic
+Multilingual Plane (emoji, some CJK characters, ...).
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+from typing import Any
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of *content* encoded as UTF-8.
+
+    This matches the hash computed by the plugin, so it can be passed as
+    ``base_hash`` to detect whether a note changed since it was read.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def utf16_len(text: str) -> int:
+    """Return the length of *text* in UTF-16 code units."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def compute_patch_ops(old_text: str, new_text: str) -> list[dict[str, Any]]:
+    """Compute line-level edit operations transforming *old_text* into *new_text*.
+
+    Args:
+        old_text: The note content the operations apply to.
+        new_text: The desired note content.
+
+    Returns:
+        A list of ``{"op": "insert" | "delete" | "replace", "start", "end", "text"}``
+        dicts with offsets into *old_text* (UTF-16 code units).  Empty if
+        both texts are equal.
+    """
+    old_lines = old_text.splitlines(keepends=True)
+    new_lines = new_text.splitlines(keepends=True)
+
+    # Strip the common prefix/suffix first: typical edits (appending to a
+    # log, changing one line) touch a small region, and SequenceMatcher is
+    # far slower than a linear scan on large inputs.
+    prefix = 0
+    limit = min(len(old_lines), len(new_lines))
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    old_middle = old_lines[prefix : len(old_lines) - suffix]
+    new_middle = new_lines[prefix : len(new_lines) - suffix]
+
+    # Offset of the start of each changed old line (plus the end of the region).
+    offsets = [utf16_len("".join(old_lines[:prefix]))]
+    for line in old_middle:
+        offsets.append(offsets[-1] + utf16_len(line))
+
+    ops: list[dict[str, Any]] = []
+    matcher = difflib.SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        start, end = offsets[i1], offsets[i2]
+        text = "".join(new_middle[j1:j2])
+        if tag == "insert":
+            ops.append({"op": "insert", "start": start, "text": text})
+        elif tag == "delete":
+            ops.append({"op": "delete", "start": start, "end": end})
+        else:
+            ops.append({"op": "replace", "start": start, "end": end, "text": text})
+    return ops
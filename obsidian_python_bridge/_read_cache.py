@@ -0,0 +1,68 @@
+# --- obsidian_python_bridge/_read_cache.py ---
+"""
+Client-side cache for version-checked reads.
+
+``get_note_content`` and ``get_note_frontmatter`` send the version of the
+copy the client already holds as ``known_version``.  When the note has not
+changed, the plugin answers ``{"version", "not_modified": true}`` — a few
+bytes — and the cached value is returned instead of transferring the
+result again.
+
+:class:`ReadCache` is a small LRU map from ``(action, path)`` to
+``(version, value)``; it never serves a value without the plugin
+confirming it is current.  It is safe to share between threads.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+class ReadCache:
+    """Bounded LRU cache of ``(version, value)`` pairs for conditional reads."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def version(self, key: tuple[str, str]) -> str | None:
+        """Return the cached version for *key*, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def resolve(self, key: tuple[str, str], result: dict[str, Any]) -> Any:
+        """Turn a conditional-read response into the value to return.
+
+        Stores fresh values and marks hits as recently used.  Mutable
+        values (e.g. frontmatter dicts) are returned as copies so that
+        callers cannot alter the cached entry.
+
+        Raises:
+            KeyError: If the plugin reports "not modified" for an entry
+                that is no longer cached.
+        """
+        with self._lock:
+            if result.get("not_modified"):
+                self._entries.move_to_end(key)
+                value = self._entries[key][1]
+            else:
+                value = result.get("value")
+                if self.max_entries > 0:
+                    self._entries[key] = (result["version"], value)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
@@ -12,7 +12,6 @@ the registered definitions as JSON to stdout, and exits.
 
 from __future__ import annotations
 
-import argparse
 import json
 import os
 import sys
@@ -23,6 +22,7 @@ from typing import Any
 # ---------------------------------------------------------------------------
 
 _script_settings_definitions: list[dict[str, Any]] = []
+_script_run_after: list[str] = []
 
 
 # ---------------------------------------------------------------------------
@@ -30,7 +30,7 @@ _script_settings_definitions: list[dict[str, Any]] = []
 # ---------------------------------------------------------------------------
 
 
-def define_settings(settings_list: list[dict[str, Any]]) -> None:
+def define_settings(settings_list: list[dict[str, Any]], *, run_after: list[str] | None = None) -> None:
     """Register the settings definitions for the current script.
 
     Call this once at the top of your script, before :func:`_handle_cli_args`.
@@ -38,9 +38,14 @@ def define_settings(settings_list: list[dict[str, Any]]) -> None:
     Each element of *settings_list* is a ``dict`` with keys such as
     ``key``, ``type``, ``label``, ``description``, ``default``, and
     optionally ``options``, ``min``, ``max``, ``step``.
+
+    *run_after* lists scripts (paths relative to the scripts folder, e.g.
+    ``"fetch_data.py"``) that "Run all scripts" must finish before starting
+    this one when it runs scripts in parallel.
     """
-    global _script_settings_definitions
+    global _script_settings_definitions, _script_run_after
     _script_settings_definitions = settings_list
+    _script_run_after = list(run_after or [])
 
 
 def _handle_cli_args() -> None:
@@ -52,43 +57,43 @@ def _handle_cli_args() -> None:
 
     Must be called *after* :func:`define_settings`.
     """
-    parser = argparse.ArgumentParser(
-        description="Obsidian Python Bridge Script Runner Helper",
-    )
-    parser.add_argument(
-        "--get-settings-json",
-        action="store_true",
-        help="Print script settings definitions as JSON and exit.",
-    )
-    # parse_known_args avoids failures if Obsidian or the user passes extra args
-    args, _unknown = parser.parse_known_args()
-
-    # Re-read event env vars here (idempotent with _events module, but
+    # Fast path for the flag the plugin passes, so settings discovery does
+    # not import argparse (the parser is only needed for abbreviations/--help).
+    get_settings_json = "--get-settings-json" in sys.argv[1:]
+    if not get_settings_json:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            description="Obsidian Python Bridge Script Runner Helper",
+        )
+        parser.add_argument(
+            "--get-settings-json",
+            action="store_true",
+            help="Print script settings definitions as JSON and exit.",
+        )
+        # parse_known_args avoids failures if Obsidian or the user passes extra args
+        args, _unknown = parser.parse_known_args()
+        get_settings_json = args.get_settings_json
+
+    # Re-read the event name here (idempotent with _events module, but
     # kept for backward compatibility — the original monolith did this).
-    global _is_handling_event, _event_name, _event_payload
+    # The payload is parsed lazily, by _events.get_event_payload().
+    global _is_handling_event, _event_name
     _event_name = os.environ.get("OBSIDIAN_EVENT_NAME")
     if _event_name:
         _is_handling_event = True
-        payload_str = os.environ.get("OBSIDIAN_EVENT_PAYLOAD", "{}")
-        try:
-            _event_payload = json.loads(payload_str)
-        except json.JSONDecodeError:
-            print(
-                f"ERROR: Failed to parse event payload JSON for event '{_event_name}'. Payload: '{payload_str}'",
-                file=sys.stderr,
-            )
-            _event_payload = {
-                "error": "Failed to parse payload",
-                "raw_payload": payload_str,
-            }
-
-    if not args.get_settings_json:
+
+    if not get_settings_json:
         return
 
     # --- Settings discovery mode: output JSON and exit ---
     definitions_to_output = _script_settings_definitions if "_script_settings_definitions" in globals() else []
+    # Plain list unless there is metadata, which older plugin versions expect.
+    output: Any = definitions_to_output
+    if _script_run_after:
+        output = {"settings": definitions_to_output, "run_after": _script_run_after}
     try:
-        json_output = json.dumps(definitions_to_output)
+        json_output = json.dumps(output)
         print(json_output)
         sys.exit(0)
     except TypeError as e:
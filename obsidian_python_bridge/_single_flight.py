@@ -0,0 +1,91 @@
+# --- obsidian_python_bridge/_single_flight.py ---
+"""
+Single-flight deduplication of concurrent identical requests.
+
+When several threads share one client (e.g. through
+:meth:`~obsidian_python_bridge._parallel.ParallelMixin.map_notes`), they
+often ask for the same thing at the same time — ``get_all_note_paths``, or
+the content of a note every worker depends on.  :class:`SingleFlight` lets
+the first caller for a key perform the request while the others wait for
+its result, so the plugin answers it once.
+
+Nothing is cached: a call made after the request finished starts a new one.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+
+class _Call:
+    """One in-flight call and, once done, its outcome."""
+
+    __slots__ = ("copies", "done", "error", "followers", "value")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.followers = 0
+        self.value: Any = None
+        self.copies: list[Any] = []
+        self.error: BaseException | None = None
+
+    def result(self) -> Any:
+        """Return a follower's value: its own copy if the value is mutable."""
+        return self.copies.pop() if self.copies else self.value
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.shared = 0
+        """Number of calls answered by another caller's request."""
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, or the result of the in-flight call for *key*.
+
+        Waiting callers get the same exception if the call fails.  The first
+        caller gets the result itself; each waiting caller gets its own
+        copy of mutable results (dicts, lists), made before the first
+        caller returns, so that callers cannot alter each other's values.
+        Nothing is copied when nobody waited.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result()
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # No follower can join once the key is removed.
+            with self._lock:
+                del self._calls[key]
+            try:
+                if call.error is None and isinstance(call.value, (dict, list)):
+                    call.copies = [copy.deepcopy(call.value) for _ in range(call.followers)]
+            except Exception as e:
+                call.error = e  # Only the followers, who get no copy, fail.
+            finally:
+                call.done.set()
+        return call.value
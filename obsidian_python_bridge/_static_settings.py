@@ -0,0 +1,175 @@
+# --- obsidian_python_bridge/_static_settings.py ---
+"""
+Static settings discovery.
+
+Reads a script's settings definitions from its source, without running it,
+when they are given as a literal::
+
+    define_settings([{"key": "name", "type": "text", "label": "Name"}])
+    _handle_cli_args()
+
+(optionally with a literal ``run_after=[...]``).  The list may also be a
+module-level name assigned once to a literal and only used as the
+argument (not mutated, e.g. with ``.append()``).  Any other form (computed
+definitions, a call inside ``if``/``def``, several calls, ...) is reported
+as unknown and the plugin falls back to running the script with
+``--get-settings-json``.
+
+This module only uses the standard library and no relative imports: the
+plugin runs it directly by file path, once for a whole batch of scripts::
+
+    python _static_settings.py script_a.py script_b.py
+
+which prints ``{"script_a.py": [...], "script_b.py": null}`` (``null`` =
+unknown; values are what ``--get-settings-json`` would print) as JSON to
+stdout.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import sys
+from typing import Any
+
+
+def _is_call_to(node: ast.AST, name: str) -> bool:
+    """Whether *node* is a call of ``name(...)`` or ``<module>.name(...)``."""
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    return (isinstance(func, ast.Name) and func.id == name) or (isinstance(func, ast.Attribute) and func.attr == name)
+
+
+def _mentions(tree: ast.AST, name: str) -> int:
+    """Count the references to *name* (as a name or attribute) in *tree*."""
+    return sum(
+        1
+        for node in ast.walk(tree)
+        if (isinstance(node, ast.Name) and node.id == name) or (isinstance(node, ast.Attribute) and node.attr == name)
+    )
+
+
+def _literal_value(module: ast.Module, arg: ast.expr, before: int) -> Any:
+    """Evaluate an argument of a ``define_settings`` call.
+
+    Raises:
+        ValueError: If the argument is not a literal (or a name bound once,
+            before the call, to a literal and referenced nowhere else).
+    """
+    if not isinstance(arg, ast.Name):
+        return ast.literal_eval(arg)
+
+    # A name: accept a single module-level assignment that precedes the call,
+    # and no other reference, since any use (S.append(...), S[0]["x"] = ...,
+    # passing S to a function) may change the value before the call.
+    references = [node for node in ast.walk(module) if isinstance(node, ast.Name) and node.id == arg.id]
+    stores = [node for node in references if not isinstance(node.ctx, ast.Load)]
+    if len(stores) != 1 or len(references) != 2:
+        raise ValueError(f"'{arg.id}' is not only bound once and passed to define_settings")
+    for statement in module.body[:before]:
+        if isinstance(statement, ast.Assign):
+            targets, value = statement.targets, statement.value
+        elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+            targets, value = [statement.target], statement.value
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == arg.id for t in targets):
+            if len(targets) != 1:
+                raise ValueError(f"'{arg.id}' is part of a chained assignment")
+            return ast.literal_eval(value)
+    raise ValueError(f"'{arg.id}' is not assigned at module level before the call")
+
+
+def extract_settings(source: str | bytes) -> list[dict[str, Any]] | dict[str, Any] | None:
+    """Return the settings declared literally in *source*.
+
+    Args:
+        source: The script's source code.
+
+    Returns:
+        What the script would print for ``--get-settings-json``: the
+        definitions list (empty if the script declares none), or
+        ``{"settings": [...], "run_after": [...]}`` if it passes
+        ``run_after``.  ``None`` if this cannot be determined without
+        running the script.
+    """
+    try:
+        module = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    # Both calls must run unconditionally at module level, in order.
+    handle_index = next(
+        (
+            i
+            for i, statement in enumerate(module.body)
+            if isinstance(statement, ast.Expr) and _is_call_to(statement.value, "_handle_cli_args")
+        ),
+        None,
+    )
+    if handle_index is None:
+        return None
+    define_calls = [
+        (i, statement.value)
+        for i, statement in enumerate(module.body[:handle_index])
+        if isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Call)
+        and _is_call_to(statement.value, "define_settings")
+    ]
+    # Imported under another name: calls would not be recognized.
+    if any(
+        alias.name == "define_settings" and alias.asname
+        for node in ast.walk(module)
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    ):
+        return None
+    # Any other reference (a nested or conditional call, an alias, ...)
+    # means the definitions cannot be known statically.
+    if _mentions(module, "define_settings") != len(define_calls):
+        return None
+    if not define_calls:
+        return []
+    if len(define_calls) != 1:
+        return None
+
+    index, call = define_calls[0]
+    settings_args = [*call.args, *(kw.value for kw in call.keywords if kw.arg == "settings_list")]
+    run_after_args = [kw.value for kw in call.keywords if kw.arg == "run_after"]
+    if len(settings_args) != 1 or len(call.args) + len(call.keywords) != 1 + len(run_after_args):
+        return None
+    try:
+        definitions = _literal_value(module, settings_args[0], index)
+        run_after = _literal_value(module, run_after_args[0], index) if run_after_args else None
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    if not isinstance(definitions, list) or not all(isinstance(d, dict) for d in definitions):
+        return None
+    if run_after is not None and (
+        not isinstance(run_after, (list, tuple)) or not all(isinstance(p, str) for p in run_after)
+    ):
+        return None
+    try:
+        json.dumps(definitions)  # Sets, bytes, ... are literals but not JSON.
+    except (TypeError, ValueError):
+        return None
+    if run_after:
+        return {"settings": definitions, "run_after": list(run_after)}
+    return definitions
+
+
+def main(paths: list[str]) -> None:
+    """Print the statically extracted settings of each script as JSON."""
+    results: dict[str, list[dict[str, Any]] | dict[str, Any] | None] = {}
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                results[path] = extract_settings(f.read())
+        except OSError:
+            results[path] = None
+    json.dump(results, sys.stdout)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
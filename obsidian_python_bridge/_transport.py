@@ -2,28 +2,37 @@
 """
 Low-level HTTP transport used by the Obsidian Python Bridge client.
 
-All communication with the companion Obsidian plugin goes through two
+All communication with the companion Obsidian plugin goes through the
 functions exposed here:
 
 * :func:`test_connection` — quick liveness check performed during
   :class:`~obsidian_python_bridge._client.ObsidianPluginDevPythonToJS.__init__`.
 * :func:`send_receive` — core request/response round-trip used by every
   public API method.
+* :func:`send_stream` — one long-lived request that streams many items to
+  a streaming action (e.g. incremental editor insertion).
+* :func:`send_binary` — raw ``application/octet-stream`` transfer of a
+  vault file's bytes (attachments), without JSON or base64 encoding.
 
-Both accept a ``requests.Session`` instance so that connection pooling is
+All of them accept a ``requests.Session`` instance so that connection pooling is
 shared across calls.
 """
 
 from __future__ import annotations
 
+import json
 import sys
 import traceback
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 import requests
 
 from ._exceptions import ObsidianCommError
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
 # ---------------------------------------------------------------------------
 # Connection test
 # ---------------------------------------------------------------------------
@@ -113,7 +122,7 @@ def send_receive(
 ) -> Any:
     """Send an action request to the Obsidian plugin and return the response data.
 
-    This is the single entry-point used by *every* public API method.
+    This is the entry-point used by almost every public API method.
 
     Args:
         session: A ``requests.Session`` for connection pooling.
@@ -130,7 +139,164 @@ def send_receive(
     Raises:
         ObsidianCommError: On any communication, HTTP, or plugin-level error.
     """
-    # Block API calls during settings discovery to prevent side-effects.
+    _check_execution_mode(action, execution_mode)
+
+    request_data: dict[str, Any] = {
+        "action": action,
+        "payload": payload if payload is not None else {},
+    }
+    return _post_action(session, base_url, action, timeout, json=request_data)
+
+
+def send_stream(
+    session: requests.Session,
+    base_url: str,
+    action: str,
+    payload: dict[str, Any] | None,
+    items: Iterable[dict[str, Any]],
+    timeout: float = 10.0,
+    *,
+    execution_mode: str = "normal",
+) -> Any:
+    """Stream a sequence of items to a streaming plugin action in one request.
+
+    The request body is newline-delimited JSON (``application/x-ndjson``)
+    sent with chunked transfer encoding: the first line is the usual
+    ``{"action", "payload"}`` header, and every following line is one
+    item.  The plugin applies the items in order while the body is still
+    arriving and pauses reading when it falls behind, so TCP flow control
+    throttles the producer instead of buffering unbounded data in Obsidian.
+
+    Args:
+        session: A ``requests.Session`` for connection pooling.
+        base_url: The plugin's HTTP root.
+        action: A streaming action identifier understood by the plugin.
+        payload: Optional dict of action-specific data (sent in the header line).
+        items: Iterable of JSON-serializable dicts, consumed lazily.
+        timeout: Timeout in seconds for connecting and for the final response.
+        execution_mode: ``"normal"`` or ``"discovery"``.
+
+    Returns:
+        The value of the ``"data"`` field from the plugin's JSON response,
+        sent once the whole stream has been applied.
+
+    Raises:
+        ObsidianCommError: On any communication, HTTP, or plugin-level error.
+    """
+    _check_execution_mode(action, execution_mode)
+
+    header = {"action": action, "payload": payload if payload is not None else {}}
+
+    def _body() -> Iterator[bytes]:
+        yield (json.dumps(header) + "\n").encode("utf-8")
+        for item in items:
+            yield (json.dumps(item) + "\n").encode("utf-8")
+
+    return _post_action(
+        session,
+        base_url,
+        action,
+        timeout,
+        data=_body(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+
+def send_binary(
+    session: requests.Session,
+    base_url: str,
+    action: str,
+    path: str,
+    data: bytes | bytearray | memoryview | None = None,
+    timeout: float = 10.0,
+    *,
+    into: Any = None,
+    headers: dict[str, str] | None = None,
+    execution_mode: str = "normal",
+) -> Any:
+    """Send a binary (``application/octet-stream``) request for one vault file.
+
+    The action and the vault-relative *path* travel in the
+    ``X-Obsidian-Action`` / ``X-Obsidian-Path`` headers and the file bytes
+    are the raw request body (``write_binary``) or response body
+    (``read_binary``).  Errors still come back as the usual JSON envelope.
+
+    Args:
+        session: A ``requests.Session`` for connection pooling.
+        base_url: The plugin's HTTP root.
+        action: ``"read_binary"`` or ``"write_binary"``.
+        path: Vault-relative path of the file.
+        data: The bytes to upload (``write_binary``).
+        timeout: Per-request timeout in seconds.
+        into: A writable buffer (``bytearray``, ``memoryview``, NumPy
+            array, ...) the downloaded bytes are read into directly.
+        headers: Additional request headers.
+        execution_mode: ``"normal"`` or ``"discovery"``.
+
+    Returns:
+        For a binary response: the bytes, or the number of bytes read when
+        *into* is given.  Otherwise the ``"data"`` field of the JSON response.
+
+    Raises:
+        ObsidianCommError: On any communication, HTTP, or plugin-level error,
+            or if *into* is too small for the file.
+    """
+    _check_execution_mode(action, execution_mode)
+
+    request_headers = {
+        "Content-Type": "application/octet-stream",
+        "X-Obsidian-Action": action,
+        "X-Obsidian-Path": quote(path, safe=""),
+        **(headers or {}),
+    }
+
+    def _read(response: requests.Response) -> Any:
+        if into is None:
+            return response.content
+        return _read_body_into(response, into, action)
+
+    return _post_action(
+        session,
+        base_url,
+        action,
+        timeout,
+        read_binary=_read,
+        data=data if data is not None else b"",
+        headers=request_headers,
+        stream=True,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared helpers
+# ---------------------------------------------------------------------------
+
+
+def _read_body_into(response: requests.Response, into: Any, action: str) -> int:
+    """Read a binary response body straight into the caller's buffer."""
+    size = int(response.headers.get("Content-Length", "-1"))
+    view = memoryview(into).cast("B")
+    if view.readonly:
+        raise ObsidianCommError("The 'into' buffer is read-only.", action=action)
+    if size < 0 or size > len(view):
+        raise ObsidianCommError(
+            f"The 'into' buffer ({len(view)} bytes) is too small for the file ({size} bytes).",
+            action=action,
+        )
+    received = 0
+    while received < size:
+        count = response.raw.readinto(view[received:size])
+        if not count:
+            raise ObsidianCommError(
+                f"Connection closed after {received} of {size} bytes.",
+                action=action,
+            )
+        received += count
+    return size
+
+
+def _check_execution_mode(action: str, execution_mode: str) -> None:
+    """Block API calls during settings discovery to prevent side-effects."""
     if execution_mode == "discovery":
         raise ObsidianCommError(
             "API calls are disabled during settings discovery mode. "
@@ -139,14 +305,34 @@ def send_receive(
             action=action,
         )
 
-    request_data: dict[str, Any] = {
-        "action": action,
-        "payload": payload if payload is not None else {},
-    }
+
+def _post_action(
+    session: requests.Session,
+    base_url: str,
+    action: str,
+    timeout: float,
+    *,
+    read_binary: Callable[[requests.Response], Any] | None = None,
+    **post_kwargs: Any,
+) -> Any:
+    """POST a request body to the plugin and unwrap its JSON response envelope.
+
+    *post_kwargs* are forwarded to ``session.post`` (``json=``, ``data=``,
+    ``headers=``, …).  Successful ``application/octet-stream`` responses
+    are passed to *read_binary* instead of being parsed as JSON.  Every
+    ``requests`` error is mapped to :class:`ObsidianCommError`.
+    """
     response_text = ""
 
     try:
-        response = session.post(base_url, json=request_data, timeout=timeout)
+        response = session.post(base_url, timeout=timeout, **post_kwargs)
+        if (
+            read_binary is not None
+            and response.ok
+            and response.headers.get("Content-Type") == "application/octet-stream"
+        ):
+            with response:
+                return read_binary(response)
         response_text = response.text
 
         # --- HTTP-level errors (4xx / 5xx) ---
@@ -221,7 +407,7 @@ def send_receive(
 
     except Exception as e:
         print(
-            f"ERROR: Unexpected error in send_receive: {e}\n{traceback.format_exc()}",
+            f"ERROR: Unexpected error while calling action '{action}': {e}\n{traceback.format_exc()}",
             file=sys.stderr,
         )
         raise ObsidianCommError(
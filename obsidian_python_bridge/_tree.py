@@ -0,0 +1,95 @@
+# --- obsidian_python_bridge/_tree.py ---
+"""
+Folder tree returned by ``list_tree``.
+
+The plugin sends a subtree in *parent-index* encoding: parallel lists of
+entry names, the index of each entry's parent folder (``-1`` for the
+listed folder itself) and a folder flag.  Parents always precede their
+children.
+
+:class:`VaultTree` keeps that compact form as-is and rebuilds full paths
+on demand while iterating, so only the paths of *folders* are ever held in
+memory at once — not one string per file.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class TreeEntry(NamedTuple):
+    """One file or folder of a :class:`VaultTree`."""
+
+    path: str
+    """Vault-relative path."""
+    name: str
+    """Base name, including the extension for files."""
+    is_folder: bool
+    depth: int
+    """1 for direct children of the listed folder, 2 for their children, ..."""
+
+
+class VaultTree:
+    """A folder subtree as returned by ``list_tree``.
+
+    Iterating yields :class:`TreeEntry` items in breadth-first order
+    (every folder before its contents).
+    """
+
+    __slots__ = ("_folders", "_names", "_parents", "root")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.root: str = data["root"]
+        self._names: list[str] = data["names"]
+        self._parents: list[int] = data["parents"]
+        self._folders: list[int] = data["folders"]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"VaultTree(root={self.root!r}, entries={len(self)})"
+
+    def __iter__(self) -> Iterator[TreeEntry]:
+        # Only folder paths/depths are remembered, keyed by entry index.
+        folder_paths: dict[int, str] = {-1: self.root}
+        folder_depths: dict[int, int] = {-1: 0}
+        entries = zip(self._names, self._parents, self._folders, strict=True)
+        for index, (name, parent, is_folder) in enumerate(entries):
+            parent_path = folder_paths[parent]
+            path = f"{parent_path}/{name}" if parent_path else name
+            depth = folder_depths[parent] + 1
+            if is_folder:
+                folder_paths[index] = path
+                folder_depths[index] = depth
+            yield TreeEntry(path, name, bool(is_folder), depth)
+
+    def files(self) -> Iterator[str]:
+        """Yield the vault-relative path of every file in the tree."""
+        return (entry.path for entry in self if not entry.is_folder)
+
+    def folders(self) -> Iterator[str]:
+        """Yield the vault-relative path of every folder in the tree."""
+        return (entry.path for entry in self if entry.is_folder)
+
+    def walk(self) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Yield ``(folder_path, subfolder_names, file_names)`` like :func:`os.walk`.
+
+        Folders are yielded top-down, starting with the listed folder itself.
+        """
+        contents: dict[int, tuple[list[str], list[str]]] = {-1: ([], [])}
+        order: list[tuple[int, str]] = [(-1, self.root)]
+        for index, entry in enumerate(self):
+            subfolders, files = contents[self._parents[index]]
+            if entry.is_folder:
+                subfolders.append(entry.name)
+                contents[index] = ([], [])
+                order.append((index, entry.path))
+            else:
+                files.append(entry.name)
+        for index, path in order:
+            subfolders, files = contents.pop(index)
+            yield path, subfolders, files
@@ -9,6 +9,15 @@ theme/language/tag information.
 
 from __future__ import annotations
 
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from ._manifest import ManifestDiff, diff_manifest
+from ._tree import VaultTree
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 class VaultMixin:
     """Mixin: vault info, file CRUD, folder ops, commands, theme, tags.
@@ -20,26 +29,64 @@ class VaultMixin:
     # Vault metadata
     # ------------------------------------------------------------------
 
-    def get_current_vault_absolute_path(self) -> str:  # type: ignore[misc]
-        """Return the absolute filesystem path of the current vault root."""
-        return self._send_receive("get_current_vault_absolute_path")  # type: ignore[attr-defined]
+    def get_current_vault_absolute_path(self, refresh: bool = False) -> str:  # type: ignore[misc]
+        """Return the absolute filesystem path of the current vault root.
+
+        Served from the spawn-time context snapshot unless *refresh* is ``True``.
+        """
+        return self._contextual("vault_path", "get_current_vault_absolute_path", refresh)  # type: ignore[attr-defined]
+
+    def get_obsidian_language(self, refresh: bool = False) -> str:  # type: ignore[misc]
+        """Return the language code configured in Obsidian (e.g. ``'en'``, ``'fr'``).
+
+        Served from the spawn-time context snapshot unless *refresh* is ``True``.
+        """
+        return self._contextual("language", "get_obsidian_language", refresh)  # type: ignore[attr-defined]
+
+    def get_vault_name(self, refresh: bool = False) -> str:  # type: ignore[misc]
+        """Return the name of the currently open vault.
 
-    def get_obsidian_language(self) -> str:  # type: ignore[misc]
-        """Return the language code configured in Obsidian (e.g. ``'en'``, ``'fr'``)."""
-        return self._send_receive("get_obsidian_language")  # type: ignore[attr-defined]
+        Served from the spawn-time context snapshot unless *refresh* is ``True``.
+        """
+        return self._contextual("vault_name", "get_vault_name", refresh)  # type: ignore[attr-defined]
 
-    def get_vault_name(self) -> str:  # type: ignore[misc]
-        """Return the name of the currently open vault."""
-        return self._send_receive("get_vault_name")  # type: ignore[attr-defined]
+    def get_theme_mode(self, refresh: bool = False) -> str:  # type: ignore[misc]
+        """Return the current theme mode (``'light'`` or ``'dark'``).
 
-    def get_theme_mode(self) -> str:  # type: ignore[misc]
-        """Return the current theme mode (``'light'`` or ``'dark'``)."""
-        return self._send_receive("get_theme_mode")  # type: ignore[attr-defined]
+        Served from the spawn-time context snapshot unless *refresh* is ``True``.
+        """
+        return self._contextual("theme_mode", "get_theme_mode", refresh)  # type: ignore[attr-defined]
 
     def get_all_tags(self) -> list[str]:  # type: ignore[misc]
         """Return a list of all unique tags in the vault (with ``#`` prefix)."""
         return self._send_receive("get_all_tags")  # type: ignore[attr-defined]
 
+    def get_tag_index(self, prefix: str | None = None) -> dict[str, dict[str, Any]]:  # type: ignore[misc]
+        """Return every tag with the notes using it, in one request.
+
+        The index is built by the plugin from Obsidian's metadata cache
+        (frontmatter and inline tags) and cached until metadata changes.
+        Nested tags are aggregated into their parents: ``#a/b`` counts
+        towards the totals of ``#a``, which is listed even if it is never
+        used on its own.
+
+        Args:
+            prefix: Only include this tag and its nested tags
+                (e.g. ``"project"`` or ``"#project"``; case-insensitive).
+
+        Returns:
+            ``{tag: {"count", "notes", "total_count", "total_notes"}}``
+            sorted by tag (tags include the leading ``#``).  ``count`` and
+            ``notes`` (sorted vault-relative paths) cover the tag itself;
+            ``total_count`` and ``total_notes`` (number of distinct notes)
+            include its nested tags.
+
+        Raises:
+            ObsidianCommError: If the request fails.
+        """
+        payload = {"prefix": prefix} if prefix is not None else {}
+        return self._send_receive("get_tag_index", payload)  # type: ignore[attr-defined]
+
     # ------------------------------------------------------------------
     # Note CRUD
     # ------------------------------------------------------------------
@@ -57,6 +104,48 @@ class VaultMixin:
         self._send_receive("create_note", {"path": path, "content": content})  # type: ignore[attr-defined]
         print(f"Request sent to create note: {path}")
 
+    def import_notes(  # type: ignore[misc]
+        self,
+        notes: Iterable[tuple[str, str]],
+        if_exists: str = "error",
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Create many notes over a single streaming request.
+
+        Notes are sent lazily, one per line, while the plugin creates them
+        in order.  Missing parent folders are created once per folder, and
+        the plugin stops reading from the connection whenever Obsidian's
+        indexer falls behind, so large imports are throttled instead of
+        flooding the vault.  Nothing is printed per note.
+
+        Args:
+            notes: Iterable of ``(path, content)`` pairs, with vault-relative
+                paths including the extension (e.g. ``"Import/A.md"``).
+            if_exists: What to do when a path already exists: ``"error"``
+                (default, recorded as a failure), ``"skip"`` or
+                ``"overwrite"``.
+            timeout: Seconds to wait for the final response once the last
+                note was sent (defaults to the client's request timeout).
+
+        Returns:
+            ``{"received", "created", "overwritten", "skipped",
+            "folders_created", "failed"}`` where ``failed`` lists
+            ``{"index", "path", "error"}`` for every note that could not be
+            imported (``index`` is its position in *notes*).
+
+        Raises:
+            ValueError: If *if_exists* is invalid.
+            ObsidianCommError: If the request fails as a whole.
+        """
+        if if_exists not in ("error", "skip", "overwrite"):
+            raise ValueError("if_exists must be 'error', 'skip' or 'overwrite'.")
+
+        def _items() -> Iterator[dict[str, str]]:
+            for path, content in notes:
+                yield {"path": path, "content": content}
+
+        return self._send_stream("import_notes", {"if_exists": if_exists}, _items(), timeout)  # type: ignore[attr-defined]
+
     def check_path_exists(self, path: str) -> bool:  # type: ignore[misc]
         """Check whether a file or folder exists at the given vault-relative path."""
         if not path:
@@ -79,6 +168,180 @@ class VaultMixin:
         self._send_receive("rename_path", {"old_path": old_path, "new_path": new_path})  # type: ignore[attr-defined]
         print(f"Request sent to rename path: {old_path} -> {new_path}")
 
+    def move_many(  # type: ignore[misc]
+        self,
+        moves: Iterable[tuple[str, str]] | dict[str, str],
+        dry_run: bool = False,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Move or rename many files and folders, updating links in one pass.
+
+        All moves are performed first; then every note linking to a moved
+        file (or containing path-based links and being moved itself) is
+        rewritten exactly once, keeping each link's style, subpath and
+        display text.  Calling :meth:`rename_path` per file instead rewrites
+        referencing notes once per move.  Obsidian shows a progress notice
+        while the operation runs.
+
+        Args:
+            moves: ``(old_path, new_path)`` pairs or an ``{old: new}`` dict of
+                vault-relative paths.  Missing destination folders are
+                created.
+            dry_run: Only report what would be moved and rewritten.
+            timeout: Seconds to wait for the response (defaults to the
+                client's request timeout; large reorganizations may need more).
+
+        Returns:
+            With *dry_run*: ``{"dry_run", "moves", "files_moved",
+            "files_to_rewrite", "links_to_update"}``.  Otherwise:
+            ``{"dry_run", "moved", "files_moved", "files_rewritten",
+            "links_updated", "links_skipped", "failed"}`` where ``failed``
+            lists ``{"from", "to", "error"}`` for moves that failed while
+            running.
+
+        Raises:
+            ValueError: If *moves* is empty.
+            ObsidianCommError: If any move is invalid (nothing is moved) or
+                the request fails.
+        """
+        pairs = moves.items() if isinstance(moves, dict) else moves
+        payload = {"moves": [{"from": old, "to": new} for old, new in pairs], "dry_run": dry_run}
+        if not payload["moves"]:
+            raise ValueError("moves cannot be empty.")
+        return self._send_receive("move_many", payload, timeout)  # type: ignore[attr-defined]
+
+    def search_replace(  # type: ignore[misc]
+        self,
+        pattern: str,
+        replacement: str,
+        glob: str | None = None,
+        regex: bool = True,
+        dry_run: bool = True,
+        flags: str = "",
+        max_previews: int = 3,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Find and replace text across the vault, inside Obsidian.
+
+        Notes are searched and rewritten by the plugin (``vault.process``),
+        so no note content is transferred: only counts and previews come
+        back, and only notes whose content changes are written.  Fetching
+        and re-uploading every note from Python instead costs two full
+        transfers per note.
+
+        Args:
+            pattern: Text to find.  With *regex*, a **JavaScript** regular
+                expression (e.g. named groups are ``(?<name>...)``).
+            replacement: Replacement text.  With *regex*, ``$1``,
+                ``$<name>``, ``$&`` and ``$$`` are expanded (JavaScript
+                syntax, not Python's ``\1``); otherwise it is inserted
+                as-is.
+            glob: Only search notes whose vault-relative path matches
+                (``*``, ``**``, ``?``, ``[...]``, ``{a,b}``).  Defaults to
+                all Markdown notes.
+            regex: Treat *pattern* as a regular expression (``True``) or
+                as literal text.
+            dry_run: Only report the matches (the default); pass ``False``
+                to write the changes.
+            flags: Regular expression flags: ``i`` (ignore case), ``m``
+                (``^``/``$`` match at line breaks), ``s`` (``.`` matches
+                newlines), ``u`` (Unicode).
+            max_previews: Previews returned per note.
+            timeout: Seconds to wait for the response (defaults to the
+                client's request timeout; large vaults may need more).
+
+        Returns:
+            ``{"dry_run", "files_scanned", "files_matched", "matches",
+            "files", "files_changed", "failed"}``.  ``files`` lists
+            ``{"path", "matches", "previews"}`` for each matching note, in
+            path order, with ``previews`` as ``{"line", "before", "after"}``
+            (the line of a match before and after the replacement).
+            ``files_changed`` lists the notes written, and ``failed`` lists
+            ``{"path", "error"}`` for the notes that could not be read or
+            written.
+
+        Raises:
+            ValueError: If *pattern* is empty or *max_previews* is negative.
+            ObsidianCommError: If the pattern or flags are invalid or the
+                request fails.
+        """
+        if not pattern:
+            raise ValueError("pattern cannot be empty.")
+        if max_previews < 0:
+            raise ValueError("max_previews cannot be negative.")
+        payload: dict[str, Any] = {
+            "pattern": pattern,
+            "replacement": replacement,
+            "regex": regex,
+            "dry_run": dry_run,
+            "flags": flags,
+            "max_previews": max_previews,
+        }
+        if glob:
+            payload["glob"] = glob
+        return self._send_receive("search_replace", payload, timeout)  # type: ignore[attr-defined]
+
+    # ------------------------------------------------------------------
+    # Binary files (attachments)
+    # ------------------------------------------------------------------
+
+    def read_binary(self, path: str, into: Any = None, timeout: float | None = None) -> bytes | int:  # type: ignore[misc]
+        """Read a vault file (image, PDF, ...) as raw bytes.
+
+        The bytes travel as the raw HTTP response body — no JSON or base64.
+        With *into*, they are read directly into a caller-provided buffer,
+        so large attachments are not copied through intermediate objects.
+
+        Args:
+            path: Vault-relative path of the file (e.g. ``"Assets/img.png"``).
+            into: Optional writable buffer (``bytearray``, ``memoryview``,
+                NumPy array, ...) at least as large as the file.
+            timeout: Request timeout in seconds (defaults to the client's).
+
+        Returns:
+            The file content, or the number of bytes written to *into*.
+
+        Raises:
+            ValueError: If *path* is empty.
+            ObsidianCommError: If the file is not found, *into* is too
+                small, or the request fails.
+        """
+        if not path:
+            raise ValueError("Path cannot be empty.")
+        return self._send_binary("read_binary", path, into=into, timeout=timeout)  # type: ignore[attr-defined]
+
+    def write_binary(  # type: ignore[misc]
+        self,
+        path: str,
+        data: bytes | bytearray | memoryview,
+        overwrite: bool = True,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Create or replace a vault file with raw bytes.
+
+        The bytes are sent as the raw HTTP request body and written through
+        Obsidian's vault API, so the new file is indexed like any other
+        attachment.  Missing parent folders are created.
+
+        Args:
+            path: Vault-relative path of the file.
+            data: The file content.
+            overwrite: Replace the file if it exists (otherwise an error).
+            timeout: Request timeout in seconds (defaults to the client's).
+
+        Returns:
+            ``{"path": str, "size": int, "created": bool}``.
+
+        Raises:
+            ValueError: If *path* is empty.
+            ObsidianCommError: If the file exists and *overwrite* is
+                ``False``, or the request fails.
+        """
+        if not path:
+            raise ValueError("Path cannot be empty.")
+        headers = {"X-Obsidian-Overwrite": "true" if overwrite else "false"}
+        return self._send_binary("write_binary", path, data, headers=headers, timeout=timeout)  # type: ignore[attr-defined]
+
     # ------------------------------------------------------------------
     # Folder operations
     # ------------------------------------------------------------------
@@ -103,6 +366,195 @@ class VaultMixin:
             raise ValueError('Path cannot be None for list_folder. Use "" for the vault root.')
         return self._send_receive("list_folder", {"path": path})  # type: ignore[attr-defined]
 
+    def list_tree(  # type: ignore[misc]
+        self,
+        path: str = "",
+        max_depth: int | None = None,
+        include_files: bool = True,
+    ) -> VaultTree:
+        """List a whole folder subtree in a single request.
+
+        Args:
+            path: Vault-relative folder path (``""`` for the vault root).
+            max_depth: How many levels to descend (``1`` = direct children
+                only); ``None`` for unlimited.
+            include_files: If ``False``, only folders are listed.
+
+        Returns:
+            A :class:`~obsidian_python_bridge._tree.VaultTree`.  Iterate it
+            for ``TreeEntry(path, name, is_folder, depth)`` items, or use
+            ``.files()``, ``.folders()`` or the ``os.walk``-style ``.walk()``.
+
+        Raises:
+            ValueError: If *path* is ``None`` or *max_depth* is not positive.
+            ObsidianCommError: If the folder does not exist or the request fails.
+        """
+        if path is None:
+            raise ValueError('Path cannot be None for list_tree. Use "" for the vault root.')
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("max_depth must be a positive integer or None.")
+        payload = {"path": path, "max_depth": max_depth, "include_files": include_files}
+        return VaultTree(self._send_receive("list_tree", payload))  # type: ignore[attr-defined]
+
+    def iter_files(  # type: ignore[misc]
+        self,
+        glob: str | None = None,
+        folder: str | None = None,
+        extensions: list[str] | None = None,
+        modified_since: datetime | float | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily iterate over vault files matching the given filters.
+
+        Filtering happens in the plugin; files are fetched one page at a
+        time, in path order, only as the iterator is consumed.  The
+        arguments are checked when this method is called.
+
+        Args:
+            glob: Pattern matched against the vault-relative path
+                (``*``, ``**``, ``?``, ``[...]``, ``{a,b}``),
+                e.g. ``"Journal/**/*.md"``.
+            folder: Only list files inside this folder (recursively).
+            extensions: Only list these extensions (e.g. ``["md", "pdf"]``).
+            modified_since: Only list files modified at or after this time
+                (``datetime`` or seconds since the epoch).
+            page_size: Number of records fetched per request (1-10000).
+
+        Returns:
+            An iterator of
+            ``{"path": str, "size": int, "mtime": float, "ctime": float}``
+            dicts; times are in seconds since the epoch, like ``os.stat``.
+
+        Raises:
+            ValueError: If *page_size* is out of range.
+            ObsidianCommError: While iterating, if *folder* does not exist or
+                a request fails.
+        """
+        if not 1 <= page_size <= 10000:
+            raise ValueError("page_size must be between 1 and 10000.")
+        if isinstance(modified_since, datetime):
+            modified_since = modified_since.timestamp()
+
+        payload: dict[str, Any] = {"limit": page_size}
+        if glob:
+            payload["glob"] = glob
+        if folder:
+            payload["folder"] = folder
+        if extensions is not None:
+            payload["extensions"] = list(extensions)
+        if modified_since is not None:
+            payload["modified_since"] = modified_since * 1000
+
+        def _files() -> Iterator[dict[str, Any]]:
+            while True:
+                page = self._send_receive("list_files", payload)  # type: ignore[attr-defined]
+                for path, size, mtime, ctime in page["rows"]:
+                    yield {"path": path, "size": size, "mtime": mtime / 1000, "ctime": ctime / 1000}
+                if page["next"] is None:
+                    return
+                payload["after"] = page["next"]
+
+        return _files()
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def get_changes_since(self, cursor: str | None = None, limit: int = 1000) -> dict[str, Any]:  # type: ignore[misc]
+        """Return the vault changes recorded after *cursor*.
+
+        The plugin keeps a bounded, persisted journal of ``create``,
+        ``modify``, ``rename`` and ``delete`` events, so incremental jobs can
+        process only what changed since their last run — even if no script
+        was running when the changes happened.
+
+        Typical usage: store the returned ``cursor`` after each run; if
+        ``reset`` is ``True`` (first run, journal lost, or too many changes
+        since), rescan the vault and continue from the new cursor.
+
+        Args:
+            cursor: A cursor from a previous call, or ``None`` to obtain a
+                starting cursor.
+            limit: Maximum number of changes returned per call; loop while
+                ``has_more`` is ``True``.
+
+        Returns:
+            ``{"changes": [...], "cursor": str, "reset": bool, "has_more": bool}``.
+            Each change is ``{"seq", "type", "path", "kind", "time"}`` plus
+            ``"old_path"`` for renames (``kind`` is ``"file"`` or ``"folder"``,
+            ``time`` in ms since the epoch).  Consecutive modifications of
+            the same file are coalesced into one entry.
+
+        Raises:
+            ValueError: If *limit* is not positive.
+            ObsidianCommError: If the request fails.
+        """
+        if limit < 1:
+            raise ValueError("limit must be a positive integer.")
+        return self._send_receive("get_changes_since", {"cursor": cursor, "limit": limit})  # type: ignore[attr-defined]
+
+    def get_note_hashes(self, paths: list[str] | None = None) -> dict[str, dict[str, Any] | None]:  # type: ignore[misc]
+        """Return the content hash, mtime and size of many notes in one request.
+
+        Hashes are computed by the plugin and cached until the file changes,
+        so checking a whole vault for changes transfers no note content.
+
+        Args:
+            paths: Vault-relative paths of the files to hash, or ``None``
+                for all Markdown notes.
+
+        Returns:
+            ``{path: {"hash": str, "mtime": float, "size": int}}`` with
+            ``mtime`` in seconds since the epoch and ``hash`` comparable with
+            :func:`~obsidian_python_bridge.content_hash`.  Requested paths
+            that do not exist (or are folders) map to ``None``.
+
+        Raises:
+            ObsidianCommError: If the request fails.
+        """
+        payload = {"paths": list(paths)} if paths is not None else {}
+        hashes = self._send_receive("get_note_hashes", payload)  # type: ignore[attr-defined]
+        return {
+            path: None if info is None else {**info, "mtime": info["mtime"] / 1000} for path, info in hashes.items()
+        }
+
+    def diff_note_hashes(self, manifest: dict[str, Any], paths: list[str] | None = None) -> ManifestDiff:  # type: ignore[misc]
+        """Compare a locally stored manifest with the current note hashes.
+
+        Args:
+            manifest: The ``{path: hash}`` manifest saved by a previous run
+                (``ManifestDiff.manifest``); pass ``{}`` on the first run.
+            paths: Restrict the check to these paths (default: all notes).
+
+        Returns:
+            A ``ManifestDiff`` with the ``added``, ``modified`` and
+            ``removed`` paths and the new ``manifest`` to store.
+
+        Raises:
+            ObsidianCommError: If the request fails.
+        """
+        return diff_manifest(manifest, self.get_note_hashes(paths), paths)
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+
+    def get_bridge_diagnostics(self) -> dict[str, Any]:  # type: ignore[misc]
+        """Return internal statistics of the plugin's caches.
+
+        Returns:
+            ``{"response_cache": {...}, "content_hash_cache": {...}}``.
+            ``response_cache`` reports ``entries``, ``max_entries``,
+            ``hits``, ``misses``, ``hit_rate``, ``evictions``,
+            ``invalidations`` and per-action ``hits``/``misses`` for the
+            memoized read-only actions (``get_all_tags``,
+            ``get_all_note_paths``, ``get_links``, ``get_backlinks``, ...).
+
+        Raises:
+            ObsidianCommError: If the request fails.
+        """
+        return self._send_receive("get_bridge_diagnostics")  # type: ignore[attr-defined]
+
     # ------------------------------------------------------------------
     # Obsidian commands
     # ------------------------------------------------------------------
@@ -17,7 +17,12 @@ import type ObsidianPythonBridge from './main';
 // Import helpers moved out of main.ts
 import { getScriptsFolderPath, updateAndSyncCommands } from './python_executor';
 import { checkPythonEnvironment } from './environment_checker';
-import { DEFAULT_PORT, PYTHON_LIBRARY_FILENAME } from './constants';
+import {
+  DEFAULT_MAX_REQUEST_BODY_SIZE,
+  DEFAULT_PORT,
+  MAX_RUN_ALL_CONCURRENCY,
+  PYTHON_LIBRARY_FILENAME,
+} from './constants';
 import { t } from './lang/translations'; // Import helpers
 import * as path from 'path'; // Import path for relative path calculation
 import * as fs from 'fs'; // Import fs for absolute path check
@@ -431,6 +436,80 @@ export default class PythonBridgeSettingTab extends PluginSettingTab {
           })
       );
 
+    // Fork Server Toggle
+    new Setting(containerEl)
+      .setName(t('SETTINGS_FORK_SERVER_NAME'))
+      .setDesc(t('SETTINGS_FORK_SERVER_DESC'))
+      .setClass('python-bridge-setting-item')
+      .addToggle((toggle) =>
+        toggle
+          .setValue(this.plugin.settings.useForkServer)
+          .onChange(async (value) => {
+            this.plugin.settings.useForkServer = value;
+            await this.plugin.saveSettings();
+            this.plugin.forkServer.update(); // Start or stop it right away
+            this.plugin.logInfo(`Fork server setting changed to: ${value}`);
+          })
+      );
+
+    // "Run all scripts" Parallelism Slider
+    new Setting(containerEl)
+      .setName(t('SETTINGS_RUN_ALL_CONCURRENCY_NAME'))
+      .setDesc(t('SETTINGS_RUN_ALL_CONCURRENCY_DESC'))
+      .setClass('python-bridge-setting-item')
+      .addSlider((slider) =>
+        slider
+          .setLimits(1, MAX_RUN_ALL_CONCURRENCY, 1)
+          .setValue(this.plugin.settings.runAllConcurrency)
+          .setDynamicTooltip()
+          .onChange(async (value) => {
+            this.plugin.settings.runAllConcurrency = value;
+            await this.plugin.saveSettings();
+          })
+      );
+
+    // Maximum Request Body Size (MB)
+    new Setting(containerEl)
+      .setName(t('SETTINGS_MAX_REQUEST_BODY_NAME'))
+      .setDesc(t('SETTINGS_MAX_REQUEST_BODY_DESC'))
+      .setClass('python-bridge-setting-item')
+      .addText((text) => {
+        text.inputEl.type = 'number';
+        text.inputEl.min = '1';
+        text.inputEl.max = '4096';
+        text
+          .setPlaceholder(String(DEFAULT_MAX_REQUEST_BODY_SIZE / 1048576))
+          .setValue(String(this.plugin.settings.maxRequestBodySize / 1048576));
+        text.inputEl.classList.add('python-bridge-input-normal');
+
+        text.onChange(async (value) => {
+          const sizeMB = parseInt(value.trim());
+          if (!isNaN(sizeMB) && sizeMB >= 1 && sizeMB <= 4096) {
+            this.plugin.settings.maxRequestBodySize = sizeMB * 1048576;
+            await this.plugin.saveSettings();
+            text.inputEl.classList.remove('python-bridge-input-error');
+            text.inputEl.classList.add('python-bridge-input-normal');
+          } else {
+            text.inputEl.classList.remove('python-bridge-input-normal');
+            text.inputEl.classList.add('python-bridge-input-error');
+          }
+        });
+      });
+
+    // Debug Logging Toggle
+    new Setting(containerEl)
+      .setName(t('SETTINGS_DEBUG_LOGGING_NAME'))
+      .setDesc(t('SETTINGS_DEBUG_LOGGING_DESC'))
+      .setClass('python-bridge-setting-item')
+      .addToggle((toggle) =>
+        toggle
+          .setValue(this.plugin.settings.debugLogging)
+          .onChange(async (value) => {
+            this.plugin.settings.debugLogging = value;
+            await this.plugin.saveSettings();
+          })
+      );
+
     // Audit Log Settings
     new Setting(containerEl)
       .setName(t('SETTINGS_AUDIT_LOG_TITLE'))
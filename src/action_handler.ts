@@ -6,6 +6,7 @@ import type ObsidianPythonBridge from './main';
 import type { JsonRequest, JsonResponse } from './types';
 import { actionRegistry } from './action_registry';
 import { logApiAction } from './audit_logger';
+import type { CacheToken } from './response_cache';
 
 /**
  * Dispatches an incoming JSON request to the appropriate action handler.
@@ -13,8 +14,9 @@ import { logApiAction } from './audit_logger';
  * Flow:
  *   1. Look up the action in the registry
  *   2. Run the optional payload validator
- *   3. Execute the action (catches errors)
- *   4. Wrap result in JsonResponse and log the outcome
+ *   3. Serve cacheable read-only actions from the response cache
+ *   4. Execute the action (catches errors)
+ *   5. Wrap result in JsonResponse and log the outcome
  *
  * @param plugin  - The plugin instance.
  * @param request - The parsed JSON request from the Python client.
@@ -47,9 +49,26 @@ export async function dispatchAction(
     }
   }
 
-  // --- 3. Execute action ---
+  // --- 3. Serve read-only actions from the response cache ---
+  let cacheToken: CacheToken | null = null;
+  if (definition.cache) {
+    const cached = plugin.responseCache.lookup(action, payload);
+    if (cached.hit) {
+      logApiAction(plugin, action, 'success', sourceScript);
+      return { status: 'success', data: cached.data };
+    }
+    cacheToken = cached.token;
+  }
+
+  // --- 4. Execute action ---
   try {
     const data = await definition.execute(plugin, payload);
+    if (definition.cache && cacheToken)
+      plugin.responseCache.store(
+        cacheToken,
+        definition.cache.dependsOn,
+        data
+      );
     logApiAction(plugin, action, 'success', sourceScript);
     return { status: 'success', data };
   } catch (error) {
@@ -3,7 +3,6 @@
 // Each action defines an optional validator and an async executor that either
 // returns data (on success) or throws an Error (on failure — caught by the dispatcher).
 
-import * as path from 'path';
 import { normalizePath } from 'obsidian';
 import type ObsidianPythonBridge from './main';
 import {
@@ -16,6 +15,8 @@ import {
   getCurrentVaultAbsolutePath,
   getNoteContentByPath,
   getNoteFrontmatterByPath,
+  getNoteContentIfModified,
+  getNoteFrontmatterIfModified,
   getSelectedText,
   replaceSelectedText,
   getEditorContext,
@@ -31,8 +32,10 @@ import {
   checkPathExists,
   deletePath,
   renamePath,
+  moveMany,
   runObsidianCommand,
   getAllTags,
+  getTagIndex,
   getVaultName,
   getThemeMode,
   createFolder,
@@ -40,8 +43,32 @@ import {
   getLinks,
   getBacklinks,
   modifyNoteContentByRelativePath,
+  patchNoteByPath,
+  toVaultRelativePath,
+  processFrontmatterBatch,
+  validateFrontmatterBatch,
+  getScriptSettingsValues,
+  buildContextSnapshot,
+  getActiveNoteSnapshot,
+  ACTIVE_NOTE_SNAPSHOT_FIELDS,
+  listFiles,
+  listTree,
+  searchReplace,
+  buildSearchRegExp,
 } from './obsidian_api';
+import type { FrontmatterFileRequest } from './api/frontmatter-ops';
+import type { MoveRequest } from './api/move-many';
+import type { ActiveNoteSnapshotField } from './api/active-note-snapshot';
 import { removeListener } from './event_handler';
+import { EVENT_PAYLOAD_FIELDS } from './event_payload';
+import type { EventPayloadField } from './event_payload';
+import type { CacheDependency } from './response_cache';
+import {
+  LIST_FILES_DEFAULT_PAGE_SIZE,
+  LIST_FILES_MAX_PAGE_SIZE,
+  CHANGE_JOURNAL_MAX_ENTRIES,
+  SEARCH_REPLACE_DEFAULT_MAX_PREVIEWS,
+} from './constants';
 
 // ---------------------------------------------------------------------------
 // Types
@@ -61,6 +88,11 @@ export type ActionExecutor = (
 export interface ActionDefinition {
   validate?: PayloadValidator;
   execute: ActionExecutor;
+  /**
+   * Marks a read-only action whose responses may be memoized per payload
+   * until one of the listed dependencies changes (see ResponseCache).
+   */
+  cache?: { dependsOn: CacheDependency[] };
 }
 
 // ---------------------------------------------------------------------------
@@ -102,6 +134,19 @@ export function requireStrings(...fields: string[]): PayloadValidator {
   };
 }
 
+/** Requires a string 'path' and, if present, a string or null 'known_version'. */
+const validateConditionalRead: PayloadValidator = (p) => {
+  if (typeof p.path !== 'string')
+    return "Invalid payload: 'path' (string) required.";
+  if (
+    p.known_version !== undefined &&
+    p.known_version !== null &&
+    typeof p.known_version !== 'string'
+  )
+    return "Invalid payload: 'known_version' must be a string or null.";
+  return null;
+};
+
 // ---------------------------------------------------------------------------
 // Action registry
 // ---------------------------------------------------------------------------
@@ -112,6 +157,7 @@ export const actionRegistry: Record<string, ActionDefinition> = {
   // =========================================================================
 
   get_all_note_paths: {
+    cache: { dependsOn: ['structure'] },
     execute: async (plugin, payload) => {
       const getAbsolutePaths =
         typeof payload === 'object' && payload?.absolute === true;
@@ -131,6 +177,29 @@ export const actionRegistry: Record<string, ActionDefinition> = {
     },
   },
 
+  get_active_note_snapshot: {
+    // Several active-note reads in one atomic step (defaults to all fields)
+    validate: (p) => {
+      if (p.fields === undefined || p.fields === null) return null;
+      if (
+        !Array.isArray(p.fields) ||
+        p.fields.some(
+          (f) =>
+            !(ACTIVE_NOTE_SNAPSHOT_FIELDS as readonly unknown[]).includes(f)
+        )
+      )
+        return `Invalid payload: 'fields' must be a list of: ${ACTIVE_NOTE_SNAPSHOT_FIELDS.join(', ')}.`;
+      return null;
+    },
+    execute: async (plugin, payload) =>
+      getActiveNoteSnapshot(
+        plugin,
+        Array.isArray(payload.fields)
+          ? (payload.fields as ActiveNoteSnapshotField[])
+          : ACTIVE_NOTE_SNAPSHOT_FIELDS
+      ),
+  },
+
   get_active_note_relative_path: {
     execute: async (plugin) => {
       const p = getActiveNoteRelativePath(plugin);
@@ -157,6 +226,7 @@ export const actionRegistry: Record<string, ActionDefinition> = {
   },
 
   get_current_vault_absolute_path: {
+    cache: { dependsOn: [] },
     execute: async (plugin) => {
       const vp = getCurrentVaultAbsolutePath(plugin);
       if (vp === null)
@@ -170,15 +240,48 @@ export const actionRegistry: Record<string, ActionDefinition> = {
   },
 
   get_note_content: {
-    validate: requireStringType('path'),
+    // With a 'known_version' key (string or null), answers with
+    // {version, not_modified, value?} instead of the bare content.
+    validate: validateConditionalRead,
     execute: async (plugin, payload) =>
-      getNoteContentByPath(plugin, payload.path as string),
+      'known_version' in payload
+        ? getNoteContentIfModified(
+            plugin,
+            payload.path as string,
+            payload.known_version as string | null
+          )
+        : getNoteContentByPath(plugin, payload.path as string),
   },
 
   get_note_frontmatter: {
-    validate: requireStringType('path'),
+    // Same 'known_version' protocol as get_note_content.
+    validate: validateConditionalRead,
     execute: async (plugin, payload) =>
-      getNoteFrontmatterByPath(plugin, payload.path as string),
+      'known_version' in payload
+        ? getNoteFrontmatterIfModified(
+            plugin,
+            payload.path as string,
+            payload.known_version as string | null
+          )
+        : getNoteFrontmatterByPath(plugin, payload.path as string),
+  },
+
+  process_frontmatter: {
+    // Batched property operations; each file is given by a vault-relative
+    // 'path' or an absolute 'filePath' (used by the legacy Python helpers),
+    // resolved per file so that one bad path only fails its own entry.
+    validate: (p) => validateFrontmatterBatch(p.files),
+    execute: async (plugin, payload) =>
+      processFrontmatterBatch(
+        plugin,
+        (payload.files as Record<string, unknown>[]).map(
+          (f): FrontmatterFileRequest => ({
+            path: typeof f.path === 'string' ? f.path : undefined,
+            filePath: typeof f.filePath === 'string' ? f.filePath : undefined,
+            ops: f.ops as FrontmatterFileRequest['ops'],
+          })
+        )
+      ),
   },
 
   // =========================================================================
@@ -331,6 +434,84 @@ export const actionRegistry: Record<string, ActionDefinition> = {
       ),
   },
 
+  move_many: {
+    // Renames everything first, then rewrites each referencing note once
+    validate: (p) => {
+      if (!Array.isArray(p.moves) || p.moves.length === 0)
+        return "Invalid payload: 'moves' (non-empty array) required.";
+      for (const [i, move] of (p.moves as unknown[]).entries()) {
+        const m = move as Record<string, unknown>;
+        if (
+          typeof m?.from !== 'string' ||
+          !m.from ||
+          typeof m.to !== 'string' ||
+          !m.to
+        )
+          return `Invalid payload: moves[${i}] needs non-empty 'from' and 'to' strings.`;
+      }
+      if (p.dry_run !== undefined && typeof p.dry_run !== 'boolean')
+        return "Invalid payload: 'dry_run' must be a boolean.";
+      return null;
+    },
+    execute: async (plugin, payload) =>
+      moveMany(
+        plugin,
+        payload.moves as MoveRequest[],
+        (payload.dry_run as boolean | undefined) ?? false
+      ),
+  },
+
+  search_replace: {
+    // Vault-wide find/replace inside Obsidian; returns counts and previews
+    validate: (p) => {
+      if (typeof p.pattern !== 'string' || !p.pattern)
+        return "Invalid payload: 'pattern' (non-empty string) required.";
+      if (typeof p.replacement !== 'string')
+        return "Invalid payload: 'replacement' (string) required.";
+      if (
+        p.glob !== undefined &&
+        p.glob !== null &&
+        typeof p.glob !== 'string'
+      )
+        return "Invalid payload: 'glob' must be a string.";
+      for (const field of ['regex', 'dry_run'])
+        if (p[field] !== undefined && typeof p[field] !== 'boolean')
+          return `Invalid payload: '${field}' must be a boolean.`;
+      if (
+        p.flags !== undefined &&
+        (typeof p.flags !== 'string' || !/^[imsu]*$/.test(p.flags))
+      )
+        return "Invalid payload: 'flags' may only contain i, m, s and u.";
+      if (
+        p.max_previews !== undefined &&
+        (!Number.isInteger(p.max_previews) || (p.max_previews as number) < 0)
+      )
+        return "Invalid payload: 'max_previews' must be a non-negative integer.";
+      try {
+        buildSearchRegExp(
+          p.pattern,
+          p.regex !== false,
+          (p.flags as string | undefined) ?? ''
+        );
+      } catch (error) {
+        return `Invalid payload: ${error instanceof Error ? error.message : String(error)}`;
+      }
+      return null;
+    },
+    execute: async (plugin, payload) =>
+      searchReplace(plugin, {
+        pattern: payload.pattern as string,
+        replacement: payload.replacement as string,
+        glob: (payload.glob as string | null | undefined) ?? undefined,
+        regex: payload.regex !== false,
+        flags: (payload.flags as string | undefined) ?? '',
+        dryRun: payload.dry_run !== false,
+        maxPreviews:
+          (payload.max_previews as number | undefined) ??
+          SEARCH_REPLACE_DEFAULT_MAX_PREVIEWS,
+      }),
+  },
+
   // --- Note content modification (two variants) ---
 
   modify_note_content: {
@@ -340,23 +521,9 @@ export const actionRegistry: Record<string, ActionDefinition> = {
         ? "Invalid payload: 'filePath' (absolute path string) and 'content' (string) required."
         : null,
     execute: async (plugin, payload) => {
-      const vaultAbsPath = getCurrentVaultAbsolutePath(plugin);
-      if (!vaultAbsPath)
-        throw new Error('Vault path unavailable for conversion.');
-
-      const receivedFilePath = payload.filePath as string;
-      const vaultPathWithSeparator = vaultAbsPath.endsWith(path.sep)
-        ? vaultAbsPath
-        : vaultAbsPath + path.sep;
-
-      if (!receivedFilePath.startsWith(vaultPathWithSeparator)) {
-        throw new Error(
-          `Path is outside the current vault. File='${receivedFilePath}' Vault='${vaultAbsPath}'`
-        );
-      }
-
-      const relativePath = normalizePath(
-        path.relative(vaultAbsPath, receivedFilePath)
+      const relativePath = toVaultRelativePath(
+        plugin,
+        payload.filePath as string
       );
       await modifyNoteContentByRelativePath(
         plugin,
@@ -383,6 +550,28 @@ export const actionRegistry: Record<string, ActionDefinition> = {
     },
   },
 
+  patch_note: {
+    // Applies compact edits instead of re-uploading the whole note
+    validate: (p) => {
+      if (typeof p.path !== 'string' || !p.path)
+        return "Invalid payload: 'path' (non-empty string) required.";
+      if (!Array.isArray(p.ops) && typeof p.diff !== 'string')
+        return "Invalid payload: 'ops' (array) or 'diff' (unified diff string) required.";
+      if (p.base_hash !== undefined && typeof p.base_hash !== 'string')
+        return "Invalid payload: 'base_hash' must be a string.";
+      return null;
+    },
+    execute: async (plugin, payload) =>
+      patchNoteByPath(
+        plugin,
+        payload.path as string,
+        Array.isArray(payload.ops)
+          ? { ops: payload.ops }
+          : { diff: payload.diff as string },
+        payload.base_hash as string | undefined
+      ),
+  },
+
   open_note: {
     validate: requireStringType('path'),
     execute: async (plugin, payload) => {
@@ -403,22 +592,141 @@ export const actionRegistry: Record<string, ActionDefinition> = {
   },
 
   list_folder: {
+    cache: { dependsOn: ['structure'] },
     validate: requireStringType('path'),
     execute: async (plugin, payload) =>
       listFolder(plugin, payload.path as string),
   },
 
+  list_tree: {
+    // Whole subtree in one response (parent-index encoding)
+    cache: { dependsOn: ['structure'] },
+    validate: (p) => {
+      if (typeof p.path !== 'string')
+        return "Invalid payload: 'path' (string) required.";
+      if (
+        p.max_depth !== undefined &&
+        p.max_depth !== null &&
+        (!Number.isInteger(p.max_depth) || (p.max_depth as number) < 1)
+      )
+        return "Invalid payload: 'max_depth' must be a positive integer.";
+      if (
+        p.include_files !== undefined &&
+        typeof p.include_files !== 'boolean'
+      )
+        return "Invalid payload: 'include_files' must be a boolean.";
+      return null;
+    },
+    execute: async (plugin, payload) =>
+      listTree(
+        plugin,
+        payload.path as string,
+        (payload.max_depth as number | null | undefined) ?? null,
+        payload.include_files !== false
+      ),
+  },
+
+  list_files: {
+    // Filtered, paginated listing with metadata ({fields, rows, next})
+    validate: (p) => {
+      for (const field of ['glob', 'folder', 'after']) {
+        if (
+          p[field] !== undefined &&
+          p[field] !== null &&
+          typeof p[field] !== 'string'
+        )
+          return `Invalid payload: '${field}' must be a string.`;
+      }
+      if (
+        p.extensions !== undefined &&
+        p.extensions !== null &&
+        (!Array.isArray(p.extensions) ||
+          p.extensions.some((e) => typeof e !== 'string'))
+      )
+        return "Invalid payload: 'extensions' must be a list of strings.";
+      if (
+        p.modified_since !== undefined &&
+        p.modified_since !== null &&
+        typeof p.modified_since !== 'number'
+      )
+        return "Invalid payload: 'modified_since' must be a number (ms since epoch).";
+      if (
+        p.limit !== undefined &&
+        (!Number.isInteger(p.limit) ||
+          (p.limit as number) < 1 ||
+          (p.limit as number) > LIST_FILES_MAX_PAGE_SIZE)
+      )
+        return `Invalid payload: 'limit' must be an integer between 1 and ${LIST_FILES_MAX_PAGE_SIZE}.`;
+      return null;
+    },
+    execute: async (plugin, payload) =>
+      listFiles(plugin, {
+        glob: (payload.glob as string | null) || undefined,
+        folder: (payload.folder as string | null) || undefined,
+        extensions: (payload.extensions as string[] | null) ?? undefined,
+        modifiedSince: (payload.modified_since as number | null) ?? undefined,
+        limit:
+          (payload.limit as number | undefined) ?? LIST_FILES_DEFAULT_PAGE_SIZE,
+        after: (payload.after as string | null) ?? undefined,
+      }),
+  },
+
+  get_changes_since: {
+    validate: (p) => {
+      if (
+        p.cursor !== undefined &&
+        p.cursor !== null &&
+        typeof p.cursor !== 'string'
+      )
+        return "Invalid payload: 'cursor' must be a string or null.";
+      if (
+        p.limit !== undefined &&
+        (!Number.isInteger(p.limit) || (p.limit as number) < 1)
+      )
+        return "Invalid payload: 'limit' must be a positive integer.";
+      return null;
+    },
+    execute: async (plugin, payload) => {
+      if (!plugin.changeJournal)
+        throw new Error('Change journal is not available yet.');
+      return plugin.changeJournal.changesSince(
+        (payload.cursor as string | null) ?? null,
+        (payload.limit as number | undefined) ?? CHANGE_JOURNAL_MAX_ENTRIES
+      );
+    },
+  },
+
+  get_note_hashes: {
+    // {path: {hash, mtime, size} | null}, hashes cached until the file changes
+    validate: (p) => {
+      if (
+        p.paths !== undefined &&
+        p.paths !== null &&
+        (!Array.isArray(p.paths) ||
+          p.paths.some((e) => typeof e !== 'string' || !e))
+      )
+        return "Invalid payload: 'paths' must be a list of non-empty strings.";
+      return null;
+    },
+    execute: async (plugin, payload) =>
+      plugin.contentHashCache.getHashes(
+        (payload.paths as string[] | null | undefined) ?? null
+      ),
+  },
+
   // =========================================================================
   // Links & Backlinks
   // =========================================================================
 
   get_links: {
+    cache: { dependsOn: ['metadata'] },
     validate: requireString('path'),
     execute: async (plugin, payload) =>
       getLinks(plugin, payload.path as string),
   },
 
   get_backlinks: {
+    cache: { dependsOn: ['metadata'] },
     validate: (p) => {
       if (typeof p.path !== 'string' || !p.path)
         return "Invalid payload: 'path' (non-empty string) required.";
@@ -483,13 +791,37 @@ export const actionRegistry: Record<string, ActionDefinition> = {
   },
 
   get_all_tags: {
+    cache: { dependsOn: ['metadata'] },
     execute: async (plugin) => getAllTags(plugin),
   },
 
+  get_tag_index: {
+    cache: { dependsOn: ['metadata'] },
+    validate: (p) =>
+      p.prefix === undefined ||
+      p.prefix === null ||
+      typeof p.prefix === 'string'
+        ? null
+        : "Invalid payload: 'prefix' must be a string or null.",
+    execute: async (plugin, payload) =>
+      getTagIndex(
+        plugin,
+        (payload.prefix as string | null | undefined) ?? null
+      ),
+  },
+
   get_vault_name: {
+    cache: { dependsOn: [] },
     execute: async (plugin) => getVaultName(plugin),
   },
 
+  get_bridge_diagnostics: {
+    execute: async (plugin) => ({
+      response_cache: plugin.responseCache.getStats(),
+      content_hash_cache: { entries: plugin.contentHashCache.size },
+    }),
+  },
+
   run_obsidian_command: {
     validate: requireString('command_id'),
     execute: async (plugin, payload) => {
@@ -504,25 +836,19 @@ export const actionRegistry: Record<string, ActionDefinition> = {
 
   get_script_settings: {
     validate: requireStringType('scriptPath'),
-    execute: async (plugin, payload) => {
-      const relativePath = normalizePath(payload.scriptPath as string);
-      const definitions =
-        plugin.settings.scriptSettingsDefinitions[relativePath] || [];
-      const storedValues =
-        plugin.settings.scriptSettingsValues[relativePath] || {};
-
-      // Merge: stored value wins, fallback to definition default
-      const finalValues: Record<string, string | number | boolean> = {};
-      for (const def of definitions) {
-        finalValues[def.key] = Object.prototype.hasOwnProperty.call(
-          storedValues,
-          def.key
-        )
-          ? storedValues[def.key]
-          : def.default;
-      }
-      return finalValues;
-    },
+    execute: async (plugin, payload) =>
+      getScriptSettingsValues(plugin, payload.scriptPath as string),
+  },
+
+  get_context_snapshot: {
+    // Same snapshot as injected at spawn time (OBSIDIAN_BRIDGE_CONTEXT)
+    execute: async (plugin, payload) =>
+      buildContextSnapshot(
+        plugin,
+        typeof payload.scriptPath === 'string' && payload.scriptPath
+          ? payload.scriptPath
+          : undefined
+      ),
   },
 
   // =========================================================================
@@ -535,15 +861,27 @@ export const actionRegistry: Record<string, ActionDefinition> = {
         return "Invalid payload: 'eventName' (string) required.";
       if (typeof p.scriptPath !== 'string' || !p.scriptPath)
         return 'Internal error: Script path not provided in payload for registration.';
+      if (p.fields === undefined || p.fields === null) return null;
+      if (
+        !Array.isArray(p.fields) ||
+        p.fields.some(
+          (f) => !(EVENT_PAYLOAD_FIELDS as readonly unknown[]).includes(f)
+        )
+      )
+        return `Invalid payload: 'fields' must be a list of: ${EVENT_PAYLOAD_FIELDS.join(', ')}.`;
       return null;
     },
     execute: async (plugin, payload) => {
       const eventName = payload.eventName as string;
       const scriptPath = payload.scriptPath as string;
+      // Note fields added to the payload; registering again replaces them
+      const fields = Array.isArray(payload.fields)
+        ? [...new Set(payload.fields as EventPayloadField[])]
+        : [];
       if (!plugin.eventListeners.has(eventName)) {
-        plugin.eventListeners.set(eventName, new Set());
+        plugin.eventListeners.set(eventName, new Map());
       }
-      plugin.eventListeners.get(eventName)?.add(scriptPath);
+      plugin.eventListeners.get(eventName)?.set(scriptPath, fields);
       plugin.logInfo(
         `Script '${scriptPath}' registered for event '${eventName}'. Current listeners:`,
         plugin.eventListeners.get(eventName)
@@ -0,0 +1,91 @@
+// --- src/api/active-note-snapshot.ts ---
+// Reads several properties of the active note in one consistent step.
+
+import { FileSystemAdapter, MarkdownView } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+import { hashContent } from './content-hash';
+
+/** Fields that can be requested from getActiveNoteSnapshot. */
+export const ACTIVE_NOTE_SNAPSHOT_FIELDS = [
+  'content',
+  'frontmatter',
+  'relative_path',
+  'absolute_path',
+  'title',
+  'editor_context',
+  'selection',
+] as const;
+
+export type ActiveNoteSnapshotField =
+  (typeof ACTIVE_NOTE_SNAPSHOT_FIELDS)[number];
+
+/**
+ * Reads the requested fields of the active note in a single synchronous
+ * step, so no other change can be interleaved between them (no torn reads).
+ *
+ * Content is taken from the live editor buffer, including unsaved edits.
+ * The returned `version` is the SHA-256 of that content (same format as
+ * `patch_note`'s base hash). Note that `frontmatter` comes from the metadata
+ * cache, which is only updated after the buffer is saved to disk.
+ *
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param fields The fields to include.
+ * @returns The requested fields plus `version`.
+ * @throws Error if no Markdown note is active.
+ */
+export function getActiveNoteSnapshot(
+  plugin: ObsidianPythonBridge,
+  fields: readonly ActiveNoteSnapshotField[]
+): Record<string, unknown> {
+  const view = plugin.app.workspace.getActiveViewOfType(MarkdownView);
+  const file = view?.file;
+  if (!view || !file) throw new Error('No active Markdown note found.');
+  const editor = view.editor;
+
+  const content = editor ? editor.getValue() : view.getViewData();
+  const snapshot: Record<string, unknown> = { version: hashContent(content) };
+  for (const field of fields) {
+    switch (field) {
+      case 'content':
+        snapshot.content = content;
+        break;
+      case 'frontmatter':
+        snapshot.frontmatter =
+          plugin.app.metadataCache.getFileCache(file)?.frontmatter ?? null;
+        break;
+      case 'relative_path':
+        snapshot.relative_path = file.path;
+        break;
+      case 'absolute_path': {
+        const adapter = plugin.app.vault.adapter;
+        snapshot.absolute_path =
+          adapter instanceof FileSystemAdapter
+            ? adapter.getFullPath(file.path)
+            : null;
+        break;
+      }
+      case 'title':
+        snapshot.title = file.basename;
+        break;
+      case 'editor_context': {
+        if (!editor) {
+          snapshot.editor_context = null;
+          break;
+        }
+        const cursor = editor.getCursor();
+        snapshot.editor_context = {
+          cursor: { line: cursor.line, ch: cursor.ch },
+          line_count: editor.lineCount(),
+        };
+        break;
+      }
+      case 'selection':
+        snapshot.selection = editor ? editor.getSelection() : '';
+        break;
+    }
+  }
+  plugin.logDebug(
+    `Active note snapshot for ${file.path}: ${fields.join(', ')}`
+  );
+  return snapshot;
+}
@@ -0,0 +1,70 @@
+// --- src/api/binary-files.ts ---
+// Reads and writes binary files (attachments) as raw bytes.
+
+import { TFile, TFolder, normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+
+/** Result of a binary write. */
+export interface BinaryWriteResult {
+  path: string;
+  size: number;
+  created: boolean;
+}
+
+/**
+ * Reads a vault file as raw bytes.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param relativePath The vault-relative path of the file.
+ * @returns The file content.
+ * @throws Error if the file is not found.
+ */
+export async function readBinaryFile(
+  plugin: ObsidianPythonBridge,
+  relativePath: string
+): Promise<ArrayBuffer> {
+  const normalizedPath = normalizePath(relativePath);
+  const file = plugin.app.vault.getAbstractFileByPath(normalizedPath);
+  if (!(file instanceof TFile))
+    throw new Error(
+      `File not found or is not a file at path: ${normalizedPath}`
+    );
+  return plugin.app.vault.readBinary(file);
+}
+
+/**
+ * Creates or replaces a vault file with raw bytes, creating missing
+ * parent folders.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param relativePath The vault-relative path of the file.
+ * @param data The new file content.
+ * @param overwrite Replace the file if it already exists.
+ * @throws Error if the file exists and `overwrite` is false, or the write fails.
+ */
+export async function writeBinaryFile(
+  plugin: ObsidianPythonBridge,
+  relativePath: string,
+  data: ArrayBuffer,
+  overwrite: boolean
+): Promise<BinaryWriteResult> {
+  const normalizedPath = normalizePath(relativePath);
+  const { vault } = plugin.app;
+  const existing = vault.getAbstractFileByPath(normalizedPath);
+  if (existing) {
+    if (!(existing instanceof TFile))
+      throw new Error(`Path is a folder, not a file: ${normalizedPath}`);
+    if (!overwrite)
+      throw new Error(`File already exists at path: ${normalizedPath}`);
+    await vault.modifyBinary(existing, data);
+    return { path: normalizedPath, size: data.byteLength, created: false };
+  }
+  const parts = normalizedPath.split('/').slice(0, -1);
+  for (let i = 1; i <= parts.length; i++) {
+    const folderPath = parts.slice(0, i).join('/');
+    const folder = vault.getAbstractFileByPath(folderPath);
+    if (!folder) await vault.createFolder(folderPath);
+    else if (!(folder instanceof TFolder))
+      throw new Error(`Parent path is a file, not a folder: ${folderPath}`);
+  }
+  await vault.createBinary(normalizedPath, data);
+  return { path: normalizedPath, size: data.byteLength, created: true };
+}
@@ -0,0 +1,73 @@
+// --- src/api/conditional-read.ts ---
+// Version-checked reads: the full result is only sent when the client's
+// copy ('known_version') is out of date.
+
+import { TFile, normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+import { hashContent } from './content-hash';
+import { getNoteFrontmatterByPath } from './note-frontmatter';
+
+/** Response of a conditional read. `value` is omitted when not modified. */
+export interface ConditionalReadResult<T> {
+  version: string;
+  not_modified: boolean;
+  value?: T;
+}
+
+async function conditionalResult<T>(
+  version: string,
+  knownVersion: string | null,
+  getValue: () => T | Promise<T>
+): Promise<ConditionalReadResult<T>> {
+  if (knownVersion !== null && knownVersion === version)
+    return { version, not_modified: true };
+  return { version, not_modified: false, value: await getValue() };
+}
+
+/**
+ * Reads a note's content unless the client already holds that version.
+ * The version is the content hash (see hashContent): a cached hash of the
+ * unchanged note answers "not modified" without reading it; otherwise the
+ * note is read once and the version is the hash of the content returned.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param relativePath The vault-relative path to the note.
+ * @param knownVersion The version held by the client, or null.
+ * @throws Error if the file is not found or is not a TFile.
+ */
+export async function getNoteContentIfModified(
+  plugin: ObsidianPythonBridge,
+  relativePath: string,
+  knownVersion: string | null
+): Promise<ConditionalReadResult<string>> {
+  const normalizedPath = normalizePath(relativePath);
+  const file = plugin.app.vault.getAbstractFileByPath(normalizedPath);
+  if (!(file instanceof TFile))
+    throw new Error(
+      `File not found or is not a file at path: ${normalizedPath}`
+    );
+  const cached = plugin.contentHashCache.lookup(file);
+  if (knownVersion !== null && cached?.hash === knownVersion)
+    return { version: knownVersion, not_modified: true };
+  const { content, entry } = await plugin.contentHashCache.read(file);
+  return conditionalResult(entry.hash, knownVersion, () => content);
+}
+
+/**
+ * Reads a note's frontmatter unless the client already holds that version.
+ * The version is the hash of the frontmatter's JSON serialization.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param relativePath The vault-relative path to the note.
+ * @param knownVersion The version held by the client, or null.
+ */
+export async function getNoteFrontmatterIfModified(
+  plugin: ObsidianPythonBridge,
+  relativePath: string,
+  knownVersion: string | null
+): Promise<ConditionalReadResult<Record<string, unknown> | null>> {
+  const frontmatter = getNoteFrontmatterByPath(plugin, relativePath);
+  return conditionalResult(
+    hashContent(JSON.stringify(frontmatter)),
+    knownVersion,
+    () => frontmatter
+  );
+}
@@ -0,0 +1,14 @@
+// --- src/api/content-hash.ts ---
+// Content hashing shared by version-checked reads and writes.
+
+import { createHash } from 'crypto';
+
+/**
+ * Computes the version hash of a note's content.
+ * Matches the Python client's `content_hash` (SHA-256 of the UTF-8 bytes).
+ * @param content The note content.
+ * @returns The lowercase hexadecimal SHA-256 digest.
+ */
+export function hashContent(content: string): string {
+  return createHash('sha256').update(content, 'utf8').digest('hex');
+}
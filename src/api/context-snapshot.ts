@@ -0,0 +1,53 @@
+// --- src/api/context-snapshot.ts ---
+// Builds the context snapshot handed to Python scripts at spawn time.
+
+import type ObsidianPythonBridge from '../main';
+import { getCurrentVaultAbsolutePath, getVaultName } from './vault-info';
+import {
+  getActiveNoteRelativePath,
+  getActiveNoteAbsolutePath,
+  getActiveNoteTitle,
+} from './active-note-path';
+import { getThemeMode } from './theme-mode';
+import { getObsidianLanguage } from './obsidian-info';
+import { getScriptSettingsValues } from './script-settings';
+
+/** Values a script typically requests right after connecting. */
+export interface ContextSnapshot {
+  vault_path: string | null;
+  vault_name: string;
+  active_note_relative_path: string | null;
+  active_note_absolute_path: string | null;
+  active_note_title: string | null;
+  theme_mode: 'light' | 'dark';
+  language: string;
+  script_path: string | null;
+  script_settings: Record<string, string | number | boolean> | null;
+}
+
+/**
+ * Collects the values scripts usually fetch one by one after startup, so
+ * they can be served locally by the Python client.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param scriptRelativePath The script path relative to the scripts folder,
+ *   used to include its settings values (optional).
+ * @returns The context snapshot.
+ */
+export function buildContextSnapshot(
+  plugin: ObsidianPythonBridge,
+  scriptRelativePath?: string
+): ContextSnapshot {
+  return {
+    vault_path: getCurrentVaultAbsolutePath(plugin),
+    vault_name: getVaultName(plugin),
+    active_note_relative_path: getActiveNoteRelativePath(plugin),
+    active_note_absolute_path: getActiveNoteAbsolutePath(plugin),
+    active_note_title: getActiveNoteTitle(plugin),
+    theme_mode: getThemeMode(plugin),
+    language: getObsidianLanguage(plugin),
+    script_path: scriptRelativePath ?? null,
+    script_settings: scriptRelativePath
+      ? getScriptSettingsValues(plugin, scriptRelativePath)
+      : null,
+  };
+}
@@ -0,0 +1,227 @@
+// --- src/api/editor-stream.ts ---
+// Incremental (streamed) text insertion into the active editor.
+
+import { Editor, EditorPosition, MarkdownView } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+import {
+  STREAM_INSERT_ANCHOR_CONTEXT_LENGTH,
+  STREAM_INSERT_FLUSH_INTERVAL_MS,
+  STREAM_INSERT_HIGH_WATER_MARK,
+} from '../constants';
+
+/** Where a streamed insertion starts. */
+export type StreamInsertAnchor =
+  | { at: 'cursor' }
+  | { at: 'end' }
+  | { at: 'position'; line: number; ch: number };
+
+/** Summary returned once a streamed insertion has been fully applied. */
+export interface StreamInsertResult {
+  chunks: number;
+  inserted: number;
+  end: { line: number; ch: number };
+}
+
+/**
+ * Applies streamed text chunks to an editor, in order, at a tracked anchor.
+ *
+ * Chunks are buffered and flushed as a single `replaceRange` every
+ * STREAM_INSERT_FLUSH_INTERVAL_MS, so high chunk rates produce one editor
+ * update per frame instead of one per chunk. `write` returns a promise when
+ * the buffer exceeds STREAM_INSERT_HIGH_WATER_MARK; the stream handler awaits
+ * it before reading more of the request body (back-pressure).
+ *
+ * The anchor is tracked by the text just before it (the note's text before
+ * the start, then the end of the text inserted so far): if the user edits
+ * the note above the anchor mid-stream, the next flush finds that text
+ * again, at the occurrence nearest to the old anchor. If the user edits
+ * that text itself, the stream fails rather than insert at a guess.
+ */
+export class EditorStreamWriter {
+  private anchor: number; // Character offset where the next flush inserts
+  /** The text expected right before the anchor (at most the context length). */
+  private context: string;
+  private pending: string[] = [];
+  private pendingLength = 0;
+  private flushPromise: Promise<void> | null = null;
+  private failure: Error | null = null;
+  private chunkCount = 0;
+  private insertedCount = 0;
+
+  constructor(
+    private plugin: ObsidianPythonBridge,
+    private view: MarkdownView,
+    private editor: Editor,
+    anchor: EditorPosition,
+    private filePath: string | null
+  ) {
+    this.anchor = editor.posToOffset(anchor);
+    this.context = editor.getRange(
+      editor.offsetToPos(
+        Math.max(0, this.anchor - STREAM_INSERT_ANCHOR_CONTEXT_LENGTH)
+      ),
+      anchor
+    );
+  }
+
+  /**
+   * Queues a chunk for insertion.
+   * @param text The text fragment to insert.
+   * @returns A promise to await before sending more data if the buffer is full.
+   * @throws Error if a previous flush failed.
+   */
+  write(text: string): Promise<void> | void {
+    if (this.failure) throw this.failure;
+    if (!text) return;
+    this.pending.push(text);
+    this.pendingLength += text.length;
+    this.chunkCount++;
+    const flushed = this.scheduleFlush();
+    if (this.pendingLength >= STREAM_INSERT_HIGH_WATER_MARK) return flushed;
+  }
+
+  /**
+   * Flushes any buffered text and returns the insertion summary.
+   * @throws Error if a flush failed (e.g. the note was closed mid-stream).
+   */
+  async finish(): Promise<StreamInsertResult> {
+    if (this.flushPromise) await this.flushPromise;
+    if (this.pendingLength > 0) this.flush();
+    if (this.failure) throw this.failure;
+    const end = this.editor.offsetToPos(this.anchor);
+    return {
+      chunks: this.chunkCount,
+      inserted: this.insertedCount,
+      end: { line: end.line, ch: end.ch },
+    };
+  }
+
+  /** Drops buffered text without applying it (stream aborted). */
+  abort(): void {
+    this.pending = [];
+    this.pendingLength = 0;
+  }
+
+  private scheduleFlush(): Promise<void> {
+    if (!this.flushPromise) {
+      this.flushPromise = new Promise((resolve) => {
+        window.setTimeout(() => {
+          this.flushPromise = null;
+          this.flush();
+          resolve();
+        }, STREAM_INSERT_FLUSH_INTERVAL_MS);
+      });
+    }
+    return this.flushPromise;
+  }
+
+  private flush(): void {
+    if (this.pendingLength === 0 || this.failure) return;
+    const text = this.pending.join('');
+    this.pending = [];
+    this.pendingLength = 0;
+    try {
+      if ((this.view.file?.path ?? null) !== this.filePath)
+        throw new Error('The target note was closed or changed mid-stream.');
+      this.anchor = this.locateAnchor();
+      this.editor.replaceRange(text, this.editor.offsetToPos(this.anchor));
+      this.anchor += text.length;
+      this.insertedCount += text.length;
+      this.context = (this.context + text).slice(
+        -STREAM_INSERT_ANCHOR_CONTEXT_LENGTH
+      );
+    } catch (error) {
+      this.failure = new Error(
+        `Streamed insertion failed: ${error instanceof Error ? error.message : String(error)}`
+      );
+      this.plugin.logError(this.failure.message);
+    }
+  }
+
+  /**
+   * Returns the current offset of the anchor: unchanged if the context text
+   * still ends there, else the end of its occurrence nearest to it.
+   * @throws Error if the context text is no longer in the note.
+   */
+  private locateAnchor(): number {
+    const lastLine = this.editor.lastLine();
+    const docLength = this.editor.posToOffset({
+      line: lastLine,
+      ch: this.editor.getLine(lastLine).length,
+    });
+    const start = this.anchor - this.context.length;
+    if (
+      this.anchor <= docLength &&
+      this.editor.getRange(
+        this.editor.offsetToPos(start),
+        this.editor.offsetToPos(this.anchor)
+      ) === this.context
+    )
+      return this.anchor;
+    // Nothing to look for at the start of the note: keep the anchor in range.
+    if (!this.context) return Math.min(this.anchor, docLength);
+
+    const content = this.editor.getValue();
+    let nearest = -1;
+    for (
+      let index = content.indexOf(this.context);
+      index !== -1;
+      index = content.indexOf(this.context, index + 1)
+    ) {
+      const end = index + this.context.length;
+      if (
+        nearest === -1 ||
+        Math.abs(end - this.anchor) < Math.abs(nearest - this.anchor)
+      )
+        nearest = end;
+      else if (end > this.anchor) break; // The next ones are farther
+    }
+    if (nearest === -1)
+      throw new Error(
+        'The text around the insertion point was edited mid-stream.'
+      );
+    return nearest;
+  }
+}
+
+/**
+ * Opens a streamed insertion on the active Markdown editor.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param anchor Where the insertion starts (cursor, end of note, or a position).
+ * @returns A writer that applies chunks in order at the tracked anchor.
+ * @throws Error if no Markdown view/editor is active or the position is invalid.
+ */
+export function openEditorStream(
+  plugin: ObsidianPythonBridge,
+  anchor: StreamInsertAnchor
+): EditorStreamWriter {
+  const view = plugin.app.workspace.getActiveViewOfType(MarkdownView);
+  if (!view) throw new Error('No active Markdown view found.');
+  const editor = view.editor;
+  if (!editor)
+    throw new Error('Active Markdown view does not have an editor instance.');
+
+  let start: EditorPosition;
+  if (anchor.at === 'end') {
+    const lastLine = editor.lastLine();
+    start = { line: lastLine, ch: editor.getLine(lastLine).length };
+  } else if (anchor.at === 'position') {
+    const lineCount = editor.lineCount();
+    if (anchor.line < 0 || anchor.line >= lineCount)
+      throw new Error(`Line position out of range (0-${lineCount - 1})`);
+    start = { line: anchor.line, ch: anchor.ch };
+  } else {
+    start = editor.getCursor();
+  }
+
+  plugin.logDebug(
+    `Opening streamed insertion at (${start.line},${start.ch}) in ${view.file?.path}`
+  );
+  return new EditorStreamWriter(
+    plugin,
+    view,
+    editor,
+    start,
+    view.file?.path ?? null
+  );
+}
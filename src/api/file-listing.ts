@@ -0,0 +1,153 @@
+// --- src/api/file-listing.ts ---
+// Filtered, paginated listing of vault files with metadata.
+
+import { TFile, TFolder, normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+
+/** Filters and pagination options for listFiles. */
+export interface ListFilesOptions {
+  /** Glob matched against the vault-relative path (`*`, `**`, `?`, `[...]`, `{a,b}`). */
+  glob?: string;
+  /** Only list files inside this folder (recursively). */
+  folder?: string;
+  /** Only list files with these extensions (without dot, case-insensitive). */
+  extensions?: string[];
+  /** Only list files modified at or after this time (ms since epoch). */
+  modifiedSince?: number;
+  /** Maximum number of records in the page. */
+  limit: number;
+  /** Cursor: return files whose path sorts after this one. */
+  after?: string;
+}
+
+/** A page of file records, encoded as column names plus rows. */
+export interface FileListingPage {
+  fields: ['path', 'size', 'mtime', 'ctime'];
+  rows: [string, number, number, number][];
+  /** Cursor for the next page, or null if this is the last one. */
+  next: string | null;
+}
+
+/**
+ * Converts a glob pattern to an anchored regular expression.
+ * `**` matches across folders, `*` and `?` stay within one path segment.
+ * @param glob The glob pattern.
+ * @returns The equivalent RegExp.
+ */
+export function globToRegExp(glob: string): RegExp {
+  let re = '';
+  let inGroup = 0;
+  for (let i = 0; i < glob.length; i++) {
+    const c = glob[i];
+    if (c === '*') {
+      if (glob[i + 1] === '*') {
+        i++;
+        if (glob[i + 1] === '/') {
+          i++;
+          re += '(?:.*/)?'; // "**/" also matches zero folders
+        } else {
+          re += '.*';
+        }
+      } else {
+        re += '[^/]*';
+      }
+    } else if (c === '?') {
+      re += '[^/]';
+    } else if (c === '[') {
+      const close = glob.indexOf(']', i + 1);
+      if (close === -1) {
+        re += '\\[';
+      } else {
+        const body = glob.slice(i + 1, close).replace(/\\/g, '\\\\');
+        re += body.startsWith('!') ? `[^${body.slice(1)}]` : `[${body}]`;
+        i = close;
+      }
+    } else if (c === '{') {
+      inGroup++;
+      re += '(?:';
+    } else if (c === '}' && inGroup > 0) {
+      inGroup--;
+      re += ')';
+    } else if (c === ',' && inGroup > 0) {
+      re += '|';
+    } else {
+      re += c.replace(/[.+^${}()|\\]/g, '\\$&');
+    }
+  }
+  return new RegExp(`^${re}$`);
+}
+
+/**
+ * Lists vault files matching the given filters, sorted by path, one page at
+ * a time (keyset pagination on the path, so pages stay consistent even if
+ * files are added or removed between calls).
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param options Filters and pagination options.
+ * @returns A compact page of `[path, size, mtime, ctime]` rows.
+ * @throws Error if `folder` does not exist or is not a folder.
+ */
+export function listFiles(
+  plugin: ObsidianPythonBridge,
+  options: ListFilesOptions
+): FileListingPage {
+  const { glob, folder, extensions, modifiedSince, limit, after } = options;
+
+  let candidates: TFile[];
+  if (folder) {
+    const normalizedFolder = normalizePath(folder);
+    const root = plugin.app.vault.getAbstractFileByPath(normalizedFolder);
+    if (!(root instanceof TFolder))
+      throw new Error(`Folder not found at path: ${normalizedFolder}`);
+    candidates = [];
+    const stack: TFolder[] = [root];
+    while (stack.length > 0) {
+      for (const child of stack.pop()!.children) {
+        if (child instanceof TFile) candidates.push(child);
+        else if (child instanceof TFolder) stack.push(child);
+      }
+    }
+  } else {
+    candidates = plugin.app.vault.getFiles();
+  }
+
+  const pattern = glob ? globToRegExp(glob) : null;
+  const extensionSet = extensions
+    ? new Set(extensions.map((e) => e.replace(/^\./, '').toLowerCase()))
+    : null;
+  // Keep only the `limit + 1` smallest matching paths (the extra one tells
+  // whether another page exists) instead of sorting every match per page.
+  const best: TFile[] = [];
+  let matchCount = 0;
+  for (const file of candidates) {
+    if (
+      (after !== undefined && file.path <= after) ||
+      (extensionSet && !extensionSet.has(file.extension.toLowerCase())) ||
+      (modifiedSince !== undefined && file.stat.mtime < modifiedSince) ||
+      (pattern && !pattern.test(file.path))
+    )
+      continue;
+    matchCount++;
+    if (best.length > limit && file.path >= best[limit].path) continue;
+    // Binary search for the insertion point (plain code-unit order, the
+    // same order the cursor comparison above uses).
+    let lo = 0;
+    let hi = best.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (best[mid].path < file.path) lo = mid + 1;
+      else hi = mid;
+    }
+    best.splice(lo, 0, file);
+    if (best.length > limit + 1) best.pop();
+  }
+
+  const page = best.slice(0, limit);
+  plugin.logDebug(
+    `list_files: ${matchCount} match(es) after cursor, returning ${page.length}`
+  );
+  return {
+    fields: ['path', 'size', 'mtime', 'ctime'],
+    rows: page.map((f) => [f.path, f.stat.size, f.stat.mtime, f.stat.ctime]),
+    next: best.length > limit ? page[page.length - 1].path : null,
+  };
+}
@@ -1,7 +1,7 @@
 // --- src/api/folder-operations.ts ---
 // Folder-related operations.
 
-import { normalizePath } from 'obsidian';
+import { TFile, TFolder, normalizePath } from 'obsidian';
 import type ObsidianPythonBridge from '../main';
 import { checkPathExists } from './note-crud';
 
@@ -63,3 +63,73 @@ export async function listFolder(
       );
   }
 }
+
+/**
+ * Recursive folder listing in parent-index encoding: entry `i` is named
+ * `names[i]`, lives in entry `parents[i]` (-1 for the listed folder itself)
+ * and is a folder if `folders[i]` is 1. Parents always precede their
+ * children, so full paths can be rebuilt in a single pass.
+ */
+export interface FolderTree {
+  root: string;
+  names: string[];
+  parents: number[];
+  folders: (0 | 1)[];
+}
+
+/**
+ * Lists a whole folder subtree in one call.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param relativePath Vault-relative folder path. Use "" for the vault root.
+ * @param maxDepth Maximum depth to descend (1 = direct children only), or null for unlimited.
+ * @param includeFiles Whether to include files, or only folders.
+ * @returns The subtree in parent-index encoding.
+ * @throws Error if the path is not found or is not a folder.
+ */
+export function listTree(
+  plugin: ObsidianPythonBridge,
+  relativePath: string,
+  maxDepth: number | null,
+  includeFiles: boolean
+): FolderTree {
+  const root =
+    relativePath === '' || relativePath === '/'
+      ? plugin.app.vault.getRoot()
+      : plugin.app.vault.getAbstractFileByPath(normalizePath(relativePath));
+  if (!(root instanceof TFolder))
+    throw new Error(
+      `Cannot list tree: Folder not found at "${normalizePath(relativePath)}"`
+    );
+
+  const tree: FolderTree = {
+    root: root.isRoot() ? '' : root.path,
+    names: [],
+    parents: [],
+    folders: [],
+  };
+  // Breadth-first walk; `queue[i]` is the folder stored at entry `indices[i]`.
+  const queue: TFolder[] = [root];
+  const indices: number[] = [-1];
+  const depths: number[] = [0];
+  for (let head = 0; head < queue.length; head++) {
+    const folder = queue[head];
+    const depth = depths[head] + 1;
+    if (maxDepth !== null && depth > maxDepth) continue;
+    for (const child of folder.children) {
+      const isFolder = child instanceof TFolder;
+      if (!isFolder && !(includeFiles && child instanceof TFile)) continue;
+      tree.names.push(child.name);
+      tree.parents.push(indices[head]);
+      tree.folders.push(isFolder ? 1 : 0);
+      if (isFolder) {
+        queue.push(child);
+        indices.push(tree.names.length - 1);
+        depths.push(depth);
+      }
+    }
+  }
+  plugin.logDebug(
+    `Listed tree of "${tree.root || '/'}": ${tree.names.length} entries`
+  );
+  return tree;
+}
@@ -0,0 +1,277 @@
+// --- src/api/frontmatter-ops.ts ---
+// Applies frontmatter property operations server-side via processFrontMatter.
+
+import { TFile, normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+import { toVaultRelativePath } from './vault-info';
+
+/** One property operation. Mirrors manage_properties_key/value in Python. */
+export interface FrontmatterOperation {
+  op:
+    | 'add_key'
+    | 'remove_key'
+    | 'rename_key'
+    | 'add_value'
+    | 'remove_value'
+    | 'update_value';
+  key: string;
+  new_key?: string;
+  value?: unknown;
+  new_value?: unknown;
+  index?: number;
+}
+
+/** The operations to apply to one file. */
+export interface FrontmatterFileRequest {
+  /** Vault-relative path; takes precedence over filePath. */
+  path?: string;
+  /** Absolute path (used by the legacy Python helpers). */
+  filePath?: string;
+  ops: FrontmatterOperation[];
+}
+
+/** Per-file outcome of a batch. */
+export interface FrontmatterFileResult {
+  path: string;
+  success: boolean;
+  changed: boolean;
+  error?: string;
+}
+
+/** Thrown from processFrontMatter to skip rewriting an unchanged note. */
+const NO_CHANGES = new Error('No changes needed.');
+
+const FRONTMATTER_OPS = new Set([
+  'add_key',
+  'remove_key',
+  'rename_key',
+  'add_value',
+  'remove_value',
+  'update_value',
+]);
+
+/**
+ * Validates a batch of frontmatter requests from a payload.
+ * @returns An error string, or null if valid.
+ */
+export function validateFrontmatterBatch(files: unknown): string | null {
+  if (!Array.isArray(files) || files.length === 0)
+    return "Invalid payload: 'files' (non-empty array) required.";
+  for (const [i, file] of files.entries()) {
+    const filePath = file?.path ?? file?.filePath;
+    if (typeof filePath !== 'string' || !filePath)
+      return `Invalid payload: files[${i}].path (non-empty string) required.`;
+    if (!Array.isArray(file.ops))
+      return `Invalid payload: files[${i}].ops (array) required.`;
+    for (const [j, op] of (file.ops as unknown[]).entries()) {
+      const o = op as Record<string, unknown>;
+      if (!FRONTMATTER_OPS.has(o?.op as string))
+        return `Invalid payload: files[${i}].ops[${j}].op is not a supported operation.`;
+      if (typeof o.key !== 'string' || !o.key)
+        return `Invalid payload: files[${i}].ops[${j}].key (non-empty string) required.`;
+      if (
+        o.op === 'rename_key' &&
+        (typeof o.new_key !== 'string' || !o.new_key)
+      )
+        return `Invalid payload: files[${i}].ops[${j}].new_key (non-empty string) required.`;
+      if (
+        o.index !== undefined &&
+        o.index !== null &&
+        !Number.isInteger(o.index)
+      )
+        return `Invalid payload: files[${i}].ops[${j}].index must be an integer.`;
+    }
+  }
+  return null;
+}
+
+/** Deep equality for YAML values (scalars, lists, mappings). */
+function valuesEqual(a: unknown, b: unknown): boolean {
+  if (a === b) return true;
+  if (typeof a !== 'object' || typeof b !== 'object' || !a || !b) return false;
+  return JSON.stringify(a) === JSON.stringify(b);
+}
+
+/**
+ * Applies one operation to a frontmatter object in place.
+ * Error messages match the Python client's manage_properties_* helpers.
+ * @throws Error if the operation cannot be applied.
+ */
+function applyOperation(
+  fm: Record<string, unknown>,
+  op: FrontmatterOperation
+): void {
+  const { key } = op;
+  const hasKey = Object.prototype.hasOwnProperty.call(fm, key);
+  switch (op.op) {
+    case 'add_key':
+      if (hasKey)
+        throw new Error(`Cannot add key '${key}': Key already exists.`);
+      fm[key] = null;
+      return;
+
+    case 'remove_key':
+      if (!hasKey)
+        throw new Error(`Cannot remove key '${key}': Key not found.`);
+      delete fm[key];
+      return;
+
+    case 'rename_key': {
+      const newKey = op.new_key as string;
+      if (!hasKey)
+        throw new Error(`Cannot rename key '${key}': Key not found.`);
+      if (newKey === key)
+        throw new Error(
+          'Cannot rename key: new_key is the same as the old key.'
+        );
+      if (Object.prototype.hasOwnProperty.call(fm, newKey))
+        throw new Error(
+          `Cannot rename to '${newKey}': Target key already exists.`
+        );
+      fm[newKey] = fm[key];
+      delete fm[key];
+      return;
+    }
+
+    case 'add_value': {
+      const current = fm[key];
+      if (!hasKey || current === null || current === undefined) {
+        fm[key] = op.value;
+      } else if (Array.isArray(current)) {
+        current.push(...(Array.isArray(op.value) ? op.value : [op.value]));
+      } else {
+        throw new Error(
+          `Cannot add value: Key '${key}' exists but is not a list or null. Use 'update' to change scalar values.`
+        );
+      }
+      return;
+    }
+
+    case 'remove_value': {
+      if (!hasKey)
+        throw new Error(
+          `Key '${key}' not found in frontmatter for action 'remove'.`
+        );
+      const current = fm[key];
+      if (Array.isArray(current)) {
+        const toRemove = Array.isArray(op.value) ? op.value : [op.value];
+        const kept = current.filter(
+          (item) => !toRemove.some((v) => valuesEqual(item, v))
+        );
+        if (kept.length === current.length)
+          throw new Error(
+            `Value(s) '${JSON.stringify(toRemove)}' not found in list for '${key}'.`
+          );
+        fm[key] = kept;
+      } else if (valuesEqual(current, op.value)) {
+        delete fm[key];
+      } else {
+        throw new Error(
+          `Cannot remove value: Key '${key}' is not a list, and its value ('${String(current)}') does not match ('${String(op.value)}').`
+        );
+      }
+      return;
+    }
+
+    case 'update_value': {
+      if (!hasKey)
+        throw new Error(
+          `Key '${key}' not found in frontmatter for action 'update'.`
+        );
+      const current = fm[key];
+      if (!Array.isArray(current)) {
+        fm[key] = op.new_value;
+        return;
+      }
+      if (op.index !== undefined && op.index !== null) {
+        const index = op.index < 0 ? current.length + op.index : op.index;
+        if (index < 0 || index >= current.length)
+          throw new Error(
+            `Index ${op.index} is out of bounds for list key '${key}' (length ${current.length}).`
+          );
+        current[index] = op.new_value;
+      } else if (op.value !== undefined && op.value !== null) {
+        const index = current.findIndex((item) => valuesEqual(item, op.value));
+        if (index === -1)
+          throw new Error(
+            `Value '${String(op.value)}' to update not found in list key '${key}'.`
+          );
+        current[index] = op.new_value;
+      } else {
+        throw new Error(
+          "For list update, provide either 'index' or the old 'value' to replace."
+        );
+      }
+      return;
+    }
+  }
+}
+
+/**
+ * Applies property operations to many notes, one processFrontMatter call per
+ * note. Operations on a note are all-or-nothing: if one fails, that note is
+ * left untouched. A failing note does not stop the rest of the batch.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param files The notes (vault-relative or absolute paths) and their
+ *   operations.
+ * @returns One result per requested note, in request order.
+ */
+export async function processFrontmatterBatch(
+  plugin: ObsidianPythonBridge,
+  files: FrontmatterFileRequest[]
+): Promise<FrontmatterFileResult[]> {
+  const results: FrontmatterFileResult[] = [];
+  for (const { path: relativePath, filePath, ops } of files) {
+    let normalizedPath: string;
+    try {
+      normalizedPath = normalizePath(
+        relativePath ?? toVaultRelativePath(plugin, filePath as string)
+      );
+    } catch (error) {
+      results.push({
+        path: filePath ?? '',
+        success: false,
+        changed: false,
+        error: error instanceof Error ? error.message : String(error),
+      });
+      continue;
+    }
+    const file = plugin.app.vault.getAbstractFileByPath(normalizedPath);
+    if (!(file instanceof TFile) || file.extension !== 'md') {
+      results.push({
+        path: normalizedPath,
+        success: false,
+        changed: false,
+        error: `Invalid file path or not a .md file: ${normalizedPath}`,
+      });
+      continue;
+    }
+
+    try {
+      await plugin.app.fileManager.processFrontMatter(file, (fm) => {
+        // Work on a copy so a failing operation leaves the note untouched.
+        const draft = structuredClone(fm) as Record<string, unknown>;
+        for (const op of ops) applyOperation(draft, op);
+        if (JSON.stringify(draft) === JSON.stringify(fm)) throw NO_CHANGES;
+        for (const key of Object.keys(fm)) delete fm[key];
+        Object.assign(fm, draft);
+      });
+      results.push({ path: normalizedPath, success: true, changed: true });
+    } catch (error) {
+      if (error === NO_CHANGES) {
+        results.push({ path: normalizedPath, success: true, changed: false });
+        continue;
+      }
+      results.push({
+        path: normalizedPath,
+        success: false,
+        changed: false,
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  }
+  plugin.logInfo(
+    `Processed frontmatter for ${results.length} note(s), ${results.filter((r) => r.changed).length} changed.`
+  );
+  return results;
+}
@@ -0,0 +1,342 @@
+// --- src/api/move-many.ts ---
+// Bulk move/rename with a single link-update pass (move_many).
+
+import {
+  Notice,
+  TAbstractFile,
+  TFile,
+  TFolder,
+  normalizePath,
+  parseLinktext,
+} from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+import { t } from '../lang/translations';
+import { MOVE_MANY_PROGRESS_INTERVAL } from '../constants';
+
+/** One requested move, as vault-relative paths. */
+export interface MoveRequest {
+  from: string;
+  to: string;
+}
+
+/** A link occurrence that must be rewritten after the moves. */
+interface PendingLink {
+  start: number;
+  end: number;
+  original: string;
+  /** Path of the link target before the moves. */
+  target: string;
+}
+
+/** Summary of a dry run. */
+export interface MoveManyPlan {
+  dry_run: true;
+  moves: number;
+  files_moved: number;
+  files_to_rewrite: string[];
+  links_to_update: number;
+}
+
+/** Summary of an executed bulk move. */
+export interface MoveManyResult {
+  dry_run: false;
+  moved: number;
+  files_moved: number;
+  files_rewritten: string[];
+  links_updated: number;
+  links_skipped: number;
+  failed: { from: string; to: string; error: string }[];
+}
+
+/** Validates the moves; returns one message per invalid move. */
+function validateMoves(
+  plugin: ObsidianPythonBridge,
+  moves: MoveRequest[]
+): string[] {
+  const { vault } = plugin.app;
+  const errors: string[] = [];
+  const sources = new Set<string>();
+  const destinations = new Set<string>();
+  for (const { from, to } of moves) {
+    if (!vault.getAbstractFileByPath(from))
+      errors.push(`Source path not found: "${from}"`);
+    else if (from === to)
+      errors.push(`Old path and new path are identical: "${from}"`);
+    else if (vault.getAbstractFileByPath(to))
+      errors.push(`Destination path already exists: "${to}"`);
+    else if (destinations.has(to))
+      errors.push(`Destination used more than once: "${to}"`);
+    else if (sources.has(from))
+      errors.push(`Source moved more than once: "${from}"`);
+    sources.add(from);
+    destinations.add(to);
+  }
+  // A folder and one of its descendants cannot both be moved.
+  for (const from of sources) {
+    const parts = from.split('/');
+    for (let i = parts.length - 1; i > 0; i--) {
+      if (sources.has(parts.slice(0, i).join('/'))) {
+        errors.push(`Source is inside another moved folder: "${from}"`);
+        break;
+      }
+    }
+  }
+  return errors;
+}
+
+/** Maps the old path of every file affected by the moves to its new path. */
+function mapMovedFiles(
+  plugin: ObsidianPythonBridge,
+  moves: MoveRequest[]
+): Map<string, string> {
+  const fileMoves = new Map<string, string>();
+  const visit = (item: TAbstractFile, from: string, to: string) => {
+    if (item instanceof TFile) {
+      fileMoves.set(item.path, to + item.path.slice(from.length));
+    } else if (item instanceof TFolder) {
+      for (const child of item.children) visit(child, from, to);
+    }
+  };
+  for (const { from, to } of moves) {
+    const item = plugin.app.vault.getAbstractFileByPath(from);
+    if (item) visit(item, from, to);
+  }
+  return fileMoves;
+}
+
+/**
+ * Finds the link occurrences to rewrite: links to a moved file, and
+ * path-based links inside a moved note (their meaning depends on the
+ * note's location). Must run before the moves, while the metadata cache
+ * still describes the current layout.
+ */
+function findLinksToRewrite(
+  plugin: ObsidianPythonBridge,
+  fileMoves: Map<string, string>
+): Map<string, PendingLink[]> {
+  const { metadataCache } = plugin.app;
+  const sources = new Set<string>();
+  for (const [source, targets] of Object.entries(
+    metadataCache.resolvedLinks
+  )) {
+    if (fileMoves.has(source)) sources.add(source);
+    else if (Object.keys(targets).some((target) => fileMoves.has(target)))
+      sources.add(source);
+  }
+
+  const pending = new Map<string, PendingLink[]>();
+  for (const source of sources) {
+    const cache = metadataCache.getCache(source);
+    const refs = [...(cache?.links ?? []), ...(cache?.embeds ?? [])];
+    const sourceMoved = fileMoves.has(source);
+    const links: PendingLink[] = [];
+    for (const ref of refs) {
+      const { path: linkpath } = parseLinktext(ref.link);
+      if (!linkpath) continue; // Same-note heading/block link
+      const dest = metadataCache.getFirstLinkpathDest(linkpath, source);
+      if (!dest) continue;
+      const pathBased = linkpath.includes('/');
+      const newTarget = fileMoves.get(dest.path);
+      // Name-only links keep resolving as long as the file name is kept.
+      const targetChanged =
+        newTarget !== undefined &&
+        (pathBased || baseName(newTarget) !== dest.name);
+      if (!targetChanged && !(sourceMoved && pathBased)) continue;
+      links.push({
+        start: ref.position.start.offset,
+        end: ref.position.end.offset,
+        original: ref.original,
+        target: dest.path,
+      });
+    }
+    if (links.length) pending.set(source, links);
+  }
+  return pending;
+}
+
+function baseName(filePath: string): string {
+  return filePath.slice(filePath.lastIndexOf('/') + 1);
+}
+
+/**
+ * Rebuilds a link so it points to `target` from `sourcePath`, keeping its
+ * style (wikilink or Markdown), embed marker, subpath and display text.
+ * @returns The new link text, or null if the link syntax is not recognized.
+ */
+function rewriteLink(
+  plugin: ObsidianPythonBridge,
+  original: string,
+  target: TFile,
+  sourcePath: string
+): string | null {
+  const { metadataCache } = plugin.app;
+  const wiki = /^(!?\[\[)([^\]|#^]*)([\s\S]*)$/.exec(original);
+  if (wiki) {
+    const omitExtension = !wiki[2].toLowerCase().endsWith('.md');
+    const linktext = metadataCache.fileToLinktext(
+      target,
+      sourcePath,
+      omitExtension
+    );
+    return `${wiki[1]}${linktext}${wiki[3]}`;
+  }
+  const markdown = /^(!?\[[^\]]*\]\()(<[^>#]*|[^)#\s]*)([\s\S]*)$/.exec(
+    original
+  );
+  if (markdown) {
+    const linktext = metadataCache.fileToLinktext(target, sourcePath, false);
+    // <angle-bracketed> destinations may contain spaces; others are encoded.
+    const destination = markdown[2].startsWith('<')
+      ? `<${linktext}`
+      : encodeURI(linktext);
+    return `${markdown[1]}${destination}${markdown[3]}`;
+  }
+  return null;
+}
+
+/** Creates the missing ancestor folders of a path, top-down. */
+async function ensureParentFolder(
+  plugin: ObsidianPythonBridge,
+  itemPath: string
+): Promise<void> {
+  const parts = itemPath.split('/').slice(0, -1);
+  for (let i = 1; i <= parts.length; i++) {
+    const folderPath = parts.slice(0, i).join('/');
+    if (!plugin.app.vault.getAbstractFileByPath(folderPath))
+      await plugin.app.vault.createFolder(folderPath);
+  }
+}
+
+/**
+ * Moves/renames many files and folders, then updates every affected link
+ * in a single pass (each referencing note is rewritten at most once),
+ * instead of letting each rename update links separately.
+ * A progress notice is shown while the operation runs.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param moves The moves to perform, as vault-relative paths.
+ * @param dryRun Only report what would be moved and rewritten.
+ * @returns The plan (dry run) or the summary of the operation.
+ * @throws Error if any move is invalid (nothing is moved in that case).
+ */
+export async function moveMany(
+  plugin: ObsidianPythonBridge,
+  moves: MoveRequest[],
+  dryRun: boolean
+): Promise<MoveManyPlan | MoveManyResult> {
+  const normalized = moves.map(({ from, to }) => ({
+    from: normalizePath(from),
+    to: normalizePath(to),
+  }));
+  const errors = validateMoves(plugin, normalized);
+  if (errors.length)
+    throw new Error(
+      `Invalid moves (${errors.length}): ${errors.slice(0, 10).join('; ')}${errors.length > 10 ? '; ...' : ''}`
+    );
+
+  const fileMoves = mapMovedFiles(plugin, normalized);
+  const pending = findLinksToRewrite(plugin, fileMoves);
+  let linkCount = 0;
+  for (const links of pending.values()) linkCount += links.length;
+  if (dryRun)
+    return {
+      dry_run: true,
+      moves: normalized.length,
+      files_moved: fileMoves.size,
+      files_to_rewrite: Array.from(pending.keys()).sort(),
+      links_to_update: linkCount,
+    };
+
+  const { vault } = plugin.app;
+  const notice = new Notice('', 0);
+  const progress = (key: string, done: number, total: number) => {
+    if (done % MOVE_MANY_PROGRESS_INTERVAL !== 0 && done !== total) return;
+    notice.setMessage(
+      t(key)
+        .replace('{done}', String(done))
+        .replace('{total}', String(total))
+    );
+  };
+  const result: MoveManyResult = {
+    dry_run: false,
+    moved: 0,
+    files_moved: 0,
+    files_rewritten: [],
+    links_updated: 0,
+    links_skipped: 0,
+    failed: [],
+  };
+
+  try {
+    // --- 1. Moves (vault.rename does not touch links) ---
+    for (const [i, { from, to }] of normalized.entries()) {
+      const item = vault.getAbstractFileByPath(from);
+      try {
+        if (!item) throw new Error(`Source path not found: "${from}"`);
+        await ensureParentFolder(plugin, to);
+        await vault.rename(item, to);
+        result.moved++;
+      } catch (error) {
+        result.failed.push({
+          from,
+          to,
+          error: error instanceof Error ? error.message : String(error),
+        });
+        // Links to the files of a failed move stay as they are.
+        for (const [oldPath, newPath] of fileMoves)
+          if (newPath === to || newPath.startsWith(`${to}/`))
+            fileMoves.delete(oldPath);
+      }
+      progress('NOTICE_MOVE_MANY_PROGRESS', i + 1, normalized.length);
+    }
+    result.files_moved = fileMoves.size;
+
+    // --- 2. One rewrite per referencing note ---
+    let done = 0;
+    for (const [source, links] of pending) {
+      progress('NOTICE_MOVE_MANY_LINKS_PROGRESS', ++done, pending.size);
+      const sourcePath = fileMoves.get(source) ?? source;
+      const file = vault.getAbstractFileByPath(sourcePath);
+      if (!(file instanceof TFile)) {
+        result.links_skipped += links.length;
+        continue;
+      }
+      let updated = 0;
+      let skipped = 0;
+      await vault.process(file, (content) => {
+        updated = 0;
+        skipped = 0;
+        // Apply from the end so earlier offsets stay valid.
+        for (const link of [...links].sort((a, b) => b.start - a.start)) {
+          const targetPath = fileMoves.get(link.target) ?? link.target;
+          const target = vault.getAbstractFileByPath(targetPath);
+          // Skip links edited since they were indexed.
+          const replacement =
+            target instanceof TFile &&
+            content.slice(link.start, link.end) === link.original
+              ? rewriteLink(plugin, link.original, target, sourcePath)
+              : null;
+          if (replacement === null) {
+            skipped++;
+          } else if (replacement !== link.original) {
+            content =
+              content.slice(0, link.start) +
+              replacement +
+              content.slice(link.end);
+            updated++;
+          }
+        }
+        return content;
+      });
+      result.links_updated += updated;
+      result.links_skipped += skipped;
+      if (updated) result.files_rewritten.push(sourcePath);
+    }
+  } finally {
+    notice.hide();
+  }
+  result.files_rewritten.sort();
+  plugin.logInfo(
+    `move_many: ${result.moved}/${normalized.length} moves, ${result.links_updated} links updated in ${result.files_rewritten.length} notes, ${result.failed.length} failed.`
+  );
+  return result;
+}
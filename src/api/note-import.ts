@@ -0,0 +1,169 @@
+// --- src/api/note-import.ts ---
+// Streamed bulk note creation (import_notes).
+
+import { EventRef, TFile, TFolder, normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+import {
+  IMPORT_NOTES_INDEX_WAIT_MS,
+  IMPORT_NOTES_MAX_UNINDEXED,
+} from '../constants';
+
+/** What to do when an imported path already exists. */
+export type ImportIfExists = 'error' | 'skip' | 'overwrite';
+
+/** A failed item of an import, identified by its position in the stream. */
+export interface ImportFailure {
+  index: number;
+  path: string;
+  error: string;
+}
+
+/** Summary returned once the whole import stream has been applied. */
+export interface ImportNotesResult {
+  received: number;
+  created: number;
+  overwritten: number;
+  skipped: number;
+  folders_created: number;
+  failed: ImportFailure[];
+}
+
+/**
+ * Creates notes one by one as they arrive on an import stream.
+ *
+ * Parent folders are created once, the first time a note needs them.
+ * `write` returns a promise while more than IMPORT_NOTES_MAX_UNINDEXED
+ * imported notes are still waiting to be indexed by the metadata cache;
+ * the stream handler awaits it before reading more of the request body, so
+ * the producer is throttled to the indexer's pace (back-pressure).
+ * Failures are recorded per item and do not stop the import.
+ */
+export class NoteImporter {
+  private knownFolders = new Set<string>();
+  private unindexed = new Set<string>();
+  private indexWaiter: (() => void) | null = null;
+  private metadataRef: EventRef;
+  private result: ImportNotesResult = {
+    received: 0,
+    created: 0,
+    overwritten: 0,
+    skipped: 0,
+    folders_created: 0,
+    failed: [],
+  };
+
+  constructor(
+    private plugin: ObsidianPythonBridge,
+    private ifExists: ImportIfExists
+  ) {
+    this.metadataRef = plugin.app.metadataCache.on('changed', (file) => {
+      this.unindexed.delete(file.path);
+      // Resume once the indexer has caught up with half of the backlog.
+      if (
+        this.indexWaiter &&
+        this.unindexed.size <= IMPORT_NOTES_MAX_UNINDEXED / 2
+      )
+        this.indexWaiter();
+    });
+  }
+
+  /**
+   * Imports one note.
+   * @param item The stream item: {path, content}.
+   * @returns A promise to await before sending more data if the indexer lags.
+   */
+  async write(item: Record<string, unknown>): Promise<void> {
+    const index = this.result.received++;
+    const rawPath = item.path;
+    if (typeof rawPath !== 'string' || !rawPath) {
+      this.fail(
+        index,
+        String(rawPath ?? ''),
+        "Invalid item: 'path' (non-empty string) required."
+      );
+      return;
+    }
+    const content = typeof item.content === 'string' ? item.content : '';
+    const notePath = normalizePath(rawPath);
+    const { vault } = this.plugin.app;
+    try {
+      const existing = vault.getAbstractFileByPath(notePath);
+      if (existing) {
+        if (this.ifExists === 'skip') {
+          this.result.skipped++;
+          return;
+        }
+        if (this.ifExists === 'error' || !(existing instanceof TFile))
+          throw new Error(`File already exists at path: ${notePath}`);
+        await vault.modify(existing, content);
+        this.result.overwritten++;
+      } else {
+        await this.ensureParentFolder(notePath);
+        await vault.create(notePath, content);
+        this.result.created++;
+      }
+    } catch (error) {
+      this.fail(
+        index,
+        notePath,
+        error instanceof Error ? error.message : String(error)
+      );
+      return;
+    }
+    if (notePath.endsWith('.md')) this.unindexed.add(notePath);
+    if (this.unindexed.size > IMPORT_NOTES_MAX_UNINDEXED)
+      await this.waitForIndexer();
+  }
+
+  /** Stops tracking the indexer and returns the import summary. */
+  async finish(): Promise<ImportNotesResult> {
+    this.abort();
+    this.plugin.logInfo(
+      `Imported notes: ${this.result.created} created, ${this.result.overwritten} overwritten, ${this.result.skipped} skipped, ${this.result.failed.length} failed.`
+    );
+    return this.result;
+  }
+
+  /** Stops tracking the indexer (stream aborted). */
+  abort(): void {
+    this.plugin.app.metadataCache.offref(this.metadataRef);
+    this.indexWaiter?.();
+  }
+
+  private fail(index: number, notePath: string, error: string): void {
+    this.result.failed.push({ index, path: notePath, error });
+  }
+
+  /** Creates the missing ancestors of a note path, top-down, once each. */
+  private async ensureParentFolder(notePath: string): Promise<void> {
+    const parts = notePath.split('/').slice(0, -1);
+    for (let i = 1; i <= parts.length; i++) {
+      const folderPath = parts.slice(0, i).join('/');
+      if (this.knownFolders.has(folderPath)) continue;
+      const existing = this.plugin.app.vault.getAbstractFileByPath(folderPath);
+      if (!existing) {
+        await this.plugin.app.vault.createFolder(folderPath);
+        this.result.folders_created++;
+      } else if (!(existing instanceof TFolder)) {
+        throw new Error(`Parent path is a file, not a folder: ${folderPath}`);
+      }
+      this.knownFolders.add(folderPath);
+    }
+  }
+
+  /** Waits until the indexer catches up, or IMPORT_NOTES_INDEX_WAIT_MS. */
+  private waitForIndexer(): Promise<void> {
+    return new Promise((resolve) => {
+      const done = () => {
+        window.clearTimeout(timer);
+        this.indexWaiter = null;
+        // Notes that never get indexed must not block the import forever.
+        if (this.unindexed.size > IMPORT_NOTES_MAX_UNINDEXED)
+          this.unindexed.clear();
+        resolve();
+      };
+      const timer = window.setTimeout(done, IMPORT_NOTES_INDEX_WAIT_MS);
+      this.indexWaiter = done;
+    });
+  }
+}
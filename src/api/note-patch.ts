@@ -0,0 +1,185 @@
+// --- src/api/note-patch.ts ---
+// Applies compact edit operations (or a unified diff) to a note by path.
+
+import { TFile, normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+import { hashContent } from './content-hash';
+
+/**
+ * A single edit operation. Offsets are UTF-16 code unit offsets into the
+ * *base* content (before any operation of the same patch is applied).
+ */
+export type PatchOperation =
+  | { op: 'insert'; start: number; text: string }
+  | { op: 'delete'; start: number; end: number }
+  | { op: 'replace'; start: number; end: number; text: string };
+
+/** Result of a successful patch. */
+export interface PatchResult {
+  applied: number;
+  hash: string;
+  length: number;
+}
+
+/**
+ * Validates raw operations from a payload and returns them sorted by offset.
+ * @throws Error if an operation is malformed, out of range, or overlaps another.
+ */
+function normalizeOperations(
+  rawOps: unknown[],
+  contentLength: number
+): { start: number; end: number; text: string }[] {
+  const edits = rawOps.map((raw, index) => {
+    const op = raw as Record<string, unknown>;
+    const start = op?.start;
+    const end = op?.op === 'insert' ? start : op?.end;
+    const text = op?.op === 'delete' ? '' : op?.text;
+    if (
+      !['insert', 'delete', 'replace'].includes(op?.op as string) ||
+      !Number.isInteger(start) ||
+      !Number.isInteger(end) ||
+      typeof text !== 'string'
+    )
+      throw new Error(`Invalid patch operation at index ${index}.`);
+    if ((start as number) < 0 || (end as number) < (start as number))
+      throw new Error(`Invalid range in patch operation at index ${index}.`);
+    if ((end as number) > contentLength)
+      throw new Error(
+        `Patch operation at index ${index} is out of range (content length ${contentLength}).`
+      );
+    return { start: start as number, end: end as number, text };
+  });
+  edits.sort((a, b) => a.start - b.start || a.end - b.end);
+  for (let i = 1; i < edits.length; i++) {
+    if (edits[i].start < edits[i - 1].end)
+      throw new Error('Patch operations must not overlap.');
+  }
+  return edits;
+}
+
+/**
+ * Applies edit operations to content. Operations are applied back to front
+ * so the offsets of earlier operations stay valid.
+ */
+function applyOperations(content: string, rawOps: unknown[]): string {
+  const edits = normalizeOperations(rawOps, content.length);
+  const parts: string[] = [];
+  let cursor = content.length;
+  for (let i = edits.length - 1; i >= 0; i--) {
+    const { start, end, text } = edits[i];
+    parts.push(content.slice(end, cursor), text);
+    cursor = start;
+  }
+  parts.push(content.slice(0, cursor));
+  return parts.reverse().join('');
+}
+
+/**
+ * Applies a unified diff to content, checking every context and removed
+ * line against the current content.
+ * @throws Error if the diff is malformed or does not match the content.
+ */
+function applyUnifiedDiff(content: string, diff: string): string {
+  // Keep line endings so untouched lines are copied byte for byte.
+  const lines = content.match(/[^\n]*\n|[^\n]+$/g) ?? [];
+  const diffLines = diff.split('\n');
+  if (diffLines[diffLines.length - 1] === '') diffLines.pop();
+  const output: string[] = [];
+  let source = 0; // Index of the next unconsumed line in `lines`
+  let i = 0;
+
+  while (i < diffLines.length) {
+    const header = /^@@ -(\d+)(?:,(\d+))? \+\d+(?:,\d+)? @@/.exec(
+      diffLines[i]
+    );
+    if (!header) {
+      i++; // Skip file headers (---/+++) and anything before the first hunk
+      continue;
+    }
+    // A zero-length hunk ("-N,0") inserts *after* line N.
+    const hunkStart =
+      header[2] === '0' ? Number(header[1]) : Number(header[1]) - 1;
+    if (hunkStart < source || hunkStart > lines.length)
+      throw new Error(`Unified diff hunk out of order or range: ${header[0]}`);
+    output.push(...lines.slice(source, hunkStart));
+    source = hunkStart;
+    i++;
+
+    for (; i < diffLines.length && !diffLines[i].startsWith('@@'); i++) {
+      const line = diffLines[i];
+      const marker = line[0];
+      const body = line.slice(1);
+      if (marker === '\\') {
+        // "\ No newline at end of file" applies to the previous line.
+        const last = output.length - 1;
+        if (diffLines[i - 1]?.startsWith('+') && last >= 0)
+          output[last] = output[last].replace(/\n$/, '');
+        continue;
+      }
+      if (marker === '+') {
+        output.push(body + '\n');
+        continue;
+      }
+      if (marker !== ' ' && marker !== '-')
+        throw new Error(`Malformed unified diff line: ${line}`);
+      const current = lines[source];
+      if (current === undefined || current.replace(/\n$/, '') !== body)
+        throw new Error(
+          `Unified diff does not match the note content at line ${source + 1}.`
+        );
+      if (marker === ' ') output.push(current);
+      source++;
+    }
+  }
+  output.push(...lines.slice(source));
+  return output.join('');
+}
+
+/**
+ * Patches a note in place using app.vault.process, so the read-modify-write
+ * happens atomically against the current file content.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param relativePath The vault-relative path of the note to patch.
+ * @param edits Either a list of edit operations or a unified diff string.
+ * @param baseHash Optional SHA-256 of the content the edits were computed
+ *   against; the patch is rejected if the note has changed since.
+ * @returns The number of operations applied and the new content hash.
+ * @throws Error if the file is not found, the base hash does not match, or
+ *   the edits cannot be applied.
+ */
+export async function patchNoteByPath(
+  plugin: ObsidianPythonBridge,
+  relativePath: string,
+  edits: { ops: unknown[] } | { diff: string },
+  baseHash?: string
+): Promise<PatchResult> {
+  const normalizedPath = normalizePath(relativePath);
+  const file = plugin.app.vault.getAbstractFileByPath(normalizedPath);
+  if (!(file instanceof TFile))
+    throw new Error(
+      `Cannot patch note: File not found in vault at path: ${normalizedPath}`
+    );
+
+  let newContent = '';
+  await plugin.app.vault.process(file, (data) => {
+    if (baseHash && hashContent(data) !== baseHash)
+      throw new Error(
+        `Conflict: ${normalizedPath} has changed since the base version (hash mismatch).`
+      );
+    newContent =
+      'ops' in edits
+        ? applyOperations(data, edits.ops)
+        : applyUnifiedDiff(data, edits.diff);
+    return newContent;
+  });
+
+  const applied = 'ops' in edits ? edits.ops.length : 1;
+  plugin.logInfo(
+    `Note patched successfully: ${normalizedPath} (${applied} edit(s))`
+  );
+  return {
+    applied,
+    hash: hashContent(newContent),
+    length: newContent.length,
+  };
+}
@@ -0,0 +1,34 @@
+// --- src/api/script-settings.ts ---
+// Resolves the effective settings values of a Python script.
+
+import { normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from '../main';
+
+/**
+ * Gets the current settings values of a script, falling back to the
+ * defaults declared in its settings definitions.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param scriptRelativePath The script path relative to the scripts folder.
+ * @returns A map of setting keys to values (empty if the script has no settings).
+ */
+export function getScriptSettingsValues(
+  plugin: ObsidianPythonBridge,
+  scriptRelativePath: string
+): Record<string, string | number | boolean> {
+  const relativePath = normalizePath(scriptRelativePath);
+  const definitions =
+    plugin.settings.scriptSettingsDefinitions[relativePath] || [];
+  const storedValues = plugin.settings.scriptSettingsValues[relativePath] || {};
+
+  // Merge: stored value wins, fallback to definition default
+  const finalValues: Record<string, string | number | boolean> = {};
+  for (const def of definitions) {
+    finalValues[def.key] = Object.prototype.hasOwnProperty.call(
+      storedValues,
+      def.key
+    )
+      ? storedValues[def.key]
+      : def.default;
+  }
+  return finalValues;
+}
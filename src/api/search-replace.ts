@@ -0,0 +1,240 @@
+// --- src/api/search-replace.ts ---
+// Vault-wide search and replace run inside Obsidian (search_replace), so
+// scripts receive match counts and previews instead of every note's content.
+
+import type ObsidianPythonBridge from '../main';
+import { globToRegExp } from './file-listing';
+import { mapWithConcurrency } from '../concurrency';
+import {
+  SEARCH_REPLACE_PREVIEW_MAX_LENGTH,
+  SEARCH_REPLACE_READ_CONCURRENCY,
+} from '../constants';
+
+/** What to search for and how to replace it. */
+export interface SearchReplaceOptions {
+  pattern: string;
+  replacement: string;
+  /** Glob matched against note paths; all Markdown notes when absent. */
+  glob?: string;
+  /** JavaScript regular expression (true) or literal text (false). */
+  regex: boolean;
+  /** Regular expression flags besides `g` (i, m, s, u). */
+  flags: string;
+  /** Only report the matches, do not modify any note. */
+  dryRun: boolean;
+  /** Previews returned per note. */
+  maxPreviews: number;
+}
+
+/** One match, shown on the line(s) it occurs in. */
+export interface SearchReplacePreview {
+  /** 1-based line number of the start of the match. */
+  line: number;
+  before: string;
+  after: string;
+}
+
+/** Notes with matches, with the first previews. */
+export interface SearchReplaceFile {
+  path: string;
+  matches: number;
+  previews: SearchReplacePreview[];
+}
+
+export interface SearchReplaceResult {
+  dry_run: boolean;
+  files_scanned: number;
+  files_matched: number;
+  matches: number;
+  files: SearchReplaceFile[];
+  /** Notes written (empty for a dry run). */
+  files_changed: string[];
+  failed: { path: string; error: string }[];
+}
+
+/**
+ * Builds the search expression (always global).
+ * @throws SyntaxError If the pattern or flags are invalid.
+ */
+export function buildSearchRegExp(
+  pattern: string,
+  regex: boolean,
+  flags: string
+): RegExp {
+  const source = regex
+    ? pattern
+    : pattern.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+  return new RegExp(source, `g${flags}`);
+}
+
+/**
+ * Expands `$$`, `$&`, `` $` ``, `$'`, `$n`, `$nn` and `$<name>` in a
+ * replacement template, like String.prototype.replace does.
+ */
+function expandReplacement(
+  template: string,
+  match: string,
+  captures: (string | undefined)[],
+  position: number,
+  input: string,
+  groups: Record<string, string | undefined> | undefined
+): string {
+  return template.replace(
+    /\$(\$|&|`|'|\d{1,2}|<([^>]*)>)/g,
+    (token: string, spec: string, name: string | undefined) => {
+      if (spec === '$') return '$';
+      if (spec === '&') return match;
+      if (spec === '`') return input.slice(0, position);
+      if (spec === "'") return input.slice(position + match.length);
+      if (name !== undefined) return groups ? (groups[name] ?? '') : token;
+      // $nn if that group exists, else $n followed by a digit
+      let index = Number(spec);
+      let rest = '';
+      if (spec.length === 2 && (index < 1 || index > captures.length)) {
+        index = Number(spec[0]);
+        rest = spec[1];
+      }
+      if (index < 1 || index > captures.length) return token;
+      return (captures[index - 1] ?? '') + rest;
+    }
+  );
+}
+
+/** Cuts a preview line around a column to at most the preview length. */
+function clip(text: string, column: number): string {
+  if (text.length <= SEARCH_REPLACE_PREVIEW_MAX_LENGTH) return text;
+  const start = Math.max(
+    0,
+    Math.min(column - 40, text.length - SEARCH_REPLACE_PREVIEW_MAX_LENGTH)
+  );
+  const clipped = text.slice(start, start + SEARCH_REPLACE_PREVIEW_MAX_LENGTH);
+  return `${start > 0 ? '…' : ''}${clipped}${start + SEARCH_REPLACE_PREVIEW_MAX_LENGTH < text.length ? '…' : ''}`;
+}
+
+/**
+ * Replaces every match in `content`, in one pass.
+ * @returns The new content, the number of matches and up to `maxPreviews`
+ *   previews.
+ */
+function replaceInContent(
+  content: string,
+  re: RegExp,
+  options: SearchReplaceOptions
+): { text: string; matches: number; previews: SearchReplacePreview[] } {
+  let matches = 0;
+  const previews: SearchReplacePreview[] = [];
+  re.lastIndex = 0;
+  const text = content.replace(re, (match: string, ...args: unknown[]) => {
+    // Arguments: captures..., offset, input[, groups]
+    const hasGroups = typeof args[args.length - 1] === 'object';
+    const groups = hasGroups
+      ? (args.pop() as Record<string, string | undefined> | undefined)
+      : undefined;
+    const input = args.pop() as string;
+    const offset = args.pop() as number;
+    const replacement = options.regex
+      ? expandReplacement(
+          options.replacement,
+          match,
+          args as (string | undefined)[],
+          offset,
+          input,
+          groups
+        )
+      : options.replacement;
+    if (previews.length < options.maxPreviews) {
+      const lineStart = input.lastIndexOf('\n', offset - 1) + 1;
+      const endIndex = input.indexOf('\n', offset + match.length);
+      const lineEnd = endIndex === -1 ? input.length : endIndex;
+      const prefix = input.slice(lineStart, offset);
+      const suffix = input.slice(offset + match.length, lineEnd);
+      previews.push({
+        line: input.slice(0, lineStart).split('\n').length,
+        before: clip(prefix + match + suffix, prefix.length),
+        after: clip(prefix + replacement + suffix, prefix.length),
+      });
+    }
+    matches++;
+    return replacement;
+  });
+  return { text, matches, previews };
+}
+
+/**
+ * Searches Markdown notes (optionally filtered by a glob) and replaces the
+ * matches, reading and writing each note inside Obsidian. Only notes whose
+ * content changes are written, each with one vault.process call (which
+ * re-applies the replacement to the current content).
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param options The search, replacement and reporting options.
+ * @returns Match counts, the matching notes with previews and, unless
+ *   dry-running, the notes written and the ones that failed.
+ */
+export async function searchReplace(
+  plugin: ObsidianPythonBridge,
+  options: SearchReplaceOptions
+): Promise<SearchReplaceResult> {
+  const { vault } = plugin.app;
+  const re = buildSearchRegExp(options.pattern, options.regex, options.flags);
+  const globRe = options.glob ? globToRegExp(options.glob) : null;
+  const notes = vault
+    .getMarkdownFiles()
+    .filter((file) => !globRe || globRe.test(file.path))
+    .sort((a, b) => (a.path < b.path ? -1 : a.path > b.path ? 1 : 0));
+
+  const result: SearchReplaceResult = {
+    dry_run: options.dryRun,
+    files_scanned: notes.length,
+    files_matched: 0,
+    matches: 0,
+    files: [],
+    files_changed: [],
+    failed: [],
+  };
+  // Notes are written as they are scanned, so only a few contents are held
+  // at a time. Each call gets its own RegExp: lastIndex is shared state.
+  const found = await mapWithConcurrency(
+    notes,
+    SEARCH_REPLACE_READ_CONCURRENCY,
+    async (file): Promise<SearchReplaceFile | null> => {
+      let replaced: ReturnType<typeof replaceInContent>;
+      try {
+        const content = await vault.cachedRead(file);
+        const searchRe = new RegExp(re);
+        if (!searchRe.test(content)) return null;
+        replaced = replaceInContent(content, searchRe, options);
+        if (!options.dryRun && replaced.text !== content) {
+          // Re-applied to the current content, which may differ from the cache
+          let changed = false;
+          await vault.process(file, (current) => {
+            replaced = replaceInContent(current, new RegExp(re), options);
+            changed = replaced.text !== current;
+            return replaced.text;
+          });
+          if (changed) result.files_changed.push(file.path);
+        }
+      } catch (error) {
+        result.failed.push({
+          path: file.path,
+          error: error instanceof Error ? error.message : String(error),
+        });
+        return null;
+      }
+      const { matches, previews } = replaced;
+      return matches ? { path: file.path, matches, previews } : null;
+    }
+  );
+
+  for (const entry of found) {
+    if (!entry) continue;
+    result.files_matched++;
+    result.matches += entry.matches;
+    result.files.push(entry);
+  }
+  result.files_changed.sort();
+  result.failed.sort((a, b) => (a.path < b.path ? -1 : 1));
+  plugin.logInfo(
+    `search_replace: ${result.matches} matches in ${result.files_matched}/${result.files_scanned} notes, ${result.files_changed.length} written, ${result.failed.length} failed${options.dryRun ? ' (dry run)' : ''}.`
+  );
+  return result;
+}
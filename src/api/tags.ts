@@ -1,6 +1,7 @@
 // --- src/api/tags.ts ---
 // Retrieves all unique tags from the Obsidian metadata cache.
 
+import { getAllTags as getNoteTags } from 'obsidian';
 import type ObsidianPythonBridge from '../main';
 
 /**
@@ -30,3 +31,92 @@ export function getAllTags(plugin: ObsidianPythonBridge): string[] {
     );
   }
 }
+
+interface TagStats {
+  count: number;
+  notes: Set<string>;
+}
+
+/** One entry of the tag index. */
+export interface TagIndexEntry {
+  /** Occurrences of exactly this tag. */
+  count: number;
+  /** Notes containing exactly this tag (sorted). */
+  notes: string[];
+  /** Occurrences of this tag and all its nested tags. */
+  total_count: number;
+  /** Distinct notes containing this tag or any of its nested tags. */
+  total_notes: number;
+}
+
+/**
+ * Builds a tag → notes index from the metadata cache in a single pass.
+ * Frontmatter and inline tags are both counted. Nested tags are aggregated
+ * into their parents: '#a/b' counts towards the totals of '#a', which is
+ * listed even if it is never used on its own.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param prefix Only include this tag and its nested tags (with or without '#').
+ * @returns The index, keyed by tag (including '#'), sorted by tag.
+ */
+export function getTagIndex(
+  plugin: ObsidianPythonBridge,
+  prefix: string | null
+): Record<string, TagIndexEntry> {
+  const wanted = prefix
+    ? (prefix.startsWith('#') ? prefix : `#${prefix}`).toLowerCase()
+    : null;
+  const matches = (tag: string) => {
+    const lower = tag.toLowerCase();
+    return !wanted || lower === wanted || lower.startsWith(`${wanted}/`);
+  };
+
+  const direct = new Map<string, TagStats>();
+  const aggregated = new Map<string, TagStats>();
+  const bump = (
+    map: Map<string, TagStats>,
+    tag: string,
+    notePath: string,
+    count: number
+  ) => {
+    let entry = map.get(tag);
+    if (!entry) {
+      entry = { count: 0, notes: new Set() };
+      map.set(tag, entry);
+    }
+    entry.count += count;
+    entry.notes.add(notePath);
+  };
+
+  const { metadataCache } = plugin.app;
+  for (const file of plugin.app.vault.getMarkdownFiles()) {
+    const cache = metadataCache.getFileCache(file);
+    const tags = cache ? getNoteTags(cache) : null;
+    if (!tags) continue;
+    const counts = new Map<string, number>();
+    for (const tag of tags) counts.set(tag, (counts.get(tag) ?? 0) + 1);
+    for (const [tag, count] of counts) {
+      bump(direct, tag, file.path, count);
+      // '#a/b/c' also counts towards '#a/b' and '#a'.
+      const parts = tag.split('/');
+      for (let i = parts.length; i > 0; i--)
+        bump(aggregated, parts.slice(0, i).join('/'), file.path, count);
+    }
+  }
+
+  const index: Record<string, TagIndexEntry> = {};
+  for (const tag of Array.from(aggregated.keys()).sort()) {
+    if (!matches(tag)) continue;
+    const own = direct.get(tag);
+    const total = aggregated.get(tag) as TagStats;
+    index[tag] = {
+      count: own?.count ?? 0,
+      notes: own ? Array.from(own.notes).sort() : [],
+      total_count: total.count,
+      total_notes: total.notes.size,
+    };
+  }
+  plugin.logDebug(
+    `Built tag index with ${Object.keys(index).length} tags${wanted ? ` under ${wanted}` : ''}.`
+  );
+  return index;
+}
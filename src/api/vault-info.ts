@@ -22,6 +22,31 @@ export function getCurrentVaultAbsolutePath(
   return null;
 }
 
+/**
+ * Converts an absolute filesystem path inside the vault to a vault-relative path.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param absolutePath The absolute path of a file inside the vault.
+ * @returns The normalized vault-relative path.
+ * @throws Error if the vault path is unavailable or the path is outside the vault.
+ */
+export function toVaultRelativePath(
+  plugin: ObsidianPythonBridge,
+  absolutePath: string
+): string {
+  const vaultAbsPath = getCurrentVaultAbsolutePath(plugin);
+  if (!vaultAbsPath) throw new Error('Vault path unavailable for conversion.');
+
+  const vaultPathWithSeparator = vaultAbsPath.endsWith(path.sep)
+    ? vaultAbsPath
+    : vaultAbsPath + path.sep;
+  if (!absolutePath.startsWith(vaultPathWithSeparator)) {
+    throw new Error(
+      `Path is outside the current vault. File='${absolutePath}' Vault='${vaultAbsPath}'`
+    );
+  }
+  return normalizePath(path.relative(vaultAbsPath, absolutePath));
+}
+
 /**
  * Gets the list of all Markdown file paths in the vault.
  * @param plugin The ObsidianPythonBridge plugin instance.
@@ -5,6 +5,7 @@ import * as fs from 'fs';
 import * as path from 'path';
 import type ObsidianPythonBridge from './main';
 import type { AuditLogEntry } from './types';
+import { AUDIT_LOG_FLUSH_BYTES, AUDIT_LOG_FLUSH_DELAY_MS } from './constants';
 
 /**
  * Gets the default audit log file path in the plugin directory.
@@ -59,8 +60,157 @@ export function rotateLogFiles(
   }
 }
 
+/** Log file settings, read from the plugin settings at write time. */
+interface AuditLogTarget {
+  logFilePath: string;
+  maxLogFileSize: number;
+  maxLogFiles: number;
+}
+
+/**
+ * Buffers audit log entries and appends them to the log file in batches, off
+ * the request path: after AUDIT_LOG_FLUSH_DELAY_MS, or as soon as
+ * AUDIT_LOG_FLUSH_BYTES are pending. Batches are written one at a time, in
+ * order. The size of the log file is tracked in memory (stat-ed once), so
+ * rotation needs no per-entry file system calls.
+ */
+export class AuditLogWriter {
+  private pending: string[] = [];
+  private pendingBytes = 0;
+  private flushTimer: number | null = null;
+  /** The batch being written, if any; the next batch waits for it. */
+  private writing: Promise<void> = Promise.resolve();
+  /** Number of batches queued on `writing` that have not finished. */
+  private batchesInFlight = 0;
+  /** Known size of each log file written to, in bytes. */
+  private fileSizes = new Map<string, number>();
+
+  constructor(private plugin: ObsidianPythonBridge) {}
+
+  /** Queues an entry; cheap enough to call on every request. */
+  append(entry: AuditLogEntry): void {
+    const line = JSON.stringify(entry) + '\n';
+    this.pending.push(line);
+    this.pendingBytes += Buffer.byteLength(line, 'utf8');
+    if (this.pendingBytes >= AUDIT_LOG_FLUSH_BYTES) {
+      this.writePending();
+    } else if (this.flushTimer === null) {
+      this.flushTimer = window.setTimeout(
+        () => this.writePending(),
+        AUDIT_LOG_FLUSH_DELAY_MS
+      );
+    }
+  }
+
+  /**
+   * Writes the pending entries (plugin unload): synchronously when no batch
+   * is being written, otherwise queued after the batches in flight, so that
+   * entries stay in order and only one write path rotates the file at a time.
+   */
+  flush(): void {
+    if (this.batchesInFlight) {
+      this.writePending();
+      return;
+    }
+    const data = this.takePending();
+    if (!data) return;
+    const target = this.target();
+    try {
+      fs.mkdirSync(path.dirname(target.logFilePath), { recursive: true });
+      rotateLogFiles(
+        target.logFilePath,
+        target.maxLogFileSize,
+        target.maxLogFiles
+      );
+      fs.appendFileSync(target.logFilePath, data, 'utf8');
+    } catch (error) {
+      this.plugin.logError('Failed to write audit log entries:', error);
+    }
+    this.fileSizes.delete(target.logFilePath);
+  }
+
+  /** Starts an asynchronous write of the pending entries. */
+  private writePending(): void {
+    const data = this.takePending();
+    if (!data) return;
+    this.batchesInFlight++;
+    this.writing = this.writing
+      .then(() => this.writeBatch(data))
+      .catch((error) => {
+        this.plugin.logError('Failed to write audit log entries:', error);
+      })
+      .finally(() => {
+        this.batchesInFlight--;
+      });
+  }
+
+  private takePending(): string {
+    if (this.flushTimer !== null) {
+      window.clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    const data = this.pending.join('');
+    this.pending = [];
+    this.pendingBytes = 0;
+    return data;
+  }
+
+  private async writeBatch(data: string): Promise<void> {
+    const { logFilePath, maxLogFileSize, maxLogFiles } = this.target();
+    let size = this.fileSizes.get(logFilePath);
+    if (size === undefined) {
+      await fs.promises.mkdir(path.dirname(logFilePath), { recursive: true });
+      size = await fs.promises.stat(logFilePath).then(
+        (stats) => stats.size,
+        () => 0 // Not created yet
+      );
+    }
+    if (size >= maxLogFileSize) {
+      await this.rotate(logFilePath, maxLogFiles);
+      size = 0;
+    }
+    try {
+      await fs.promises.appendFile(logFilePath, data, 'utf8');
+      this.fileSizes.set(logFilePath, size + Buffer.byteLength(data, 'utf8'));
+    } catch (error) {
+      this.fileSizes.delete(logFilePath); // Stat again next time
+      throw error;
+    }
+  }
+
+  /** Asynchronous counterpart of rotateLogFiles, without the size check. */
+  private async rotate(
+    logFilePath: string,
+    maxLogFiles: number
+  ): Promise<void> {
+    const ignoreMissing = (error: NodeJS.ErrnoException) => {
+      if (error.code !== 'ENOENT') throw error;
+    };
+    await fs.promises
+      .unlink(`${logFilePath}.${maxLogFiles}`)
+      .catch(ignoreMissing);
+    for (let i = maxLogFiles - 1; i >= 1; i--) {
+      await fs.promises
+        .rename(`${logFilePath}.${i}`, `${logFilePath}.${i + 1}`)
+        .catch(ignoreMissing);
+    }
+    await fs.promises
+      .rename(logFilePath, `${logFilePath}.1`)
+      .catch(ignoreMissing);
+  }
+
+  private target(): AuditLogTarget {
+    const { auditLog } = this.plugin.settings;
+    return {
+      logFilePath: auditLog.logFilePath || getDefaultLogFilePath(this.plugin),
+      maxLogFileSize: auditLog.maxLogFileSize || 10485760, // 10MB default
+      maxLogFiles: auditLog.maxLogFiles || 5,
+    };
+  }
+}
+
 /**
- * Writes an audit log entry to the log file.
+ * Queues an audit log entry for writing (see AuditLogWriter).
  * @param plugin The ObsidianPythonBridge plugin instance.
  * @param entry The audit log entry to write.
  */
@@ -71,30 +221,7 @@ export function writeAuditLogEntry(
   if (!plugin.settings.auditLog.enabled) {
     return;
   }
-
-  try {
-    const logFilePath =
-      plugin.settings.auditLog.logFilePath || getDefaultLogFilePath(plugin);
-    const maxLogFileSize = plugin.settings.auditLog.maxLogFileSize || 10485760; // 10MB default
-    const maxLogFiles = plugin.settings.auditLog.maxLogFiles || 5;
-
-    // Ensure log directory exists
-    const logDir = path.dirname(logFilePath);
-    if (!fs.existsSync(logDir)) {
-      fs.mkdirSync(logDir, { recursive: true });
-    }
-
-    // Rotate logs if necessary
-    rotateLogFiles(logFilePath, maxLogFileSize, maxLogFiles);
-
-    // Format log entry as JSON string with newline
-    const logLine = JSON.stringify(entry) + '\n';
-
-    // Append to log file
-    fs.appendFileSync(logFilePath, logLine, 'utf8');
-  } catch (error) {
-    plugin.logError('Failed to write audit log entry:', error);
-  }
+  plugin.auditLogWriter.append(entry);
 }
 
 /**
@@ -105,6 +232,7 @@ export function writeAuditLogEntry(
  * @param status The execution status ('start', 'success', 'error').
  * @param exitCode The exit code (optional).
  * @param error The error message (optional).
+ * @param durationMs How long the run took, in milliseconds (optional).
  */
 export function logScriptExecution(
   plugin: ObsidianPythonBridge,
@@ -112,7 +240,8 @@ export function logScriptExecution(
   triggerType: string,
   status: 'start' | 'success' | 'error',
   exitCode?: number,
-  error?: string
+  error?: string,
+  durationMs?: number
 ): void {
   const entry: AuditLogEntry = {
     timestamp: new Date().toISOString(),
@@ -122,6 +251,7 @@ export function logScriptExecution(
     status: status === 'start' ? undefined : status,
     exitCode: status !== 'start' ? exitCode : undefined,
     error: status === 'error' ? error : undefined,
+    durationMs: status !== 'start' ? durationMs : undefined,
   };
 
   writeAuditLogEntry(plugin, entry);
@@ -0,0 +1,100 @@
+// --- src/binary_handler.ts ---
+// Handles binary (application/octet-stream) requests. The action and the
+// target path travel in headers, the file content is the raw request or
+// response body, so attachments never go through JSON or base64.
+//
+//   X-Obsidian-Action: read_binary | write_binary
+//   X-Obsidian-Path: <vault-relative path, percent-encoded>
+//   X-Obsidian-Overwrite: true | false   (write_binary, default true)
+//   X-Obsidian-Script: <calling script's relative path, percent-encoded>
+
+import type * as http from 'http';
+import type ObsidianPythonBridge from './main';
+import { readBinaryFile, writeBinaryFile } from './obsidian_api';
+import { logApiAction } from './audit_logger';
+import { readRequestBody, RequestBodyTooLargeError } from './http_body';
+
+function header(req: http.IncomingMessage, name: string): string | null {
+  const value = req.headers[name];
+  return typeof value === 'string' ? value : null;
+}
+
+/** Returns a percent-encoded header's value, or null if absent or invalid. */
+function decodedHeader(
+  req: http.IncomingMessage,
+  name: string
+): string | null {
+  const value = header(req, name);
+  try {
+    return value === null ? null : decodeURIComponent(value);
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Serves a binary request and writes the response.
+ * read_binary answers with the raw file bytes; write_binary and every
+ * error answer with the usual JSON envelope.
+ *
+ * @param plugin - The plugin instance.
+ * @param req    - The incoming HTTP request (body not yet consumed).
+ * @param res    - The response to write.
+ */
+export async function handleBinaryRequest(
+  plugin: ObsidianPythonBridge,
+  req: http.IncomingMessage,
+  res: http.ServerResponse
+): Promise<void> {
+  const action = header(req, 'x-obsidian-action') ?? '';
+  const sourceScript = decodedHeader(req, 'x-obsidian-script') ?? undefined;
+  const fail = (statusCode: number, message: string) => {
+    plugin.logError(`Error executing binary action "${action}":`, message);
+    logApiAction(plugin, action || 'unknown', 'error', sourceScript, message);
+    plugin.sendJsonResponse(res, statusCode, {
+      status: 'error',
+      error: `Failed to execute action "${action}": ${message}`,
+    });
+  };
+
+  const filePath = decodedHeader(req, 'x-obsidian-path');
+  if (!filePath) {
+    req.resume();
+    fail(400, "'X-Obsidian-Path' header (non-empty, percent-encoded) required.");
+    return;
+  }
+
+  try {
+    if (action === 'read_binary') {
+      req.resume(); // No request body expected
+      const data = Buffer.from(await readBinaryFile(plugin, filePath));
+      logApiAction(plugin, action, 'success', sourceScript);
+      if (res.writableEnded) return;
+      res.writeHead(200, {
+        'Content-Type': 'application/octet-stream',
+        'Content-Length': data.byteLength,
+      });
+      res.end(data);
+      plugin.logDebug(`Binary response sent (${data.byteLength} bytes).`);
+    } else if (action === 'write_binary') {
+      const body = await readRequestBody(
+        req,
+        plugin.settings.maxRequestBodySize
+      );
+      const data = body.buffer.slice(
+        body.byteOffset,
+        body.byteOffset + body.byteLength
+      );
+      const overwrite = header(req, 'x-obsidian-overwrite') !== 'false';
+      const result = await writeBinaryFile(plugin, filePath, data, overwrite);
+      logApiAction(plugin, action, 'success', sourceScript);
+      plugin.sendJsonResponse(res, 200, { status: 'success', data: result });
+    } else {
+      req.resume();
+      fail(200, `Unknown binary action: ${action}`);
+    }
+  } catch (error) {
+    const statusCode = error instanceof RequestBodyTooLargeError ? 413 : 200;
+    fail(statusCode, error instanceof Error ? error.message : String(error));
+  }
+}
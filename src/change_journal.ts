@@ -0,0 +1,274 @@
+// --- src/change_journal.ts ---
+// Bounded, persisted journal of vault changes with resumable cursors.
+// Lets incremental scripts ask "what changed since cursor X?" instead of
+// re-enumerating the whole vault, even if they were not running when the
+// changes happened.
+
+import * as fs from 'fs';
+import * as path from 'path';
+import { TAbstractFile, TFile } from 'obsidian';
+import type ObsidianPythonBridge from './main';
+import {
+  CHANGE_JOURNAL_FILENAME,
+  CHANGE_JOURNAL_MAX_ENTRIES,
+  CHANGE_JOURNAL_SAVE_DELAY_MS,
+} from './constants';
+
+/** One recorded vault change. */
+export interface ChangeEntry {
+  seq: number;
+  type: 'create' | 'modify' | 'rename' | 'delete';
+  path: string;
+  old_path?: string;
+  kind: 'file' | 'folder';
+  /** Time the change was recorded (ms since epoch). */
+  time: number;
+}
+
+/** Result of a journal query. */
+export interface ChangesSince {
+  changes: ChangeEntry[];
+  /** Cursor to pass to the next query. */
+  cursor: string;
+  /** True if the given cursor cannot be resumed: rescan, then use `cursor`. */
+  reset: boolean;
+  /** True if more changes are available after `cursor`. */
+  has_more: boolean;
+}
+
+interface PersistedJournal {
+  epoch: string;
+  seq: number;
+  dropped: number;
+  savedAt: number;
+  entries: ChangeEntry[];
+}
+
+export class ChangeJournal {
+  /** Identifies this journal's sequence; changes if the journal is lost. */
+  private epoch = '';
+  private seq = 0;
+  /** Seq of the newest entry dropped to keep the journal bounded. */
+  private dropped = 0;
+  private entries: ChangeEntry[] = [];
+  private savedAt = 0;
+  private saveTimer: number | null = null;
+
+  constructor(private plugin: ObsidianPythonBridge) {}
+
+  private get filePath(): string | null {
+    return this.plugin.pluginDirAbsPath
+      ? path.join(this.plugin.pluginDirAbsPath, CHANGE_JOURNAL_FILENAME)
+      : null;
+  }
+
+  /**
+   * Loads the persisted journal and starts recording vault events.
+   * Must be called once the workspace layout is ready, so the `create`
+   * events fired while Obsidian indexes the vault at startup are not recorded.
+   */
+  start(): void {
+    this.load();
+    this.recordChangesWhileClosed();
+
+    const kind = (file: TAbstractFile) =>
+      file instanceof TFile ? 'file' : 'folder';
+    const { vault } = this.plugin.app;
+    this.plugin.registerEvent(
+      vault.on('create', (file) =>
+        this.record('create', file.path, kind(file))
+      )
+    );
+    this.plugin.registerEvent(
+      vault.on('modify', (file) =>
+        this.record('modify', file.path, kind(file))
+      )
+    );
+    this.plugin.registerEvent(
+      vault.on('delete', (file) =>
+        this.record('delete', file.path, kind(file))
+      )
+    );
+    this.plugin.registerEvent(
+      vault.on('rename', (file, oldPath) =>
+        this.record('rename', file.path, kind(file), oldPath)
+      )
+    );
+    this.plugin.logInfo(
+      `Change journal started (epoch ${this.epoch}, seq ${this.seq}, ${this.entries.length} entries).`
+    );
+  }
+
+  /** Writes pending changes to disk immediately (used on unload). */
+  flush(): void {
+    if (this.saveTimer !== null) {
+      window.clearTimeout(this.saveTimer);
+      this.saveTimer = null;
+      this.save(true);
+    }
+  }
+
+  /**
+   * Returns the changes recorded after a cursor.
+   * @param cursor A cursor from a previous query, or null to get a starting cursor.
+   * @param limit Maximum number of changes to return.
+   */
+  changesSince(cursor: string | null, limit: number): ChangesSince {
+    const current = `${this.epoch}:${this.seq}`;
+    const parsed = cursor ? /^([^:]+):(\d+)$/.exec(cursor) : null;
+    const sinceSeq = parsed ? Number(parsed[2]) : NaN;
+    // Not resumable: no/invalid cursor, another journal, or entries were
+    // dropped since (the caller missed changes and must rescan).
+    if (
+      !parsed ||
+      parsed[1] !== this.epoch ||
+      sinceSeq > this.seq ||
+      sinceSeq < this.dropped
+    ) {
+      return { changes: [], cursor: current, reset: true, has_more: false };
+    }
+
+    // Entries are sorted by seq: binary search the first one after the cursor.
+    let lo = 0;
+    let hi = this.entries.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.entries[mid].seq <= sinceSeq) lo = mid + 1;
+      else hi = mid;
+    }
+    const changes = this.entries.slice(lo, lo + limit);
+    const hasMore = lo + limit < this.entries.length;
+    return {
+      changes,
+      cursor: hasMore
+        ? `${this.epoch}:${changes[changes.length - 1].seq}`
+        : current,
+      reset: false,
+      has_more: hasMore,
+    };
+  }
+
+  private record(
+    type: ChangeEntry['type'],
+    filePath: string,
+    kind: ChangeEntry['kind'],
+    oldPath?: string
+  ): void {
+    const seq = ++this.seq;
+    const time = Date.now();
+    const last = this.entries[this.entries.length - 1];
+    if (
+      type === 'modify' &&
+      last?.type === 'modify' &&
+      last.path === filePath
+    ) {
+      // Coalesce bursts of saves to the same file: move the entry forward so
+      // readers who already saw it get it again, everyone else only once.
+      last.seq = seq;
+      last.time = time;
+    } else {
+      this.entries.push({
+        seq,
+        type,
+        path: filePath,
+        ...(oldPath !== undefined && { old_path: oldPath }),
+        kind,
+        time,
+      });
+      if (this.entries.length > CHANGE_JOURNAL_MAX_ENTRIES) {
+        const removed = this.entries.splice(
+          0,
+          this.entries.length - CHANGE_JOURNAL_MAX_ENTRIES
+        );
+        this.dropped = removed[removed.length - 1].seq;
+      }
+    }
+    this.scheduleSave();
+  }
+
+  /** Records files modified while Obsidian was closed (by mtime). */
+  private recordChangesWhileClosed(): void {
+    if (!this.savedAt) return;
+    let count = 0;
+    for (const file of this.plugin.app.vault.getFiles()) {
+      if (file.stat.mtime > this.savedAt) {
+        this.record('modify', file.path, 'file');
+        count++;
+      }
+    }
+    if (count)
+      this.plugin.logInfo(
+        `Change journal: ${count} file(s) modified while Obsidian was closed.`
+      );
+  }
+
+  private load(): void {
+    const filePath = this.filePath;
+    try {
+      if (filePath && fs.existsSync(filePath)) {
+        const data = JSON.parse(
+          fs.readFileSync(filePath, 'utf8')
+        ) as PersistedJournal;
+        if (
+          typeof data.epoch === 'string' &&
+          Number.isInteger(data.seq) &&
+          Array.isArray(data.entries)
+        ) {
+          this.epoch = data.epoch;
+          this.seq = data.seq;
+          this.dropped = data.dropped || 0;
+          this.savedAt = data.savedAt || 0;
+          this.entries = data.entries;
+          return;
+        }
+        this.plugin.logWarn('Change journal file is invalid, starting anew.');
+      }
+    } catch (error) {
+      this.plugin.logWarn(
+        'Could not load change journal, starting anew:',
+        error
+      );
+    }
+    // Fresh journal: a new epoch invalidates every previously issued cursor.
+    this.epoch = Date.now().toString(36);
+    this.seq = 0;
+    this.dropped = 0;
+    this.savedAt = 0;
+    this.entries = [];
+    this.scheduleSave();
+  }
+
+  private scheduleSave(): void {
+    if (this.saveTimer !== null) return;
+    this.saveTimer = window.setTimeout(() => {
+      this.saveTimer = null;
+      this.save(false);
+    }, CHANGE_JOURNAL_SAVE_DELAY_MS);
+  }
+
+  /** Persists the journal; asynchronously unless `sync` (plugin unload). */
+  private save(sync: boolean): void {
+    const filePath = this.filePath;
+    if (!filePath) return;
+    this.savedAt = Date.now();
+    const data: PersistedJournal = {
+      epoch: this.epoch,
+      seq: this.seq,
+      dropped: this.dropped,
+      savedAt: this.savedAt,
+      entries: this.entries,
+    };
+    const json = JSON.stringify(data);
+    const onError = (error: unknown) =>
+      this.plugin.logError('Could not save change journal:', error);
+    if (sync) {
+      try {
+        fs.writeFileSync(filePath, json);
+      } catch (error) {
+        onError(error);
+      }
+    } else {
+      fs.promises.writeFile(filePath, json).catch(onError);
+    }
+  }
+}
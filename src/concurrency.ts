@@ -0,0 +1,111 @@
+// --- src/concurrency.ts ---
+// Bounded parallelism for async work (e.g. spawning several Python processes).
+
+/**
+ * Maps items through an async function, running at most `limit` calls at once.
+ * Each call starts as soon as a previous one settles (a worker pool, not
+ * fixed batches), so one slow item does not hold back the others.
+ * @param items The items to process.
+ * @param limit Maximum number of concurrent calls (at least 1).
+ * @param fn The async function to apply.
+ * @returns The results, in the order of `items`.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+  const workers = Math.max(1, Math.min(limit, items.length));
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
+
+/**
+ * Runs async tasks with at most `limit` at once, starting a task only after
+ * the tasks it depends on have settled (successfully or not). Ready tasks
+ * start in the order of `items`.
+ * @param items The items to process (unique).
+ * @param limit Maximum number of concurrent calls (at least 1).
+ * @param dependenciesOf Returns the items an item must wait for. Items that
+ *   are not in `items` are ignored.
+ * @param fn The async function to apply. Its rejections are ignored, so it
+ *   should handle its own errors.
+ * @param onCycle Called with the members of a dependency cycle, in
+ *   dependency order, when the waiting items are all blocked by it. The
+ *   first of them (the earliest in `items`) is then started anyway.
+ */
+export async function runWithDependencies<T>(
+  items: readonly T[],
+  limit: number,
+  dependenciesOf: (item: T) => readonly T[],
+  fn: (item: T) => Promise<void>,
+  onCycle?: (blocked: T[]) => void
+): Promise<void> {
+  const members = new Set(items);
+  const waitingOn = new Map<T, Set<T>>();
+  for (const item of items)
+    waitingOn.set(
+      item,
+      new Set(dependenciesOf(item).filter((d) => d !== item && members.has(d)))
+    );
+  const pending = [...items];
+  let running = 0;
+
+  await new Promise<void>((resolve) => {
+    const schedule = () => {
+      while (running < Math.max(1, limit) && pending.length) {
+        let index = pending.findIndex((item) => !waitingOn.get(item)?.size);
+        if (index === -1) {
+          if (running) return; // A running task may unblock the others
+          const cycle = findCycle(pending, waitingOn);
+          onCycle?.(cycle);
+          index = pending.indexOf(cycle[0]);
+        }
+        const [item] = pending.splice(index, 1);
+        running++;
+        void fn(item)
+          .catch(() => undefined)
+          .finally(() => {
+            running--;
+            for (const waits of waitingOn.values()) waits.delete(item);
+            schedule();
+          });
+      }
+      if (!running && !pending.length) resolve();
+    };
+    schedule();
+  });
+}
+
+/**
+ * Finds a dependency cycle among blocked items: every pending item waits on
+ * another pending item, so following those edges must come back to an item.
+ * @returns The cycle members in dependency order, starting with the one
+ *   earliest in `pending`.
+ */
+function findCycle<T>(pending: readonly T[], waitingOn: Map<T, Set<T>>): T[] {
+  const position = new Map<T, number>();
+  const path: T[] = [];
+  let item = pending[0];
+  while (!position.has(item)) {
+    position.set(item, path.length);
+    path.push(item);
+    const waits = waitingOn.get(item);
+    item = pending.find((other) => waits?.has(other)) as T;
+  }
+  const cycle = path.slice(position.get(item));
+  const first = cycle.reduce(
+    (best, member, i) =>
+      pending.indexOf(member) < pending.indexOf(cycle[best]) ? i : best,
+    0
+  );
+  return [...cycle.slice(first), ...cycle.slice(0, first)];
+}
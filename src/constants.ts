@@ -5,5 +5,73 @@ export const DEFAULT_PORT = 27123;
 /** Timeout in ms for discovering script settings */
 export const SETTINGS_DISCOVERY_TIMEOUT = 5000; // 5 seconds
 
+/** Maximum number of scripts executed at once to discover their settings */
+export const SETTINGS_DISCOVERY_CONCURRENCY = 4;
+
+/** Upper bound of the "Run all scripts" parallelism setting */
+export const MAX_RUN_ALL_CONCURRENCY = 16;
+
+/** Static settings extractor, relative to the plugin folder (runs without executing scripts) */
+export const STATIC_SETTINGS_EXTRACTOR = 'obsidian_python_bridge/_static_settings.py';
+
+/** Fork server: module run with `python -m`, and its file relative to the plugin folder */
+export const FORK_SERVER_MODULE = 'obsidian_python_bridge._fork_server';
+export const FORK_SERVER_SCRIPT = 'obsidian_python_bridge/_fork_server.py';
+
 export const PYTHON_LIBRARY_FILENAME = 'ObsidianPluginDevPythonToJS.py';
+
+/** Maximum length (in characters) of a single line in a streamed (NDJSON) request */
+export const STREAM_MAX_LINE_LENGTH = 16 * 1024 * 1024; // 16M characters
+
+/** Interval at which buffered stream_insert chunks are flushed into the editor */
+export const STREAM_INSERT_FLUSH_INTERVAL_MS = 16; // ~one frame
+
+/** Buffered characters above which stream_insert stops reading the request body */
+export const STREAM_INSERT_HIGH_WATER_MARK = 64 * 1024;
+
+/** Characters before the stream_insert anchor used to find it again after edits */
+export const STREAM_INSERT_ANCHOR_CONTEXT_LENGTH = 256;
+
+/** import_notes: imported notes not yet indexed above which reading pauses */
+export const IMPORT_NOTES_MAX_UNINDEXED = 200;
+
+/** import_notes: longest pause waiting for the indexer before continuing anyway */
+export const IMPORT_NOTES_INDEX_WAIT_MS = 5000;
+
+/** move_many: number of processed items between progress notice updates */
+export const MOVE_MANY_PROGRESS_INTERVAL = 100;
+
+/** search_replace: notes read at once, previews per note (default) and preview line length */
+export const SEARCH_REPLACE_READ_CONCURRENCY = 16;
+export const SEARCH_REPLACE_DEFAULT_MAX_PREVIEWS = 3;
+export const SEARCH_REPLACE_PREVIEW_MAX_LENGTH = 200;
+
+/** Default and maximum number of records per list_files page */
+export const LIST_FILES_DEFAULT_PAGE_SIZE = 1000;
+export const LIST_FILES_MAX_PAGE_SIZE = 10000;
+
+/** HTTP server: default maximum request body size, and response write slice size */
+export const DEFAULT_MAX_REQUEST_BODY_SIZE = 100 * 1048576; // 100 MB
+export const HTTP_RESPONSE_CHUNK_SIZE = 1048576;
+
+/** Audit log: pending entries are appended after this delay, or at once past this size */
+export const AUDIT_LOG_FLUSH_DELAY_MS = 1000;
+export const AUDIT_LOG_FLUSH_BYTES = 64 * 1024;
+
+/** Event payloads: longest JSON passed in OBSIDIAN_EVENT_PAYLOAD (longer ones go through a temp file) */
+export const EVENT_PAYLOAD_ENV_MAX_LENGTH = 32 * 1024;
+/** Event payload diffs: notes whose last content is kept, and the largest content kept */
+export const EVENT_DIFF_CACHE_MAX_ENTRIES = 200;
+export const EVENT_DIFF_MAX_CONTENT_LENGTH = 1024 * 1024;
+
+/** Change journal: file name (in the plugin folder), size bound and save debounce */
+export const CHANGE_JOURNAL_FILENAME = 'change-journal.json';
+export const CHANGE_JOURNAL_MAX_ENTRIES = 10000;
+export const CHANGE_JOURNAL_SAVE_DELAY_MS = 2000;
+
+/** Content hash cache: number of notes read concurrently when hashing */
+export const CONTENT_HASH_READ_CONCURRENCY = 16;
+
+/** Response cache for read-only actions: maximum number of cached responses */
+export const RESPONSE_CACHE_MAX_ENTRIES = 256;
 // Add other constants here if needed in the future
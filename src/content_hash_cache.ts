@@ -0,0 +1,130 @@
+// --- src/content_hash_cache.ts ---
+// Caches note content hashes so scripts can detect changed notes without
+// transferring their content.
+
+import { TFile, normalizePath } from 'obsidian';
+import type ObsidianPythonBridge from './main';
+import { hashContent } from './api/content-hash';
+import { CONTENT_HASH_READ_CONCURRENCY } from './constants';
+
+/** Hash and stat of one file, as returned by get_note_hashes. */
+export interface NoteHash {
+  hash: string;
+  /** Modification time (ms since epoch). */
+  mtime: number;
+  size: number;
+}
+
+export class ContentHashCache {
+  private entries = new Map<string, NoteHash>();
+
+  constructor(private plugin: ObsidianPythonBridge) {}
+
+  /** Number of cached hashes. */
+  get size(): number {
+    return this.entries.size;
+  }
+
+  /** Starts dropping cached hashes when files change. */
+  start(): void {
+    const { vault } = this.plugin.app;
+    this.plugin.registerEvent(
+      vault.on('modify', (file) => this.entries.delete(file.path))
+    );
+    this.plugin.registerEvent(
+      vault.on('delete', (file) => this.entries.delete(file.path))
+    );
+    this.plugin.registerEvent(
+      vault.on('rename', (file, oldPath) => {
+        // Content is unchanged: keep the hash under the new path.
+        const entry = this.entries.get(oldPath);
+        this.entries.delete(oldPath);
+        if (entry && file instanceof TFile) this.entries.set(file.path, entry);
+      })
+    );
+  }
+
+  /**
+   * Returns the content hash, mtime and size of one file, from the cache
+   * when the file has not changed since it was last hashed.
+   * @param file The file to hash.
+   */
+  async getHash(file: TFile): Promise<NoteHash> {
+    return this.lookup(file) ?? this.compute(file);
+  }
+
+  /**
+   * Returns the content hash, mtime and size of many files.
+   * Hashes are computed once and reused until the file changes; a cached
+   * hash is also discarded if the file's mtime or size no longer match
+   * (changes made outside Obsidian that were not reported as events).
+   * @param paths Vault-relative paths, or null for all Markdown notes.
+   * @returns A map from path to hash info, with null for missing files.
+   */
+  async getHashes(
+    paths: string[] | null
+  ): Promise<Record<string, NoteHash | null>> {
+    const { vault } = this.plugin.app;
+    const result: Record<string, NoteHash | null> = {};
+    const toHash: TFile[] = [];
+
+    const files: (TFile | string)[] = paths
+      ? paths.map((p) => {
+          const file = vault.getAbstractFileByPath(normalizePath(p));
+          return file instanceof TFile ? file : p;
+        })
+      : vault.getMarkdownFiles();
+    for (const file of files) {
+      if (typeof file === 'string') {
+        result[file] = null;
+        continue;
+      }
+      const cached = this.lookup(file);
+      if (cached) result[file.path] = cached;
+      else toHash.push(file);
+    }
+
+    for (let i = 0; i < toHash.length; i += CONTENT_HASH_READ_CONCURRENCY) {
+      const batch = toHash.slice(i, i + CONTENT_HASH_READ_CONCURRENCY);
+      await Promise.all(
+        batch.map(async (file) => {
+          result[file.path] = await this.compute(file);
+        })
+      );
+    }
+    this.plugin.logDebug(
+      `Content hashes: ${Object.keys(result).length} requested, ${toHash.length} computed.`
+    );
+    return result;
+  }
+
+  /** Returns the cached hash of a file if it is still valid. */
+  lookup(file: TFile): NoteHash | null {
+    const cached = this.entries.get(file.path);
+    return cached &&
+      cached.mtime === file.stat.mtime &&
+      cached.size === file.stat.size
+      ? cached
+      : null;
+  }
+
+  /**
+   * Reads a file and hashes the content read, so the hash always matches
+   * the returned content. The hash is cached under the stat taken before
+   * the read, unless the file changed while it was being read (the content
+   * may then be either version).
+   * @param file The file to read.
+   */
+  async read(file: TFile): Promise<{ content: string; entry: NoteHash }> {
+    const { mtime, size } = file.stat;
+    const content = await this.plugin.app.vault.cachedRead(file);
+    const entry: NoteHash = { hash: hashContent(content), mtime, size };
+    if (file.stat.mtime === mtime && file.stat.size === size)
+      this.entries.set(file.path, entry);
+    return { content, entry };
+  }
+
+  private async compute(file: TFile): Promise<NoteHash> {
+    return (await this.read(file)).entry;
+  }
+}
@@ -3,11 +3,15 @@
 
 import { TFile, MarkdownView } from 'obsidian';
 import * as fs from 'fs';
+import * as os from 'os';
 import * as path from 'path';
-import { spawn } from 'child_process';
+import { randomBytes } from 'crypto';
 import type ObsidianPythonBridge from './main'; // Import the main plugin type
 import { getScriptsFolderPath } from './python_executor'; // Import helper
 import { buildPythonEnv, buildPythonArgs } from './python_env'; // DRY env construction
+import { launchPythonScript } from './fork_server';
+import type { EventPayloadField } from './event_payload';
+import { EVENT_PAYLOAD_ENV_MAX_LENGTH } from './constants';
 
 /**
  * Registers internal listeners for Obsidian events that can trigger Python scripts.
@@ -77,6 +81,8 @@ export function registerObsidianEventListeners(
 
 /**
  * Triggers the execution of Python scripts listening to a specific event.
+ * Note fields requested by the listeners (see EventPayloadBuilder) are read
+ * once and added to the payload of the listeners that asked for them.
  * @param plugin The ObsidianPythonBridge plugin instance.
  * @param eventName The name of the event being triggered.
  * @param payload Data associated with the event, must be JSON serializable.
@@ -84,7 +90,7 @@ export function registerObsidianEventListeners(
 export function triggerEvent(
   plugin: ObsidianPythonBridge,
   eventName: string,
-  payload: unknown
+  payload: Record<string, unknown>
 ): void {
   const listeningScripts = plugin.eventListeners.get(eventName);
   if (!listeningScripts || listeningScripts.size === 0) {
@@ -104,52 +110,109 @@ export function triggerEvent(
     return;
   }
 
-  let payloadJson: string;
-  try {
-    payloadJson = JSON.stringify(payload);
-  } catch (error) {
-    plugin.logError(
-      `Failed to serialize payload for event ${eventName}:`,
-      error
-    );
-    plugin.logError(`Original payload was:`, payload);
-    return;
-  }
+  // Snapshot the listeners: note fields are read asynchronously.
+  const listeners = [...listeningScripts];
+  const requestedFields = new Set<EventPayloadField>();
+  for (const [, fields] of listeners)
+    for (const field of fields) requestedFields.add(field);
 
-  listeningScripts.forEach((relativePath) => {
-    const absolutePath = path.join(scriptsFolder, relativePath);
-    // Check if script still exists and is active before running
-    if (plugin.settings.scriptActivationStatus[relativePath] !== false) {
+  void (async () => {
+    let extras: Partial<Record<EventPayloadField, unknown>> = {};
+    if (requestedFields.size) {
       try {
-        if (fs.existsSync(absolutePath) && fs.statSync(absolutePath).isFile()) {
-          plugin.logDebug(
-            `Running script ${relativePath} for event ${eventName}`
-          );
-          void runPythonScriptForEvent(
-            plugin,
-            absolutePath,
-            relativePath,
-            eventName,
-            payloadJson
-          );
-        } else {
-          plugin.logWarn(
-            `Script ${relativePath} registered for event ${eventName} not found at ${absolutePath}. Removing listener.`
-          );
-          removeListener(plugin, eventName, relativePath); // Clean up stale listener
-        }
+        extras = await plugin.eventPayloads.build(
+          typeof payload.path === 'string' ? payload.path : null,
+          requestedFields,
+          typeof payload.oldPath === 'string' ? payload.oldPath : undefined
+        );
       } catch (error) {
         plugin.logError(
-          `Error checking file status for event script ${absolutePath}:`,
+          `Failed to read note data for event ${eventName}:`,
           error
         );
       }
-    } else {
-      plugin.logDebug(
-        `Skipping event notification for ${relativePath}: Script is disabled.`
+    }
+
+    // Listeners asking for the same fields share one serialized payload.
+    // null marks a field set whose payload could not be serialized: its
+    // listeners are skipped, the others are still notified.
+    const payloadJsonByFields = new Map<string, string | null>();
+    for (const [relativePath, fields] of listeners) {
+      const fieldsKey = fields.join(',');
+      let payloadJson = payloadJsonByFields.get(fieldsKey);
+      if (payloadJson === undefined) {
+        const listenerPayload: Record<string, unknown> = { ...payload };
+        for (const field of fields)
+          listenerPayload[field] = extras[field] ?? null;
+        try {
+          payloadJson = JSON.stringify(listenerPayload);
+        } catch (error) {
+          plugin.logError(
+            `Failed to serialize payload for event ${eventName}${fields.length ? ` with fields ${fieldsKey}` : ''}:`,
+            error
+          );
+          plugin.logError(`Original payload was:`, payload);
+          payloadJson = null;
+        }
+        payloadJsonByFields.set(fieldsKey, payloadJson);
+      }
+      if (payloadJson === null) continue;
+      notifyListener(
+        plugin,
+        scriptsFolder,
+        eventName,
+        relativePath,
+        payloadJson
       );
     }
-  });
+  })();
+}
+
+/**
+ * Runs one listening script for an event, if it still exists and is active.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param scriptsFolder Absolute path to the Python scripts folder.
+ * @param eventName Name of the event.
+ * @param relativePath Relative path of the listening script.
+ * @param payloadJson JSON string payload for the event.
+ */
+function notifyListener(
+  plugin: ObsidianPythonBridge,
+  scriptsFolder: string,
+  eventName: string,
+  relativePath: string,
+  payloadJson: string
+): void {
+  const absolutePath = path.join(scriptsFolder, relativePath);
+  // Check if script still exists and is active before running
+  if (plugin.settings.scriptActivationStatus[relativePath] !== false) {
+    try {
+      if (fs.existsSync(absolutePath) && fs.statSync(absolutePath).isFile()) {
+        plugin.logDebug(`Running script ${relativePath} for event ${eventName}`);
+        void runPythonScriptForEvent(
+          plugin,
+          absolutePath,
+          relativePath,
+          eventName,
+          payloadJson
+        );
+      } else {
+        plugin.logWarn(
+          `Script ${relativePath} registered for event ${eventName} not found at ${absolutePath}. Removing listener.`
+        );
+        removeListener(plugin, eventName, relativePath); // Clean up stale listener
+      }
+    } catch (error) {
+      plugin.logError(
+        `Error checking file status for event script ${absolutePath}:`,
+        error
+      );
+    }
+  } else {
+    plugin.logDebug(
+      `Skipping event notification for ${relativePath}: Script is disabled.`
+    );
+  }
 }
 
 /**
@@ -158,7 +221,9 @@ export function triggerEvent(
  * @param scriptAbsolutePath Absolute path to the script.
  * @param scriptRelativePath Relative path (for logging/identification).
  * @param eventName Name of the event.
- * @param payloadJson JSON string payload for the event.
+ * @param payloadJson JSON string payload for the event. Payloads longer than
+ *   EVENT_PAYLOAD_ENV_MAX_LENGTH are passed in a temporary file
+ *   (OBSIDIAN_EVENT_PAYLOAD_FILE), deleted when the script exits.
  */
 async function runPythonScriptForEvent(
   plugin: ObsidianPythonBridge,
@@ -181,12 +246,36 @@ async function runPythonScriptForEvent(
     `Running event handler: ${pythonCmd} ${scriptAbsolutePath} for event ${eventName}`
   );
 
+  // Large payloads do not fit in the environment (size limits, e.g. on Windows)
+  let payloadFile: string | null = null;
+  if (payloadJson.length > EVENT_PAYLOAD_ENV_MAX_LENGTH) {
+    payloadFile = path.join(
+      os.tmpdir(),
+      `obsidian-bridge-event-${randomBytes(8).toString('hex')}.json`
+    );
+    try {
+      await fs.promises.writeFile(payloadFile, payloadJson, {
+        encoding: 'utf8',
+        mode: 0o600,
+      });
+    } catch (error) {
+      plugin.logError(
+        `Cannot run event script ${scriptRelativePath}: failed to write the event payload file:`,
+        error
+      );
+      return;
+    }
+  }
+
   // Build environment for event execution (includes event-specific env vars)
   const env = buildPythonEnv(plugin, scriptDir, {
     extraVars: {
       OBSIDIAN_EVENT_NAME: eventName,
-      OBSIDIAN_EVENT_PAYLOAD: payloadJson,
+      ...(payloadFile
+        ? { OBSIDIAN_EVENT_PAYLOAD_FILE: payloadFile }
+        : { OBSIDIAN_EVENT_PAYLOAD: payloadJson }),
     },
+    scriptRelativePath,
   });
 
   // Build command arguments
@@ -198,10 +287,16 @@ async function runPythonScriptForEvent(
 
   try {
     await new Promise<void>((resolve, reject) => {
-      const pythonProcess = spawn(pythonCmd, fullArgs, {
-        env, // Use the correctly defined env
-        cwd: scriptDir, // Set CWD
-      });
+      const pythonProcess = launchPythonScript(
+        plugin,
+        scriptAbsolutePath,
+        pythonCmd,
+        fullArgs,
+        {
+          env, // Use the correctly defined env
+          cwd: scriptDir, // Set CWD
+        }
+      );
 
       let stderrOutput = '';
       pythonProcess.stderr?.on('data', (data) => {
@@ -244,6 +339,8 @@ async function runPythonScriptForEvent(
     plugin.logWarn(
       `Event script ${scriptRelativePath} execution failed for event ${eventName}: ${error instanceof Error ? error.message : String(error)}`
     );
+  } finally {
+    if (payloadFile) fs.promises.unlink(payloadFile).catch(() => undefined);
   }
 }
 
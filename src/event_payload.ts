@@ -0,0 +1,163 @@
+// --- src/event_payload.ts ---
+// Optional note data embedded in event payloads, so event scripts do not
+// have to request the content or frontmatter of the note they react to.
+
+import { TFile, getFrontMatterInfo, parseYaml } from 'obsidian';
+import type ObsidianPythonBridge from './main';
+import { hashContent } from './api/content-hash';
+import {
+  EVENT_DIFF_CACHE_MAX_ENTRIES,
+  EVENT_DIFF_MAX_CONTENT_LENGTH,
+} from './constants';
+
+/** Fields a listener can request with register_event_listener. */
+export const EVENT_PAYLOAD_FIELDS = [
+  'content',
+  'frontmatter',
+  'mtime',
+  'size',
+  'hash',
+  'diff',
+] as const;
+
+export type EventPayloadField = (typeof EVENT_PAYLOAD_FIELDS)[number];
+
+/** Number of unchanged lines kept around the change in a diff. */
+const DIFF_CONTEXT_LINES = 3;
+
+/**
+ * Returns a unified diff turning `before` into `after`, as a single hunk
+ * spanning from the first to the last changed line (with context), or an
+ * empty string if they are equal. Applies with patch_note's `diff` form.
+ * @param before The previous content.
+ * @param after The new content.
+ */
+export function unifiedLineDiff(before: string, after: string): string {
+  if (before === after) return '';
+  // Lines keep their "\n", so a missing final newline counts as a change.
+  const a = before.match(/[^\n]*\n|[^\n]+$/g) ?? [];
+  const b = after.match(/[^\n]*\n|[^\n]+$/g) ?? [];
+  let prefix = 0;
+  while (prefix < a.length && prefix < b.length && a[prefix] === b[prefix])
+    prefix++;
+  let suffix = 0;
+  while (
+    suffix < a.length - prefix &&
+    suffix < b.length - prefix &&
+    a[a.length - 1 - suffix] === b[b.length - 1 - suffix]
+  )
+    suffix++;
+
+  const start = Math.max(0, prefix - DIFF_CONTEXT_LINES);
+  const endA = Math.min(a.length, a.length - suffix + DIFF_CONTEXT_LINES);
+  const endB = Math.min(b.length, b.length - suffix + DIFF_CONTEXT_LINES);
+  const hunk: string[] = [];
+  const add = (marker: string, lines: string[]) => {
+    for (const line of lines) {
+      if (line.endsWith('\n')) hunk.push(marker + line.slice(0, -1));
+      else hunk.push(marker + line, '\\ No newline at end of file');
+    }
+  };
+  add(' ', a.slice(start, prefix));
+  add('-', a.slice(prefix, a.length - suffix));
+  add('+', b.slice(prefix, b.length - suffix));
+  add(' ', a.slice(a.length - suffix, endA));
+  const range = (from: number, count: number) =>
+    `${count ? from + 1 : from},${count}`;
+  return `@@ -${range(start, endA - start)} +${range(start, endB - start)} @@\n${hunk.join('\n')}\n`;
+}
+
+/**
+ * Parses the frontmatter block of a note's content.
+ * @returns The properties, or null if there is no (valid) frontmatter.
+ */
+function parseFrontmatter(content: string): Record<string, unknown> | null {
+  const info = getFrontMatterInfo(content);
+  if (!info.exists) return null;
+  try {
+    const parsed: unknown = parseYaml(info.frontmatter);
+    return parsed && typeof parsed === 'object' && !Array.isArray(parsed)
+      ? (parsed as Record<string, unknown>)
+      : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Adds the requested note fields to event payloads. Keeps the last seen
+ * content of notes watched with `diff`, to diff the next version against.
+ */
+export class EventPayloadBuilder {
+  /** Last content seen per path (insertion order = least recently seen). */
+  private previousContents = new Map<string, string>();
+
+  constructor(private plugin: ObsidianPythonBridge) {}
+
+  /**
+   * Computes the requested fields for the file at `path` (a note for
+   * content, frontmatter, hash and diff). Fields that do not apply, e.g. for
+   * a deleted file or a folder, are null; `diff` is also null the first time
+   * a note is seen. Note fields all come from one read of the content, so
+   * they describe the same version (the metadata cache may not have parsed
+   * a just-modified note yet).
+   * @param path Vault-relative path of the file the event is about.
+   * @param fields The fields requested by at least one listener.
+   * @param oldPath The previous path, for renames.
+   */
+  async build(
+    path: string | null,
+    fields: ReadonlySet<EventPayloadField>,
+    oldPath?: string
+  ): Promise<Partial<Record<EventPayloadField, unknown>>> {
+    if (oldPath) this.rename(oldPath, path);
+    const extras: Partial<Record<EventPayloadField, unknown>> = {};
+    for (const field of fields) extras[field] = null;
+
+    const file = path ? this.plugin.app.vault.getAbstractFileByPath(path) : null;
+    if (!(file instanceof TFile)) {
+      if (path) this.previousContents.delete(path);
+      return extras;
+    }
+    if (fields.has('mtime')) extras.mtime = file.stat.mtime;
+    if (fields.has('size')) extras.size = file.stat.size;
+    if (file.extension !== 'md') return extras;
+    if (
+      !fields.has('content') &&
+      !fields.has('frontmatter') &&
+      !fields.has('hash') &&
+      !fields.has('diff')
+    )
+      return extras;
+
+    const content = await this.plugin.app.vault.cachedRead(file);
+    if (fields.has('content')) extras.content = content;
+    if (fields.has('frontmatter'))
+      extras.frontmatter = parseFrontmatter(content);
+    if (fields.has('hash')) extras.hash = hashContent(content);
+    if (fields.has('diff')) {
+      const previous = this.previousContents.get(file.path);
+      if (previous !== undefined)
+        extras.diff = unifiedLineDiff(previous, content);
+      this.remember(file.path, content);
+    }
+    return extras;
+  }
+
+  private remember(path: string, content: string): void {
+    this.previousContents.delete(path);
+    if (content.length > EVENT_DIFF_MAX_CONTENT_LENGTH) return;
+    this.previousContents.set(path, content);
+    if (this.previousContents.size > EVENT_DIFF_CACHE_MAX_ENTRIES) {
+      const oldest = this.previousContents.keys().next().value;
+      if (oldest !== undefined) this.previousContents.delete(oldest);
+    }
+  }
+
+  private rename(oldPath: string, path: string | null): void {
+    const previous = this.previousContents.get(oldPath);
+    this.previousContents.delete(oldPath);
+    if (previous !== undefined && path)
+      this.previousContents.set(path, previous);
+  }
+}
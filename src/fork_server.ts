@@ -0,0 +1,227 @@
+// --- src/fork_server.ts ---
+// Optional pre-warmed Python process that forks one child per script run
+// (see obsidian_python_bridge/_fork_server.py for the protocol). Runs get a
+// ChildProcess-like handle, so callers treat forked and spawned runs alike.
+
+import { ChildProcess, spawn } from 'child_process';
+import { EventEmitter } from 'events';
+import * as fs from 'fs';
+import * as path from 'path';
+import type ObsidianPythonBridge from './main';
+import { FORK_SERVER_MODULE, FORK_SERVER_SCRIPT } from './constants';
+
+/** The parts of a child process that script runners use. */
+export interface ScriptProcess {
+  /** Emits 'data' with output chunks (Buffer). */
+  stdout: EventEmitter | null;
+  /** Emits 'data' with output chunks (Buffer). */
+  stderr: EventEmitter | null;
+  on(event: 'error', listener: (error: Error) => void): this;
+  on(
+    event: 'close',
+    listener: (code: number | null, signal: NodeJS.Signals | null) => void
+  ): this;
+}
+
+/** A script run forked from the fork server. */
+class ForkedProcess extends EventEmitter implements ScriptProcess {
+  readonly stdout = new EventEmitter();
+  readonly stderr = new EventEmitter();
+  pid: number | undefined;
+}
+
+/** One message from the fork server (one JSON line on its stdout). */
+interface ForkServerMessage {
+  ready?: boolean;
+  id?: number;
+  pid?: number;
+  stream?: 'stdout' | 'stderr';
+  data?: string;
+  exit?: number | null;
+  signal?: NodeJS.Signals | null;
+  error?: string;
+}
+
+export class ForkServer {
+  private process: ChildProcess | null = null;
+  /** Python executable the running server was started with. */
+  private executable: string | null = null;
+  private ready = false;
+  private runs = new Map<number, ForkedProcess>();
+  private nextId = 1;
+  private buffer = '';
+
+  constructor(private plugin: ObsidianPythonBridge) {}
+
+  /** True if script runs can be forked from the server right now. */
+  get available(): boolean {
+    return (
+      this.ready &&
+      this.process !== null &&
+      this.executable === this.plugin.pythonExecutable
+    );
+  }
+
+  /**
+   * Starts, restarts or stops the server to match the settings and the
+   * current Python executable. Cheap to call when nothing changed.
+   */
+  update(): void {
+    if (!this.isSupported()) {
+      this.stop();
+      return;
+    }
+    if (this.process && this.executable === this.plugin.pythonExecutable)
+      return;
+    this.stop();
+    this.start();
+  }
+
+  /** Stops the server. Runs still in progress report an error. */
+  stop(): void {
+    const serverProcess = this.process;
+    if (!serverProcess) return;
+    this.process = null;
+    this.ready = false;
+    serverProcess.stdin?.end(); // The server exits when its stdin closes
+    serverProcess.kill();
+    this.failPendingRuns('Fork server stopped.');
+    this.plugin.logInfo('Fork server stopped.');
+  }
+
+  /**
+   * Forks a run of a script. Only call when `available` is true.
+   * @param scriptPath Absolute path to the script.
+   * @param options Environment and working directory of the run.
+   */
+  run(
+    scriptPath: string,
+    options: { env: Record<string, string>; cwd: string }
+  ): ScriptProcess {
+    const id = this.nextId++;
+    const run = new ForkedProcess();
+    this.runs.set(id, run);
+    const request = {
+      id,
+      script: scriptPath,
+      args: [],
+      cwd: options.cwd,
+      env: options.env,
+    };
+    this.process?.stdin?.write(`${JSON.stringify(request)}\n`, (error) => {
+      if (error && this.runs.delete(id)) run.emit('error', error);
+    });
+    return run;
+  }
+
+  /**
+   * Whether the fork server can be used: enabled in the settings, a POSIX
+   * system (fork), a plain Python interpreter (`uv run` resolves per-script
+   * dependencies, which a shared interpreter cannot) and the library
+   * installed in the plugin folder.
+   */
+  private isSupported(): boolean {
+    const { pythonExecutable, pluginDirAbsPath, settings } = this.plugin;
+    return (
+      settings.useForkServer &&
+      process.platform !== 'win32' &&
+      !!pythonExecutable &&
+      pythonExecutable !== 'uv' &&
+      !!pluginDirAbsPath &&
+      fs.existsSync(path.join(pluginDirAbsPath, FORK_SERVER_SCRIPT))
+    );
+  }
+
+  private start(): void {
+    const executable = this.plugin.pythonExecutable as string;
+    const pluginDir = this.plugin.pluginDirAbsPath as string;
+    this.plugin.logInfo(`Starting fork server with ${executable}...`);
+    const serverProcess = spawn(executable, ['-m', FORK_SERVER_MODULE], {
+      cwd: pluginDir,
+      env: { ...process.env } as Record<string, string>,
+    });
+    this.process = serverProcess;
+    this.executable = executable;
+    this.buffer = '';
+
+    serverProcess.stdout?.on('data', (data: Buffer) => {
+      // Messages are ASCII JSON (base64 output), so chunks split safely.
+      const lines = (this.buffer + data.toString()).split('\n');
+      this.buffer = lines.pop() ?? '';
+      for (const line of lines) if (line.trim()) this.handleMessage(line);
+    });
+    serverProcess.stderr?.on('data', (data: Buffer) => {
+      this.plugin.logWarn(`[fork server stderr]: ${data.toString().trim()}`);
+    });
+    serverProcess.on('error', (error) => {
+      this.plugin.logError(`Fork server failed to start: ${error.message}`);
+    });
+    serverProcess.on('close', (code) => {
+      if (this.process !== serverProcess) return; // Stopped on purpose
+      this.process = null;
+      this.ready = false;
+      this.failPendingRuns(`Fork server exited with code ${code}.`);
+      this.plugin.logWarn(
+        `Fork server exited with code ${code}; scripts are spawned normally until it restarts.`
+      );
+    });
+  }
+
+  private handleMessage(line: string): void {
+    let message: ForkServerMessage;
+    try {
+      message = JSON.parse(line) as ForkServerMessage;
+    } catch {
+      this.plugin.logWarn(`Invalid message from fork server: ${line}`);
+      return;
+    }
+    if (message.ready) {
+      this.ready = true;
+      this.plugin.logInfo(`Fork server ready (pid ${message.pid}).`);
+      return;
+    }
+    const run = message.id !== undefined ? this.runs.get(message.id) : null;
+    if (!run) return;
+    if (message.stream && message.data !== undefined) {
+      run[message.stream].emit('data', Buffer.from(message.data, 'base64'));
+    } else if (message.exit !== undefined) {
+      this.runs.delete(message.id as number);
+      run.emit('close', message.exit, message.signal ?? null);
+    } else if (message.error !== undefined) {
+      this.runs.delete(message.id as number);
+      run.emit('error', new Error(message.error));
+    } else if (message.pid !== undefined) {
+      run.pid = message.pid;
+    }
+  }
+
+  private failPendingRuns(reason: string): void {
+    const runs = [...this.runs.values()];
+    this.runs.clear();
+    for (const run of runs) run.emit('error', new Error(reason));
+  }
+}
+
+/**
+ * Starts a script run: forked from the fork server when it is available,
+ * spawned as a new process otherwise.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param scriptPath Absolute path to the script.
+ * @param command Command to spawn the script with (see buildPythonArgs).
+ * @param args Arguments to spawn the script with.
+ * @param options Environment and working directory of the run.
+ */
+export function launchPythonScript(
+  plugin: ObsidianPythonBridge,
+  scriptPath: string,
+  command: string,
+  args: string[],
+  options: { env: Record<string, string>; cwd: string }
+): ScriptProcess {
+  if (plugin.forkServer.available) {
+    plugin.logDebug(`Forking ${scriptPath} from the fork server.`);
+    return plugin.forkServer.run(scriptPath, options);
+  }
+  plugin.forkServer.update(); // (Re)start it for the next runs, if enabled
+  return spawn(command, args, options);
+}
@@ -0,0 +1,76 @@
+// --- src/http_body.ts ---
+// Request body collection and response writing for the HTTP server, without
+// string concatenation or repeated copies of large payloads.
+
+import type * as http from 'http';
+import { HTTP_RESPONSE_CHUNK_SIZE } from './constants';
+
+/** Thrown when a request body exceeds the configured maximum size. */
+export class RequestBodyTooLargeError extends Error {
+  constructor(readonly maxBytes: number) {
+    super(
+      `Request body exceeds the maximum size of ${Math.floor(maxBytes / 1048576)} MB.`
+    );
+    this.name = 'RequestBodyTooLargeError';
+  }
+}
+
+/**
+ * Collects a request body into one Buffer (chunks are joined once, at the end).
+ * A body larger than `maxBytes` is drained and discarded, so the client can
+ * still read the error response.
+ * @param req The incoming request (body not yet consumed).
+ * @param maxBytes Maximum body size in bytes.
+ * @throws RequestBodyTooLargeError If the body is too large.
+ */
+export async function readRequestBody(
+  req: http.IncomingMessage,
+  maxBytes: number
+): Promise<Buffer> {
+  const chunks: Buffer[] = [];
+  let size = 0;
+  // Rejected up front when the declared length is too large (NaN if absent)
+  let tooLarge = Number(req.headers['content-length']) > maxBytes;
+  for await (const chunk of req as AsyncIterable<Buffer>) {
+    if (tooLarge) continue;
+    size += chunk.byteLength;
+    if (size > maxBytes) {
+      tooLarge = true;
+      chunks.length = 0;
+      continue;
+    }
+    chunks.push(chunk);
+  }
+  if (tooLarge) throw new RequestBodyTooLargeError(maxBytes);
+  return chunks.length === 1 ? chunks[0] : Buffer.concat(chunks, size);
+}
+
+/**
+ * Writes a complete response body. Large bodies are written in slices of
+ * HTTP_RESPONSE_CHUNK_SIZE, waiting for the socket to drain in between, so
+ * the write queue stays short and a gone client stops the writing.
+ * @param res The response, with its headers already written.
+ * @param body The encoded body.
+ */
+export async function writeResponseBody(
+  res: http.ServerResponse,
+  body: Buffer
+): Promise<void> {
+  let offset = 0;
+  while (body.byteLength - offset > HTTP_RESPONSE_CHUNK_SIZE) {
+    if (res.destroyed) return;
+    const chunk = body.subarray(offset, offset + HTTP_RESPONSE_CHUNK_SIZE);
+    offset += chunk.byteLength;
+    if (!res.write(chunk))
+      await new Promise<void>((resolve) => {
+        const done = () => {
+          res.off('drain', done);
+          res.off('close', done);
+          resolve();
+        };
+        res.on('drain', done);
+        res.on('close', done);
+      });
+  }
+  res.end(body.subarray(offset));
+}
@@ -122,6 +122,18 @@ export default {
     'إضافة دليل المكون الإضافي تلقائيًا إلى PYTHONPATH عند تشغيل البرامج النصية، مما يسمح بالاستيراد المباشر لمكتبة Python (موصى به). إذا تم تعطيله، يجب عليك نسخ ObsidianPluginDevPythonToJS.py إلى مجلد البرامج النصية الخاص بك أو إدارة sys.path يدويًا.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'تم تعطيل PYTHONPATH التلقائي. تأكد من وجود ObsidianPluginDevPythonToJS.py في مجلد البرامج النصية الخاص بك أو قم بإدارة sys.path يدويًا.',
+  SETTINGS_FORK_SERVER_NAME: 'تشغيل سريع للسكربتات (خادم fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'الإبقاء على عملية Python واحدة مع تحميل المكتبة مسبقًا وإنشاء كل تشغيل للسكربت منها عبر fork، بحيث تبدأ السكربتات خلال أجزاء من الثانية بدلًا من تشغيل مفسر جديد. macOS وLinux فقط؛ لا يُستخدم مع uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'تشغيل كل السكربتات: عمليات تشغيل متوازية',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'عدد السكربتات التي يشغّلها "تشغيل كل السكربتات" في الوقت نفسه (1 = واحداً تلو الآخر). يمكن للسكربت أن يعلن define_settings(..., run_after=[...]) كي لا يبدأ إلا بعد انتهاء السكربتات المذكورة.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'الحد الأقصى لحجم الطلب (ميغابايت)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'أكبر محتوى طلب يقبله الجسر من سكربت (مثل كتابة ملاحظة أو رفع مرفق). تُرفض الطلبات الأكبر برمز HTTP 413. الافتراضي: 100 ميغابايت',
+  SETTINGS_DEBUG_LOGGING_NAME: 'سجل التصحيح',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'كتابة رسائل تصحيح مفصلة (الطلبات، الردود، مخرجات السكربتات) في وحدة تحكم المطور. اتركه معطلاً للحصول على أفضل أداء.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'مسار ملف Python التنفيذي',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -184,4 +196,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'اقرأ المزيد حول الاعتبارات الأمنية',
   ACTIVATION_WARNING_CANCEL: 'إلغاء',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'تمكين على أي حال',
+  NOTICE_MOVE_MANY_PROGRESS: 'جارٍ نقل الملفات: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'جارٍ تحديث الروابط: {done}/{total}',
 };
@@ -123,6 +123,18 @@ export default {
     'স্ক্রিপ্ট চালানোর সময় প্লাগইন ডিরেক্টরি স্বয়ংক্রিয়ভাবে PYTHONPATH-এ যোগ করুন, যা পাইথন লাইব্রেরির সরাসরি আমদানি সক্ষম করে (প্রস্তাবিত)। নিষ্ক্রিয় করা থাকলে, আপনাকে অবশ্যই ObsidianPluginDevPythonToJS.py আপনার স্ক্রিপ্ট ফোল্ডারে কপি করতে হবে অথবা sys.path ম্যানুয়ালি পরিচালনা করতে হবে।',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'স্বয়ংক্রিয় PYTHONPATH নিষ্ক্রিয় করা হয়েছে। নিশ্চিত করুন ObsidianPluginDevPythonToJS.py আপনার স্ক্রিপ্ট ফোল্ডারে আছে অথবা sys.path ম্যানুয়ালি পরিচালনা করুন।',
+  SETTINGS_FORK_SERVER_NAME: 'দ্রুত স্ক্রিপ্ট চালু (fork সার্ভার)',
+  SETTINGS_FORK_SERVER_DESC:
+    'লাইব্রেরি আগে থেকে লোড করা একটি Python প্রসেস চালু রাখুন এবং প্রতিটি স্ক্রিপ্ট রান সেখান থেকে fork করুন, যাতে নতুন ইন্টারপ্রেটার চালুর বদলে স্ক্রিপ্ট মিলিসেকেন্ডে শুরু হয়। শুধু macOS ও Linux; uv-এর সাথে ব্যবহৃত হয় না।',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'সব স্ক্রিপ্ট চালান: সমান্তরাল রান',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '"সব স্ক্রিপ্ট চালান" একসাথে কতগুলো স্ক্রিপ্ট চালাবে (1 = একটির পর একটি)। কোনো স্ক্রিপ্ট define_settings(..., run_after=[...]) ঘোষণা করে তালিকাভুক্ত স্ক্রিপ্টগুলো শেষ হওয়ার পরেই শুরু হতে পারে।',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'সর্বোচ্চ অনুরোধের আকার (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'ব্রিজ কোনো স্ক্রিপ্ট থেকে সবচেয়ে বড় যে অনুরোধ বডি গ্রহণ করে (যেমন নোট লেখা বা সংযুক্তি আপলোড)। বড় অনুরোধ HTTP 413 দিয়ে প্রত্যাখ্যাত হয়। ডিফল্ট: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'ডিবাগ লগিং',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'বিস্তারিত ডিবাগ বার্তা (অনুরোধ, প্রতিক্রিয়া, স্ক্রিপ্ট আউটপুট) ডেভেলপার কনসোলে লিখুন। সেরা পারফরম্যান্সের জন্য বন্ধ রাখুন।',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'পাইথন এক্সিকিউটেবল পাথ',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -190,4 +202,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'নিরাপত্তা বিবেচনাগুলি সম্পর্কে আরও পড়ুন',
   ACTIVATION_WARNING_CANCEL: 'বাতিল করুন',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'যেকোনোভাবে সক্ষম করুন',
+  NOTICE_MOVE_MANY_PROGRESS: 'ফাইল সরানো হচ্ছে: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'লিঙ্ক আপডেট করা হচ্ছে: {done}/{total}',
 };
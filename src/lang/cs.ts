@@ -116,6 +116,18 @@ export default {
     'Automaticky přidá adresář pluginu do PYTHONPATH při spouštění skriptů, což umožňuje přímý import knihovny Python (Doporučeno). Pokud je zakázáno, musíte zkopírovat ObsidianPluginDevPythonToJS.py do složky se skripty nebo spravovat sys.path ručně.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automatické nastavení PYTHONPATH zakázáno. Ujistěte se, že soubor ObsidianPluginDevPythonToJS.py je ve vaší složce skriptů, nebo spravujte sys.path ručně.',
+  SETTINGS_FORK_SERVER_NAME: 'Rychlé spouštění skriptů (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Udržovat jeden proces Pythonu s předem načtenou knihovnou a každý běh skriptu z něj vytvářet pomocí fork, takže skripty startují v milisekundách místo spouštění nového interpretu. Pouze macOS a Linux; nepoužívá se s uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'Spustit všechny skripty: paralelní běhy',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Kolik skriptů "Spustit všechny skripty" spouští současně (1 = jeden po druhém). Skript může deklarovat define_settings(..., run_after=[...]), aby se spustil až po dokončení uvedených skriptů.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Maximální velikost požadavku (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Největší tělo požadavku, které most přijme ze skriptu (např. zápis poznámky nebo nahrání přílohy). Větší požadavky jsou odmítnuty s HTTP 413. Výchozí: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Ladicí protokolování',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Zapisovat podrobné ladicí zprávy (požadavky, odpovědi, výstup skriptů) do vývojářské konzole. Pro nejlepší výkon ponechte vypnuté.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Cesta k spustitelnému souboru Pythonu',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -185,4 +197,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Přečtěte si více o bezpečnostních opatřeních',
   ACTIVATION_WARNING_CANCEL: 'Zrušit',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Přesto Aktivovat',
+  NOTICE_MOVE_MANY_PROGRESS: 'Přesouvání souborů: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Aktualizace odkazů: {done}/{total}',
 };
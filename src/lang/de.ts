@@ -128,6 +128,19 @@ export default {
     'Fügt das Plugin-Verzeichnis beim Ausführen von Skripten automatisch zu PYTHONPATH hinzu, was den direkten Import der Python-Bibliothek ermöglicht (Empfohlen). Wenn deaktiviert, müssen Sie ObsidianPluginDevPythonToJS.py in Ihren Skriptordner kopieren oder sys.path manuell verwalten.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automatisches PYTHONPATH deaktiviert. Stellen Sie sicher, dass sich ObsidianPluginDevPythonToJS.py in Ihrem Skriptordner befindet oder verwalten Sie sys.path manuell.',
+  SETTINGS_FORK_SERVER_NAME: 'Schneller Skriptstart (Fork-Server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Einen Python-Prozess mit vorgeladener Bibliothek bereithalten und jeden Skriptlauf daraus forken, sodass Skripte in Millisekunden starten, statt einen neuen Interpreter zu starten. Nur macOS und Linux; wird mit uv nicht verwendet.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Alle Skripte ausführen: parallele Ausführungen',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Wie viele Skripte "Alle Skripte ausführen" gleichzeitig ausführt (1 = nacheinander). Ein Skript kann define_settings(..., run_after=[...]) angeben, um erst nach den aufgeführten Skripten zu starten.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Maximale Anfragegröße (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Größter Anfrageinhalt, den die Bridge von einem Skript annimmt (z. B. Schreiben einer Notiz oder Hochladen eines Anhangs). Größere Anfragen werden mit HTTP 413 abgelehnt. Standard: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Debug-Protokollierung',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Detaillierte Debug-Meldungen (Anfragen, Antworten, Skriptausgabe) in die Entwicklerkonsole schreiben. Für beste Leistung ausgeschaltet lassen.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Pfad zur Python-Ausführungsdatei',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -196,4 +209,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Mehr über Sicherheitsüberlegungen lesen',
   ACTIVATION_WARNING_CANCEL: 'Abbrechen',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Trotzdem aktivieren',
+  NOTICE_MOVE_MANY_PROGRESS: 'Dateien werden verschoben: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Links werden aktualisiert: {done}/{total}',
 };
@@ -120,6 +120,19 @@ export default {
     'Προσθέτει αυτόματα τον κατάλογο του plugin στο PYTHONPATH κατά την εκτέλεση σεναρίων, επιτρέποντας την απευθείας εισαγωγή της βιβλιοθήκης Python (Συνιστάται). Εάν απενεργοποιηθεί, πρέπει να αντιγράψετε το ObsidianPluginDevPythonToJS.py στον φάκελο των σεναρίων σας ή να διαχειριστείτε μη αυτόματα το sys.path.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Η αυτόματη ρύθμιση PYTHONPATH απενεργοποιήθηκε. Βεβαιωθείτε ότι το ObsidianPluginDevPythonToJS.py βρίσκεται στον φάκελο των σεναρίων σας ή διαχειριστείτε το sys.path μη αυτόματα.',
+  SETTINGS_FORK_SERVER_NAME: 'Γρήγορη εκκίνηση σεναρίων (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Διατηρεί μία διεργασία Python με προφορτωμένη τη βιβλιοθήκη και δημιουργεί κάθε εκτέλεση σεναρίου με fork, ώστε τα σενάρια να ξεκινούν σε χιλιοστά του δευτερολέπτου αντί να ξεκινά νέος διερμηνέας. Μόνο macOS και Linux· δεν χρησιμοποιείται με uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Εκτέλεση όλων των scripts: παράλληλες εκτελέσεις',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Πόσα scripts εκτελεί ταυτόχρονα η «Εκτέλεση όλων των scripts» (1 = το ένα μετά το άλλο). Ένα script μπορεί να δηλώσει define_settings(..., run_after=[...]) ώστε να ξεκινά μόνο αφού τελειώσουν τα αναφερόμενα scripts.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Μέγιστο μέγεθος αιτήματος (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Το μεγαλύτερο σώμα αιτήματος που δέχεται η γέφυρα από ένα script (π.χ. εγγραφή σημείωσης ή αποστολή συνημμένου). Μεγαλύτερα αιτήματα απορρίπτονται με HTTP 413. Προεπιλογή: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Καταγραφή εντοπισμού σφαλμάτων',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Εγγραφή λεπτομερών μηνυμάτων εντοπισμού σφαλμάτων (αιτήματα, αποκρίσεις, έξοδος scripts) στην κονσόλα προγραμματιστή. Αφήστε το απενεργοποιημένο για καλύτερη απόδοση.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Διαδρομή Εκτελέσιμου Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -189,4 +202,6 @@ export default {
     'Διαβάστε περισσότερα για τις προληπτικές μέτρους ασφαλείας',
   ACTIVATION_WARNING_CANCEL: 'Ακύρωση',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Ενεργοποίηση Ούτως ή Άλλως',
+  NOTICE_MOVE_MANY_PROGRESS: 'Μετακίνηση αρχείων: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Ενημέρωση συνδέσμων: {done}/{total}',
 };
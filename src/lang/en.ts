@@ -126,6 +126,18 @@ export default {
     'Automatically add the plugin directory to PYTHONPATH when running scripts, allowing direct import of the python library (recommended). If disabled, you must copy ObsidianPluginDevPythonToJS.py to your scripts folder or manage sys.path manually.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automatic PYTHONPATH disabled. Ensure ObsidianPluginDevPythonToJS.py is in your script folder or manage sys.path manually.',
+  SETTINGS_FORK_SERVER_NAME: 'Fast script launch (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Keep one Python process with the library preloaded and fork each script run from it, so scripts start in milliseconds instead of starting a new interpreter. macOS and Linux only; not used when running scripts with uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'Run all scripts: parallel runs',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'How many scripts "Run all scripts" runs at the same time (1 = one after another). A script can declare define_settings(..., run_after=[...]) to start only after the listed scripts have finished.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Maximum request size (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Largest request body the bridge accepts from a script (e.g. a note write or an attachment upload). Larger requests are rejected with HTTP 413. Default: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Debug logging',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Write detailed debug messages (requests, responses, script output) to the developer console. Leave off for best performance.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python executable path',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -191,4 +203,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Read more about security considerations',
   ACTIVATION_WARNING_CANCEL: 'Cancel',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Activate anyway',
+  NOTICE_MOVE_MANY_PROGRESS: 'Moving files: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Updating links: {done}/{total}',
 };
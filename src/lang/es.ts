@@ -133,6 +133,19 @@ export default {
     'Añadir automáticamente el directorio del plugin a PYTHONPATH al ejecutar scripts, permitiendo la importación directa de la biblioteca Python (Recomendado). Si está desactivado, debes copiar ObsidianPluginDevPythonToJS.py a tu carpeta de scripts o gestionar sys.path manualmente.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH automático desactivado. Asegúrate de que ObsidianPluginDevPythonToJS.py esté en tu carpeta de scripts o gestiona sys.path manualmente.',
+  SETTINGS_FORK_SERVER_NAME: 'Inicio rápido de scripts (servidor fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Mantener un proceso de Python con la librería precargada y crear cada ejecución de script con fork, para que los scripts arranquen en milisegundos en lugar de iniciar un intérprete nuevo. Solo macOS y Linux; no se usa con uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Ejecutar todos los scripts: ejecuciones en paralelo',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Cuántos scripts ejecuta a la vez "Ejecutar todos los scripts" (1 = uno tras otro). Un script puede declarar define_settings(..., run_after=[...]) para empezar solo cuando los scripts indicados hayan terminado.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Tamaño máximo de solicitud (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Cuerpo de solicitud más grande que el puente acepta de un script (p. ej. escribir una nota o subir un adjunto). Las solicitudes mayores se rechazan con HTTP 413. Predeterminado: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Registro de depuración',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Escribir mensajes de depuración detallados (solicitudes, respuestas, salida de scripts) en la consola de desarrollador. Déjelo desactivado para un mejor rendimiento.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Ruta del Ejecutable de Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -202,4 +215,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Leer más sobre consideraciones de seguridad',
   ACTIVATION_WARNING_CANCEL: 'Cancelar',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Activar de Todos Modos',
+  NOTICE_MOVE_MANY_PROGRESS: 'Moviendo archivos: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Actualizando enlaces: {done}/{total}',
 };
@@ -118,6 +118,18 @@ export default {
     'هنگام اجرای اسکریپت‌ها، دایرکتوری افزونه را به‌طور خودکار به PYTHONPATH اضافه می‌کند و امکان وارد کردن مستقیم کتابخانه پایتون را فراهم می‌کند (توصیه می‌شود). اگر غیرفعال باشد، باید ObsidianPluginDevPythonToJS.py را در پوشه اسکریپت‌های خود کپی کنید یا sys.path را به‌صورت دستی مدیریت کنید.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH خودکار غیرفعال شد. اطمینان حاصل کنید که ObsidianPluginDevPythonToJS.py در پوشه اسکریپت شما قرار دارد یا sys.path را به صورت دستی مدیریت کنید.',
+  SETTINGS_FORK_SERVER_NAME: 'اجرای سریع اسکریپت‌ها (سرور fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'یک فرایند Python با کتابخانهٔ از پیش بارگذاری‌شده نگه داشته می‌شود و هر اجرای اسکریپت با fork از آن ساخته می‌شود تا اسکریپت‌ها به‌جای راه‌اندازی مفسر جدید در چند میلی‌ثانیه شروع شوند. فقط macOS و Linux؛ با uv استفاده نمی‌شود.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'اجرای همه اسکریپت‌ها: اجراهای موازی',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'تعداد اسکریپت‌هایی که «اجرای همه اسکریپت‌ها» هم‌زمان اجرا می‌کند (1 = یکی پس از دیگری). یک اسکریپت می‌تواند با define_settings(..., run_after=[...]) اعلام کند که فقط پس از پایان اسکریپت‌های فهرست‌شده شروع شود.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'حداکثر اندازه درخواست (مگابایت)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'بزرگ‌ترین بدنه درخواستی که پل از یک اسکریپت می‌پذیرد (مثلاً نوشتن یادداشت یا بارگذاری پیوست). درخواست‌های بزرگ‌تر با HTTP 413 رد می‌شوند. پیش‌فرض: 100 مگابایت',
+  SETTINGS_DEBUG_LOGGING_NAME: 'گزارش اشکال‌زدایی',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'نوشتن پیام‌های اشکال‌زدایی مفصل (درخواست‌ها، پاسخ‌ها، خروجی اسکریپت‌ها) در کنسول توسعه‌دهنده. برای بهترین کارایی خاموش بگذارید.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'مسیر فایل اجرایی پایتون',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -181,4 +193,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'بیشتر بدانید در مورد ملاحظات امنیتی',
   ACTIVATION_WARNING_CANCEL: 'لغو',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'به هر حال فعال کن',
+  NOTICE_MOVE_MANY_PROGRESS: 'در حال انتقال فایل‌ها: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'در حال به‌روزرسانی پیوندها: {done}/{total}',
 };
@@ -119,6 +119,19 @@ export default {
     'Lisää automaattisesti laajennushakemiston PYTHONPATHiin komentosarjoja suoritettaessa, mikä mahdollistaa Python-kirjaston suoran tuonnin (Suositus). Jos se on poistettu käytöstä, sinun on kopioitava ObsidianPluginDevPythonToJS.py komentosarjakansioosi tai hallittava sys.pathia manuaalisesti.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automaattinen PYTHONPATH pois käytöstä. Varmista, että ObsidianPluginDevPythonToJS.py on komentosarjakansiossasi tai hallitse sys.pathia manuaalisesti.',
+  SETTINGS_FORK_SERVER_NAME: 'Nopea skriptien käynnistys (fork-palvelin)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Pidä yksi Python-prosessi kirjasto valmiiksi ladattuna ja haarauta (fork) jokainen skriptiajo siitä, jolloin skriptit käynnistyvät millisekunneissa uuden tulkin käynnistämisen sijaan. Vain macOS ja Linux; ei käytössä uv:n kanssa.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Suorita kaikki skriptit: rinnakkaiset suoritukset',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Kuinka monta skriptiä "Suorita kaikki skriptit" suorittaa samanaikaisesti (1 = yksi kerrallaan). Skripti voi määrittää define_settings(..., run_after=[...]) käynnistyäkseen vasta, kun luetellut skriptit ovat valmiita.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Pyynnön enimmäiskoko (Mt)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Suurin pyynnön sisältö, jonka silta hyväksyy skriptiltä (esim. muistiinpanon kirjoitus tai liitteen lataus). Suuremmat pyynnöt hylätään HTTP 413 -virheellä. Oletus: 100 Mt',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Vianmäärityslokit',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Kirjoita yksityiskohtaiset vianmääritysviestit (pyynnöt, vastaukset, skriptien tuloste) kehittäjäkonsoliin. Pidä pois päältä parhaan suorituskyvyn saamiseksi.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python-suoritustiedoston polku',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -186,4 +199,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Lue lisää turvallisuushuomioista',
   ACTIVATION_WARNING_CANCEL: 'Peruuta',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Ota käyttöön joka tapauksessa',
+  NOTICE_MOVE_MANY_PROGRESS: 'Siirretään tiedostoja: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Päivitetään linkkejä: {done}/{total}',
 };
@@ -125,6 +125,19 @@ export default {
     'Awtomatikong idagdag ang direktoryo ng plugin sa PYTHONPATH kapag nagpapatakbo ng mga script, na nagpapahintulot sa direktang pag-import ng Python library (Inirerekomenda). Kung hindi pinagana, dapat mong kopyahin ang ObsidianPluginDevPythonToJS.py sa iyong folder ng mga script o manu-manong pamahalaan ang sys.path.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Hindi pinagana ang awtomatikong PYTHONPATH. Tiyaking nasa iyong script folder ang ObsidianPluginDevPythonToJS.py o manu-manong pamahalaan ang sys.path.',
+  SETTINGS_FORK_SERVER_NAME: 'Mabilis na paglunsad ng script (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Panatilihin ang isang Python process na naka-preload ang library at i-fork mula rito ang bawat pagpapatakbo ng script, para magsimula ang mga script sa loob ng ilang millisecond sa halip na magsimula ng bagong interpreter. macOS at Linux lamang; hindi ginagamit sa uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Patakbuhin ang lahat ng script: sabay-sabay na pagtakbo',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Ilang script ang sabay-sabay na pinapatakbo ng "Patakbuhin ang lahat ng script" (1 = isa-isa). Maaaring magdeklara ang script ng define_settings(..., run_after=[...]) para magsimula lamang ito pagkatapos matapos ang mga nakalistang script.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Pinakamalaking laki ng request (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Pinakamalaking request body na tinatanggap ng bridge mula sa isang script (hal. pagsulat ng note o pag-upload ng attachment). Ang mas malalaking request ay tinatanggihan gamit ang HTTP 413. Default: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Debug logging',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Isulat ang detalyadong debug na mensahe (mga request, sagot, output ng script) sa developer console. Iwanang naka-off para sa pinakamahusay na performance.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Landas ng Python Executable',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -194,4 +207,6 @@ export default {
     'Magbasa pa tungkol sa mga konsiderasyon sa seguridad',
   ACTIVATION_WARNING_CANCEL: 'Kanselahin',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'I-activate Pa Rin',
+  NOTICE_MOVE_MANY_PROGRESS: 'Inililipat ang mga file: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Ina-update ang mga link: {done}/{total}',
 };
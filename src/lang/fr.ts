@@ -132,6 +132,19 @@ export default {
     "Ajouter automatiquement le dossier du plugin à PYTHONPATH lors de l'exécution des scripts, permettant l'import direct de la librairie Python (Recommandé). Si désactivé, vous devez copier ObsidianPluginDevPythonToJS.py dans votre dossier de scripts ou gérer sys.path manuellement.",
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH automatique désactivé. Assurez-vous que ObsidianPluginDevPythonToJS.py est dans votre dossier de scripts ou gérez sys.path manuellement.',
+  SETTINGS_FORK_SERVER_NAME: 'Lancement rapide des scripts (serveur de fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Garder un processus Python avec la librairie préchargée et créer chaque exécution de script par fork, pour que les scripts démarrent en quelques millisecondes au lieu de lancer un nouvel interpréteur. macOS et Linux uniquement ; non utilisé avec uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Exécuter tous les scripts : exécutions parallèles',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    "Nombre de scripts que « Exécuter tous les scripts » lance en même temps (1 = l'un après l'autre). Un script peut déclarer define_settings(..., run_after=[...]) pour ne démarrer qu'après la fin des scripts listés.",
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Taille maximale des requêtes (Mo)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Plus grand corps de requête accepté depuis un script (par ex. écriture de note ou envoi de pièce jointe). Les requêtes plus grandes sont refusées avec HTTP 413. Par défaut : 100 Mo',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Journal de débogage',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Écrire des messages de débogage détaillés (requêtes, réponses, sortie des scripts) dans la console développeur. Laisser désactivé pour de meilleures performances.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: "Chemin de l'Exécutable Python",
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -202,4 +215,6 @@ export default {
     'En savoir plus sur les considérations de sécurité',
   ACTIVATION_WARNING_CANCEL: 'Annuler',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Activer Quand Même',
+  NOTICE_MOVE_MANY_PROGRESS: 'Déplacement des fichiers : {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Mise à jour des liens : {done}/{total}',
 };
@@ -122,6 +122,19 @@ export default {
     'Ƙara babban fayil ɗin plugin ta atomatik zuwa PYTHONPATH lokacin gudanar da rubutun, yana ba da damar shigo da laburaren Python kai tsaye (An ba da shawarar). Idan an kashe, dole ne ka kwafi ObsidianPluginDevPythonToJS.py zuwa babban fayil ɗin rubutun ka ko sarrafa sys.path da hannu.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'An kashe PYTHONPATH ta atomatik. Tabbatar cewa ObsidianPluginDevPythonToJS.py yana cikin babban fayil ɗin rubutun ka ko sarrafa sys.path da hannu.',
+  SETTINGS_FORK_SERVER_NAME: 'Saurin fara rubutun (sabar fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'A ajiye tsarin Python guda ɗaya da aka riga aka loda ɗakin karatu, a kuma ƙirƙiri kowane gudanar da rubutu ta hanyar fork daga gare shi, domin rubutun su fara cikin millisakan maimakon fara sabon mai fassara. macOS da Linux kawai; ba a amfani da shi tare da uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Gudanar da duk rubutun: gudanarwa a lokaci guda',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Rubutu nawa "Gudanar da duk rubutun" ke gudanarwa a lokaci guda (1 = ɗaya bayan ɗaya). Rubutu na iya bayyana define_settings(..., run_after=[...]) don ya fara ne kawai bayan rubutun da aka lissafa sun gama.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Matsakaicin girman buƙata (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Babban jikin buƙata da gadar ke karɓa daga rubutu (misali rubuta bayani ko loda abin haɗe). Ana ƙin manyan buƙatu da HTTP 413. Tsoho: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Rajistar gyara kuskure',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    "Rubuta cikakkun saƙonnin gyara kuskure (buƙatu, amsoshi, fitowar rubutu) zuwa na'urar wasan mai haɓakawa. Bar shi a kashe don mafi kyawun aiki.",
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Hanyar Fayil Mai Gudun Aiki na Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -188,4 +201,6 @@ export default {
   ACTIVATION_WARNING_READMORE: "Karanta fiye da la'akari da tsaro",
   ACTIVATION_WARNING_CANCEL: 'Soke',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Kunna Duk da haka',
+  NOTICE_MOVE_MANY_PROGRESS: 'Ana matsar da fayiloli: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Ana sabunta hanyoyin haɗi: {done}/{total}',
 };
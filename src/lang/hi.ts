@@ -126,6 +126,18 @@ export default {
     'स्क्रिप्ट चलाते समय प्लगइन निर्देशिका को स्वचालित रूप से PYTHONPATH में जोड़ें, जिससे पायथन लाइब्रेरी का सीधा आयात संभव हो सके (अनुशंसित)। यदि अक्षम है, तो आपको ObsidianPluginDevPythonToJS.py को अपनी स्क्रिप्ट फ़ोल्डर में कॉपी करना होगा या sys.path को मैन्युअल रूप से प्रबंधित करना होगा।',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'स्वचालित PYTHONPATH अक्षम है। सुनिश्चित करें कि ObsidianPluginDevPythonToJS.py आपकी स्क्रिप्ट फ़ोल्डर में है या sys.path को मैन्युअल रूप से प्रबंधित करें।',
+  SETTINGS_FORK_SERVER_NAME: 'स्क्रिप्ट का तेज़ प्रारंभ (fork सर्वर)',
+  SETTINGS_FORK_SERVER_DESC:
+    'लाइब्रेरी पहले से लोड किए हुए एक Python प्रोसेस को चालू रखें और हर स्क्रिप्ट रन को उसी से fork करें, ताकि नया इंटरप्रेटर शुरू करने के बजाय स्क्रिप्ट मिलीसेकंड में शुरू हों। केवल macOS और Linux; uv के साथ उपयोग नहीं होता।',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'सभी स्क्रिप्ट चलाएँ: समानांतर रन',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '"सभी स्क्रिप्ट चलाएँ" एक साथ कितनी स्क्रिप्ट चलाता है (1 = एक के बाद एक)। कोई स्क्रिप्ट define_settings(..., run_after=[...]) घोषित कर सकती है ताकि वह सूचीबद्ध स्क्रिप्ट के पूरा होने के बाद ही शुरू हो।',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'अधिकतम अनुरोध आकार (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'ब्रिज किसी स्क्रिप्ट से जितना बड़ा अनुरोध बॉडी स्वीकार करता है (जैसे नोट लिखना या अटैचमेंट अपलोड करना)। बड़े अनुरोध HTTP 413 के साथ अस्वीकार किए जाते हैं। डिफ़ॉल्ट: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'डीबग लॉगिंग',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'विस्तृत डीबग संदेश (अनुरोध, प्रतिक्रियाएँ, स्क्रिप्ट आउटपुट) डेवलपर कंसोल में लिखें। सर्वोत्तम प्रदर्शन के लिए बंद रखें।',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'पायथन निष्पादन योग्य पथ',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -191,4 +203,7 @@ export default {
   ACTIVATION_WARNING_READMORE: 'सुरक्षा विचारों के बारे में और पढ़ें',
   ACTIVATION_WARNING_CANCEL: 'रद्द करें',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'फिर भी सक्षम करें',
+  NOTICE_MOVE_MANY_PROGRESS:
+    'फ़ाइलें स्थानांतरित की जा रही हैं: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'लिंक अपडेट किए जा रहे हैं: {done}/{total}',
 };
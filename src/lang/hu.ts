@@ -125,6 +125,19 @@ export default {
     'Automatikusan hozzáadja a bővítménykönyvtárat a PYTHONPATH-hoz szkriptek futtatásakor, lehetővé téve a Python könyvtár közvetlen importálását (Ajánlott). Ha le van tiltva, át kell másolnia az ObsidianPluginDevPythonToJS.py fájlt a szkriptmappájába, vagy manuálisan kell kezelnie a sys.path-t.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automatikus PYTHONPATH letiltva. Győződjön meg róla, hogy az ObsidianPluginDevPythonToJS.py a szkriptmappájában van, vagy kezelje manuálisan a sys.path-t.',
+  SETTINGS_FORK_SERVER_NAME: 'Gyors szkriptindítás (fork szerver)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Egy Python-folyamat fut előre betöltött könyvtárral, és minden szkriptfuttatás ebből indul fork segítségével, így a szkriptek ezredmásodpercek alatt indulnak új értelmező indítása helyett. Csak macOS és Linux; uv használatakor nem érvényes.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Összes szkript futtatása: párhuzamos futások',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Hány szkriptet futtat egyszerre az "Összes szkript futtatása" (1 = egymás után). Egy szkript megadhatja a define_settings(..., run_after=[...]) paramétert, hogy csak a felsorolt szkriptek befejezése után induljon.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Kérés maximális mérete (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'A híd által egy szkripttől elfogadott legnagyobb kéréstörzs (pl. jegyzet írása vagy melléklet feltöltése). A nagyobb kéréseket HTTP 413-mal elutasítja. Alapértelmezett: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Hibakeresési naplózás',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Részletes hibakeresési üzenetek (kérések, válaszok, szkriptkimenet) írása a fejlesztői konzolba. A legjobb teljesítményhez hagyja kikapcsolva.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python Futtatható Fájl Elérési Útja',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -193,4 +206,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Tudjon meg többet a biztonsági szempontokról',
   ACTIVATION_WARNING_CANCEL: 'Mégse',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Engedélyezés Mindenképp',
+  NOTICE_MOVE_MANY_PROGRESS: 'Fájlok áthelyezése: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Hivatkozások frissítése: {done}/{total}',
 };
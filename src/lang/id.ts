@@ -124,6 +124,18 @@ export default {
     'Secara otomatis menambahkan direktori plugin ke PYTHONPATH saat menjalankan skrip, memungkinkan impor langsung pustaka Python (Disarankan). Jika dinonaktifkan, Anda harus menyalin ObsidianPluginDevPythonToJS.py ke folder skrip Anda atau mengelola sys.path secara manual.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH otomatis dinonaktifkan. Pastikan ObsidianPluginDevPythonToJS.py ada di folder skrip Anda atau kelola sys.path secara manual.',
+  SETTINGS_FORK_SERVER_NAME: 'Peluncuran skrip cepat (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Pertahankan satu proses Python dengan pustaka yang sudah dimuat dan buat setiap eksekusi skrip dengan fork darinya, sehingga skrip mulai dalam milidetik alih-alih memulai interpreter baru. Hanya macOS dan Linux; tidak digunakan dengan uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'Jalankan semua skrip: eksekusi paralel',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Berapa banyak skrip yang dijalankan "Jalankan semua skrip" secara bersamaan (1 = satu per satu). Skrip dapat mendeklarasikan define_settings(..., run_after=[...]) agar baru dimulai setelah skrip yang tercantum selesai.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Ukuran permintaan maksimum (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Isi permintaan terbesar yang diterima jembatan dari skrip (mis. menulis catatan atau mengunggah lampiran). Permintaan yang lebih besar ditolak dengan HTTP 413. Bawaan: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Log debug',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Tulis pesan debug terperinci (permintaan, respons, keluaran skrip) ke konsol pengembang. Biarkan nonaktif untuk performa terbaik.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Jalur Eksekusi Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -192,4 +204,6 @@ export default {
     'Baca selengkapnya tentang pertimbangan keamanan',
   ACTIVATION_WARNING_CANCEL: 'Batal',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Aktifkan Saja',
+  NOTICE_MOVE_MANY_PROGRESS: 'Memindahkan file: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Memperbarui tautan: {done}/{total}',
 };
@@ -118,6 +118,18 @@ export default {
     'Tinye akpaghị aka ndekọ ngwa mgbakwunye na PYTHONPATH mgbe ị na-agba ọsọ edemede, na-enye ohere mbubata ozugbo nke ọba akwụkwọ Python (Akwadoro). Ọ bụrụ na nkwarụ, ị ga-edepụtaghachi ObsidianPluginDevPythonToJS.py na folda edemede gị ma ọ bụ jikwaa sys.path aka.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH akpaaka nwere nkwarụ. Gbaa mbọ hụ na ObsidianPluginDevPythonToJS.py dị na folda edemede gị ma ọ bụ jikwaa sys.path aka.',
+  SETTINGS_FORK_SERVER_NAME: 'Mmalite script ngwa ngwa (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Debe otu usoro Python nke e buru ụzọ bunye ọba akwụkwọ ya ma mepụta ọsọ script ọ bụla site na fork site na ya, ka scripts malite n’ime millisekọnd kama ịmalite onye ntụgharị ọhụrụ. Naanị macOS na Linux; anaghị eji ya na uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: "Gbaa script niile: ọgbụgba n'otu oge",
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Ọnụ ọgụgụ script "Gbaa script niile" na-agba n\'otu oge (1 = otu n\'otu). Script nwere ike ikwupụta define_settings(..., run_after=[...]) ka ọ malite naanị mgbe script ndị edepụtara gwụchara.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Oke arịrịọ kachasị (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Ahụ arịrịọ kachasị ukwuu nke akwa mmiri na-anabata site na script (dịka ide ndetu ma ọ bụ ibugo ihe mgbakwunye). A na-ajụ arịrịọ buru ibu karịa site na HTTP 413. Ndabara: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Ndekọ nchọpụta mperi',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Dee ozi nchọpụta mperi zuru ezu (arịrịọ, nzaghachi, mmepụta script) na njikwa onye nrụpụta. Hapụ ya ka ọ gbanyụọ maka arụmọrụ kacha mma.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Ụzọ Failụ Python Nwere Ike Ịgba ọsọ',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -184,4 +196,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Gụọkwuo banyere nchekwa nlele',
   ACTIVATION_WARNING_CANCEL: 'Kagbuo',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Bido Ọbụlagodi',
+  NOTICE_MOVE_MANY_PROGRESS: 'Na-ebugharị faịlụ: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Na-emelite njikọ: {done}/{total}',
 };
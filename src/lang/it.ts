@@ -129,6 +129,19 @@ export default {
     "Aggiunge automaticamente la directory del plugin a PYTHONPATH durante l'esecuzione degli script, consentendo l'importazione diretta della libreria Python (Consigliato). Se disabilitato, è necessario copiare ObsidianPluginDevPythonToJS.py nella cartella degli script o gestire manualmente sys.path.",
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH automatico disabilitato. Assicurati che ObsidianPluginDevPythonToJS.py sia nella tua cartella degli script o gestisci sys.path manualmente.',
+  SETTINGS_FORK_SERVER_NAME: 'Avvio rapido degli script (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Mantiene un processo Python con la libreria precaricata e crea ogni esecuzione di script tramite fork, così gli script partono in millisecondi invece di avviare un nuovo interprete. Solo macOS e Linux; non usato con uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Esegui tutti gli script: esecuzioni parallele',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Quanti script "Esegui tutti gli script" esegue contemporaneamente (1 = uno dopo l\'altro). Uno script può dichiarare define_settings(..., run_after=[...]) per avviarsi solo dopo la fine degli script elencati.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Dimensione massima richiesta (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Corpo di richiesta più grande che il bridge accetta da uno script (ad es. scrittura di una nota o caricamento di un allegato). Le richieste più grandi vengono rifiutate con HTTP 413. Predefinito: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Log di debug',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Scrive messaggi di debug dettagliati (richieste, risposte, output degli script) nella console sviluppatore. Lasciare disattivato per prestazioni migliori.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Percorso Eseguibile Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -196,4 +209,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Leggi di più sulle considerazioni di sicurezza',
   ACTIVATION_WARNING_CANCEL: 'Annulla',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Attiva Comunque',
+  NOTICE_MOVE_MANY_PROGRESS: 'Spostamento dei file: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Aggiornamento dei link: {done}/{total}',
 };
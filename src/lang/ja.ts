@@ -126,6 +126,18 @@ export default {
     'スクリプト実行時にプラグインディレクトリを自動的にPYTHONPATHに追加し、Pythonライブラリの直接インポートを可能にします（推奨）。無効にした場合、ObsidianPluginDevPythonToJS.pyをスクリプトフォルダにコピーするか、sys.pathを手動で管理する必要があります。',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     '自動PYTHONPATHが無効になりました。ObsidianPluginDevPythonToJS.pyがスクリプトフォルダにあることを確認するか、sys.pathを手動で管理してください。',
+  SETTINGS_FORK_SERVER_NAME: 'スクリプトの高速起動（フォークサーバー）',
+  SETTINGS_FORK_SERVER_DESC:
+    'ライブラリを読み込み済みの Python プロセスを 1 つ常駐させ、スクリプトの実行ごとにそこから fork します。新しいインタープリターを起動する代わりに、数ミリ秒でスクリプトが開始されます。macOS と Linux のみ。uv 使用時は無効です。',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'すべてのスクリプトを実行: 並列実行数',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '「すべてのスクリプトを実行」が同時に実行するスクリプトの数（1 = 1つずつ順番に）。スクリプトは define_settings(..., run_after=[...]) を宣言すると、指定したスクリプトの終了後にのみ開始されます。',
+  SETTINGS_MAX_REQUEST_BODY_NAME: '最大リクエストサイズ (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'ブリッジがスクリプトから受け付ける最大のリクエスト本文（ノートの書き込みや添付ファイルのアップロードなど）。これより大きいリクエストは HTTP 413 で拒否されます。既定値: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'デバッグログ',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    '詳細なデバッグメッセージ（リクエスト、レスポンス、スクリプト出力）を開発者コンソールに出力します。最高のパフォーマンスを得るにはオフのままにしてください。',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python 実行可能ファイルのパス',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -193,4 +205,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'セキュリティに関する考慮事項について詳しく見る',
   ACTIVATION_WARNING_CANCEL: 'キャンセル',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'とにかく有効にする',
+  NOTICE_MOVE_MANY_PROGRESS: 'ファイルを移動中: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'リンクを更新中: {done}/{total}',
 };
@@ -122,6 +122,18 @@ export default {
     '스크립트를 실행할 때 플러그인 디렉토리를 PYTHONPATH에 자동으로 추가하여 Python 라이브러리를 직접 가져올 수 있도록 합니다(권장). 비활성화된 경우 ObsidianPluginDevPythonToJS.py를 스크립트 폴더에 복사하거나 sys.path를 수동으로 관리해야 합니다.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     '자동 PYTHONPATH가 비활성화되었습니다. ObsidianPluginDevPythonToJS.py가 스크립트 폴더에 있는지 확인하거나 sys.path를 수동으로 관리하십시오.',
+  SETTINGS_FORK_SERVER_NAME: '빠른 스크립트 실행 (포크 서버)',
+  SETTINGS_FORK_SERVER_DESC:
+    '라이브러리를 미리 불러온 Python 프로세스 하나를 유지하고 스크립트를 실행할 때마다 fork하여, 새 인터프리터를 시작하는 대신 몇 밀리초 만에 스크립트가 시작되도록 합니다. macOS 및 Linux 전용이며 uv에서는 사용되지 않습니다.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: '모든 스크립트 실행: 병렬 실행 수',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '"모든 스크립트 실행"이 동시에 실행하는 스크립트 수(1 = 하나씩 차례로). 스크립트는 define_settings(..., run_after=[...])를 선언하여 나열된 스크립트가 끝난 뒤에만 시작할 수 있습니다.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: '최대 요청 크기 (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    '브리지가 스크립트로부터 받는 가장 큰 요청 본문(예: 노트 쓰기 또는 첨부 파일 업로드). 더 큰 요청은 HTTP 413으로 거부됩니다. 기본값: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: '디버그 로깅',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    '자세한 디버그 메시지(요청, 응답, 스크립트 출력)를 개발자 콘솔에 기록합니다. 최상의 성능을 위해 꺼 두세요.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python 실행 파일 경로',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -186,4 +198,6 @@ export default {
   ACTIVATION_WARNING_READMORE: '보안 고려사항 더 읽기',
   ACTIVATION_WARNING_CANCEL: '취소',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: '무시하고 활성화',
+  NOTICE_MOVE_MANY_PROGRESS: '파일 이동 중: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: '링크 업데이트 중: {done}/{total}',
 };
@@ -120,6 +120,18 @@ export default {
     'Tambah direktori pemalam secara automatik ke PYTHONPATH semasa menjalankan skrip, membenarkan import terus pustaka Python (Disyorkan). Jika dilumpuhkan, anda mesti menyalin ObsidianPluginDevPythonToJS.py ke folder skrip anda atau mengurus sys.path secara manual.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH automatik dilumpuhkan. Pastikan ObsidianPluginDevPythonToJS.py berada dalam folder skrip anda atau urus sys.path secara manual.',
+  SETTINGS_FORK_SERVER_NAME: 'Pelancaran skrip pantas (pelayan fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Kekalkan satu proses Python dengan pustaka dimuatkan terlebih dahulu dan cipta setiap larian skrip melalui fork daripadanya, supaya skrip bermula dalam milisaat dan bukannya memulakan penterjemah baharu. macOS dan Linux sahaja; tidak digunakan dengan uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'Jalankan semua skrip: larian selari',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Berapa banyak skrip yang dijalankan oleh "Jalankan semua skrip" serentak (1 = satu demi satu). Skrip boleh mengisytiharkan define_settings(..., run_after=[...]) supaya hanya bermula selepas skrip yang disenaraikan selesai.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Saiz permintaan maksimum (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Kandungan permintaan terbesar yang diterima jambatan daripada skrip (cth. menulis nota atau memuat naik lampiran). Permintaan yang lebih besar ditolak dengan HTTP 413. Lalai: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Log nyahpepijat',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Tulis mesej nyahpepijat terperinci (permintaan, respons, output skrip) ke konsol pembangun. Biarkan dimatikan untuk prestasi terbaik.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Laluan Boleh Laksana Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -187,4 +199,6 @@ export default {
     'Baca lebih lanjut tentang pertimbangan keselamatan',
   ACTIVATION_WARNING_CANCEL: 'Batal',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Aktifkan Juga',
+  NOTICE_MOVE_MANY_PROGRESS: 'Memindahkan fail: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Mengemas kini pautan: {done}/{total}',
 };
@@ -121,6 +121,19 @@ export default {
     'Voegt automatisch de plug-inmap toe aan PYTHONPATH bij het uitvoeren van scripts, waardoor directe import van de Python-bibliotheek mogelijk is (Aanbevolen). Indien uitgeschakeld, moet u ObsidianPluginDevPythonToJS.py naar uw scriptmap kopiëren of sys.path handmatig beheren.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automatische PYTHONPATH uitgeschakeld. Zorg ervoor dat ObsidianPluginDevPythonToJS.py zich in uw scriptmap bevindt of beheer sys.path handmatig.',
+  SETTINGS_FORK_SERVER_NAME: 'Snel scripts starten (fork-server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Houd één Python-proces met de bibliotheek vooraf geladen en fork elke scriptrun daaruit, zodat scripts in milliseconden starten in plaats van een nieuwe interpreter te starten. Alleen macOS en Linux; niet gebruikt met uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Alle scripts uitvoeren: parallelle uitvoeringen',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Hoeveel scripts "Alle scripts uitvoeren" tegelijk uitvoert (1 = na elkaar). Een script kan define_settings(..., run_after=[...]) opgeven om pas te starten nadat de genoemde scripts klaar zijn.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Maximale verzoekgrootte (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Grootste verzoekinhoud die de bridge van een script accepteert (bijv. een notitie schrijven of een bijlage uploaden). Grotere verzoeken worden geweigerd met HTTP 413. Standaard: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Debuglogboek',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Gedetailleerde debugberichten (verzoeken, antwoorden, scriptuitvoer) naar de ontwikkelaarsconsole schrijven. Laat uit voor de beste prestaties.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Pad naar Python Uitvoerbaar Bestand',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -189,4 +202,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Lees meer over veiligheidsoverwegingen',
   ACTIVATION_WARNING_CANCEL: 'Annuleren',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Toch Inschakelen',
+  NOTICE_MOVE_MANY_PROGRESS: 'Bestanden verplaatsen: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Links bijwerken: {done}/{total}',
 };
@@ -131,6 +131,19 @@ export default {
     'Automatycznie dodaje katalog wtyczki do PYTHONPATH podczas uruchamiania skryptów, umożliwiając bezpośredni import biblioteki Python (Zalecane). Jeśli opcja jest wyłączona, musisz skopiować plik ObsidianPluginDevPythonToJS.py do folderu skryptów lub ręcznie zarządzać sys.path.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automatyczne ustawianie PYTHONPATH wyłączone. Upewnij się, że plik ObsidianPluginDevPythonToJS.py znajduje się w folderze skryptów lub zarządzaj sys.path ręcznie.',
+  SETTINGS_FORK_SERVER_NAME: 'Szybkie uruchamianie skryptów (serwer fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Utrzymuj jeden proces Pythona z wczytaną biblioteką i uruchamiaj każdy skrypt przez fork, dzięki czemu skrypty startują w milisekundy zamiast uruchamiać nowy interpreter. Tylko macOS i Linux; nieużywane z uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Uruchom wszystkie skrypty: uruchomienia równoległe',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Ile skryptów "Uruchom wszystkie skrypty" uruchamia jednocześnie (1 = jeden po drugim). Skrypt może zadeklarować define_settings(..., run_after=[...]), aby wystartować dopiero po zakończeniu wymienionych skryptów.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Maksymalny rozmiar żądania (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Największa treść żądania, jaką most przyjmuje od skryptu (np. zapis notatki lub przesłanie załącznika). Większe żądania są odrzucane z kodem HTTP 413. Domyślnie: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Logowanie debugowania',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Zapisuj szczegółowe komunikaty debugowania (żądania, odpowiedzi, wyjście skryptów) w konsoli deweloperskiej. Pozostaw wyłączone dla najlepszej wydajności.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Ścieżka Pliku Wykonywalnego Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -199,4 +212,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Czytaj więcej o kwestiach bezpieczeństwa',
   ACTIVATION_WARNING_CANCEL: 'Anuluj',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Aktywuj Mimo To',
+  NOTICE_MOVE_MANY_PROGRESS: 'Przenoszenie plików: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Aktualizowanie linków: {done}/{total}',
 };
@@ -129,6 +129,19 @@ export default {
     'Adicionar automaticamente o diretório do plugin ao PYTHONPATH ao executar scripts, permitindo a importação direta da biblioteca Python (Recomendado). Se desativado, você deve copiar ObsidianPluginDevPythonToJS.py para sua pasta de scripts ou gerenciar sys.path manualmente.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH automático desativado. Certifique-se de que ObsidianPluginDevPythonToJS.py está na sua pasta de scripts ou gerencie sys.path manually.',
+  SETTINGS_FORK_SERVER_NAME: 'Início rápido de scripts (servidor fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Manter um processo Python com a biblioteca pré-carregada e criar cada execução de script por fork, para que os scripts iniciem em milissegundos em vez de iniciar um novo interpretador. Apenas macOS e Linux; não é usado com uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Executar todos os scripts: execuções paralelas',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Quantos scripts "Executar todos os scripts" executa ao mesmo tempo (1 = um após o outro). Um script pode declarar define_settings(..., run_after=[...]) para iniciar apenas após o término dos scripts listados.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Tamanho máximo da requisição (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Maior corpo de requisição que a ponte aceita de um script (ex.: gravar uma nota ou enviar um anexo). Requisições maiores são rejeitadas com HTTP 413. Padrão: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Log de depuração',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Escrever mensagens de depuração detalhadas (requisições, respostas, saída dos scripts) no console do desenvolvedor. Deixe desativado para melhor desempenho.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Caminho do Executável Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -196,4 +209,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Leia mais sobre considerações de segurança',
   ACTIVATION_WARNING_CANCEL: 'Cancelar',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Ativar Mesmo Assim',
+  NOTICE_MOVE_MANY_PROGRESS: 'Movendo arquivos: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Atualizando links: {done}/{total}',
 };
@@ -120,6 +120,19 @@ export default {
     'Adaugă automat directorul pluginului la PYTHONPATH la rularea scripturilor, permițând importul direct al bibliotecii Python (Recomandat). Dacă este dezactivat, trebuie să copiați ObsidianPluginDevPythonToJS.py în folderul dvs. de scripturi sau să gestionați manual sys.path.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH automat dezactivat. Asigurați-vă că ObsidianPluginDevPythonToJS.py se află în folderul dvs. de scripturi sau gestionați manual sys.path.',
+  SETTINGS_FORK_SERVER_NAME: 'Lansare rapidă a scripturilor (server fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Păstrează un proces Python cu biblioteca preîncărcată și creează fiecare rulare de script prin fork, astfel încât scripturile pornesc în milisecunde în loc să pornească un interpretor nou. Doar macOS și Linux; nu se folosește cu uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Rulează toate scripturile: rulări paralele',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Câte scripturi rulează simultan "Rulează toate scripturile" (1 = unul după altul). Un script poate declara define_settings(..., run_after=[...]) pentru a porni doar după terminarea scripturilor listate.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Dimensiunea maximă a cererii (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Cel mai mare corp de cerere acceptat de punte de la un script (de ex. scrierea unei note sau încărcarea unui atașament). Cererile mai mari sunt respinse cu HTTP 413. Implicit: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Jurnalizare de depanare',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Scrie mesaje de depanare detaliate (cereri, răspunsuri, ieșirea scripturilor) în consola pentru dezvoltatori. Lăsați dezactivat pentru performanță optimă.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Calea către Executabilul Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -189,4 +202,6 @@ export default {
     'Citiți mai multe despre considerațiile de securitate',
   ACTIVATION_WARNING_CANCEL: 'Anulează',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Activează Oricum',
+  NOTICE_MOVE_MANY_PROGRESS: 'Se mută fișierele: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Se actualizează linkurile: {done}/{total}',
 };
@@ -126,6 +126,19 @@ export default {
     'Автоматически добавлять каталог плагина в PYTHONPATH при запуске скриптов, разрешая прямой импорт библиотеки Python (Рекомендуется). Если отключено, вы должны скопировать ObsidianPluginDevPythonToJS.py в папку со скриптами или управлять sys.path вручную.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Автоматический PYTHONPATH отключен. Убедитесь, что ObsidianPluginDevPythonToJS.py находится в вашей папке скриптов, или управляйте sys.path вручную.',
+  SETTINGS_FORK_SERVER_NAME: 'Быстрый запуск скриптов (fork-сервер)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Держать один процесс Python с предзагруженной библиотекой и запускать каждый скрипт через fork, чтобы скрипты стартовали за миллисекунды вместо запуска нового интерпретатора. Только macOS и Linux; не используется с uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Запуск всех скриптов: параллельные запуски',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Сколько скриптов «Запуск всех скриптов» выполняет одновременно (1 = по очереди). Скрипт может объявить define_settings(..., run_after=[...]), чтобы запускаться только после завершения перечисленных скриптов.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Максимальный размер запроса (МБ)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Наибольшее тело запроса, которое мост принимает от скрипта (например, запись заметки или загрузка вложения). Запросы большего размера отклоняются с HTTP 413. По умолчанию: 100 МБ',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Отладочный журнал',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Выводить подробные отладочные сообщения (запросы, ответы, вывод скриптов) в консоль разработчика. Для лучшей производительности оставьте выключенным.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Путь к исполняемому файлу Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -193,4 +206,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Узнать больше о соображениях безопасности',
   ACTIVATION_WARNING_CANCEL: 'Отмена',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Все равно включить',
+  NOTICE_MOVE_MANY_PROGRESS: 'Перемещение файлов: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Обновление ссылок: {done}/{total}',
 };
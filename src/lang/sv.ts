@@ -120,6 +120,18 @@ export default {
     'Lägg automatiskt till plugin-katalogen i PYTHONPATH när skript körs, vilket möjliggör direktimport av Python-biblioteket (Rekommenderas). Om inaktiverat måste du kopiera ObsidianPluginDevPythonToJS.py till din skriptmapp eller hantera sys.path manuellt.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Automatisk PYTHONPATH inaktiverad. Se till att ObsidianPluginDevPythonToJS.py finns i din skriptmapp eller hantera sys.path manuellt.',
+  SETTINGS_FORK_SERVER_NAME: 'Snabb skriptstart (fork-server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Håll en Python-process med biblioteket förinläst och forka varje skriptkörning från den, så att skript startar på millisekunder i stället för att starta en ny tolk. Endast macOS och Linux; används inte med uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'Kör alla skript: parallella körningar',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Hur många skript "Kör alla skript" kör samtidigt (1 = ett i taget). Ett skript kan ange define_settings(..., run_after=[...]) för att starta först när de listade skripten är klara.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Maximal begäransstorlek (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Största begäransinnehåll som bryggan tar emot från ett skript (t.ex. skriva en anteckning eller ladda upp en bilaga). Större begäranden avvisas med HTTP 413. Standard: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Felsökningsloggning',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Skriv detaljerade felsökningsmeddelanden (begäranden, svar, skriptutdata) till utvecklarkonsolen. Lämna avstängt för bästa prestanda.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Sökväg till Python Exekverbar Fil',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -186,4 +198,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Läs mer om säkerhetsöverväganden',
   ACTIVATION_WARNING_CANCEL: 'Avbryt',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Aktivera ändå',
+  NOTICE_MOVE_MANY_PROGRESS: 'Flyttar filer: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Uppdaterar länkar: {done}/{total}',
 };
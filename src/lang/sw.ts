@@ -119,6 +119,18 @@ export default {
     'Ongeza kiotomatiki saraka ya programu-jalizi kwenye PYTHONPATH wakati wa kuendesha hati, kuruhusu uagizaji wa moja kwa moja wa maktaba ya Python (Inapendekezwa). Ikiwa imezimwa, lazima unakili ObsidianPluginDevPythonToJS.py kwenye folda yako ya hati au udhibiti sys.path mwenyewe.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH otomatiki imezimwa. Hakikisha ObsidianPluginDevPythonToJS.py iko kwenye folda yako ya hati au dhibiti sys.path mwenyewe.',
+  SETTINGS_FORK_SERVER_NAME: 'Uzinduzi wa haraka wa skripti (seva ya fork)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Weka mchakato mmoja wa Python wenye maktaba iliyopakiwa tayari na uunde kila utekelezaji wa skripti kwa fork kutoka kwake, ili skripti zianze ndani ya milisekunde badala ya kuanzisha kitafsiri kipya. macOS na Linux pekee; haitumiki na uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'Endesha hati zote: uendeshaji sambamba',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Idadi ya hati ambazo "Endesha hati zote" huendesha kwa wakati mmoja (1 = moja baada ya nyingine). Hati inaweza kutangaza define_settings(..., run_after=[...]) ili ianze tu baada ya hati zilizoorodheshwa kumaliza.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Ukubwa wa juu wa ombi (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Maudhui makubwa zaidi ya ombi ambayo daraja hukubali kutoka kwa hati (k.m. kuandika dokezo au kupakia kiambatisho). Maombi makubwa zaidi hukataliwa kwa HTTP 413. Chaguo-msingi: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Kumbukumbu za utatuzi',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Andika ujumbe wa kina wa utatuzi (maombi, majibu, matokeo ya hati) kwenye kiweko cha msanidi. Acha kimezimwa kwa utendaji bora.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE:
     'Njia ya Faili ya Python Inayoweza Kutekelezwa',
@@ -187,4 +199,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Soma zaidi kuhusu mazingira ya usalama',
   ACTIVATION_WARNING_CANCEL: 'Ghairi',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Washa Hata Hivyo',
+  NOTICE_MOVE_MANY_PROGRESS: 'Inahamisha faili: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Inasasisha viungo: {done}/{total}',
 };
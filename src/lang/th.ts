@@ -117,6 +117,18 @@ export default {
     'เพิ่มไดเรกทอรีปลั๊กอินไปยัง PYTHONPATH โดยอัตโนมัติเมื่อเรียกใช้สคริปต์ ทำให้สามารถนำเข้าไลบรารี Python ได้โดยตรง (แนะนำ) หากปิดใช้งาน คุณต้องคัดลอก ObsidianPluginDevPythonToJS.py ไปยังโฟลเดอร์สคริปต์ของคุณ หรือจัดการ sys.path ด้วยตนเอง',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'ปิดใช้งาน PYTHONPATH อัตโนมัติแล้ว ตรวจสอบให้แน่ใจว่า ObsidianPluginDevPythonToJS.py อยู่ในโฟลเดอร์สคริปต์ของคุณ หรือจัดการ sys.path ด้วยตนเอง',
+  SETTINGS_FORK_SERVER_NAME: 'เริ่มสคริปต์อย่างรวดเร็ว (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'คงโปรเซส Python หนึ่งตัวที่โหลดไลบรารีไว้ล่วงหน้า และสร้างการรันสคริปต์แต่ละครั้งด้วย fork เพื่อให้สคริปต์เริ่มได้ในระดับมิลลิวินาทีแทนการเริ่มอินเทอร์พรีเตอร์ใหม่ เฉพาะ macOS และ Linux; ไม่ใช้กับ uv',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'เรียกใช้สคริปต์ทั้งหมด: การรันแบบขนาน',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'จำนวนสคริปต์ที่ "เรียกใช้สคริปต์ทั้งหมด" รันพร้อมกัน (1 = ทีละตัว) สคริปต์สามารถประกาศ define_settings(..., run_after=[...]) เพื่อเริ่มหลังจากสคริปต์ที่ระบุทำงานเสร็จแล้วเท่านั้น',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'ขนาดคำขอสูงสุด (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'เนื้อหาคำขอที่ใหญ่ที่สุดที่บริดจ์ยอมรับจากสคริปต์ (เช่น การเขียนโน้ตหรืออัปโหลดไฟล์แนบ) คำขอที่ใหญ่กว่านี้จะถูกปฏิเสธด้วย HTTP 413 ค่าเริ่มต้น: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'บันทึกการดีบัก',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'เขียนข้อความดีบักโดยละเอียด (คำขอ การตอบกลับ เอาต์พุตของสคริปต์) ลงในคอนโซลนักพัฒนา ปิดไว้เพื่อประสิทธิภาพที่ดีที่สุด',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'เส้นทางไฟล์ Python ที่เรียกใช้งานได้',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -184,4 +196,6 @@ export default {
     'อ่านเพิ่มเติมเกี่ยวกับข้อควรพิจารณาด้านความปลอดภัย',
   ACTIVATION_WARNING_CANCEL: 'ยกเลิก',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'เปิดใช้งานต่อไป',
+  NOTICE_MOVE_MANY_PROGRESS: 'กำลังย้ายไฟล์: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'กำลังอัปเดตลิงก์: {done}/{total}',
 };
@@ -126,6 +126,19 @@ export default {
     "Komut dosyalarını çalıştırırken eklenti dizinini otomatik olarak PYTHONPATH'a ekleyerek Python kitaplığının doğrudan içe aktarılmasına izin verir (Önerilir). Devre dışı bırakılırsa, ObsidianPluginDevPythonToJS.py dosyasını komut dosyası klasörünüze kopyalamanız veya sys.path'i manuel olarak yönetmeniz gerekir.",
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     "Otomatik PYTHONPATH devre dışı bırakıldı. ObsidianPluginDevPythonToJS.py dosyasının komut dosyası klasörünüzde olduğundan emin olun veya sys.path'i manuel olarak yönetin.",
+  SETTINGS_FORK_SERVER_NAME: 'Hızlı betik başlatma (fork sunucusu)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Kütüphanesi önceden yüklenmiş tek bir Python süreci tutulur ve her betik çalıştırması bundan fork ile oluşturulur; böylece betikler yeni bir yorumlayıcı başlatmak yerine milisaniyeler içinde başlar. Yalnızca macOS ve Linux; uv ile kullanılmaz.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Tüm betikleri çalıştır: paralel çalıştırmalar',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '"Tüm betikleri çalıştır" komutunun aynı anda kaç betik çalıştıracağı (1 = sırayla). Bir betik, yalnızca listelenen betikler bittikten sonra başlamak için define_settings(..., run_after=[...]) bildirebilir.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Maksimum istek boyutu (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Köprünün bir betikten kabul ettiği en büyük istek gövdesi (ör. not yazma veya ek yükleme). Daha büyük istekler HTTP 413 ile reddedilir. Varsayılan: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Hata ayıklama günlüğü',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Ayrıntılı hata ayıklama mesajlarını (istekler, yanıtlar, betik çıktısı) geliştirici konsoluna yaz. En iyi performans için kapalı bırakın.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python Çalıştırılabilir Dosya Yolu',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -195,4 +208,6 @@ export default {
     'Güvenlik hususları hakkında daha fazlasını okuyun',
   ACTIVATION_WARNING_CANCEL: 'İptal',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Yine de Etkinleştir',
+  NOTICE_MOVE_MANY_PROGRESS: 'Dosyalar taşınıyor: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Bağlantılar güncelleniyor: {done}/{total}',
 };
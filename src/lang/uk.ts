@@ -119,6 +119,18 @@ export default {
     'Автоматично додавати каталог плагіна до PYTHONPATH під час запуску скриптів, дозволяючи прямий імпорт бібліотеки Python (Рекомендовано). Якщо вимкнено, ви повинні скопіювати ObsidianPluginDevPythonToJS.py до вашої папки скриптів або керувати sys.path вручну.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'Автоматичний PYTHONPATH вимкнено. Переконайтеся, що ObsidianPluginDevPythonToJS.py знаходиться у вашій папці скриптів, або керуйте sys.path вручну.',
+  SETTINGS_FORK_SERVER_NAME: 'Швидкий запуск скриптів (fork-сервер)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Тримати один процес Python із попередньо завантаженою бібліотекою та запускати кожен скрипт через fork, щоб скрипти стартували за мілісекунди замість запуску нового інтерпретатора. Лише macOS і Linux; не використовується з uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'Запуск усіх скриптів: паралельні запуски',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Скільки скриптів «Запуск усіх скриптів» виконує одночасно (1 = по черзі). Скрипт може оголосити define_settings(..., run_after=[...]), щоб запускатися лише після завершення перелічених скриптів.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Максимальний розмір запиту (МБ)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Найбільше тіло запиту, яке міст приймає від скрипта (наприклад, запис нотатки або завантаження вкладення). Більші запити відхиляються з HTTP 413. За замовчуванням: 100 МБ',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Журнал налагодження',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Виводити докладні повідомлення налагодження (запити, відповіді, вивід скриптів) у консоль розробника. Для найкращої продуктивності залиште вимкненим.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Шлях до виконуваного файлу Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -187,4 +199,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Дізнатися більше про міркування безпеки',
   ACTIVATION_WARNING_CANCEL: 'Скасувати',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Все одно увімкнути',
+  NOTICE_MOVE_MANY_PROGRESS: 'Переміщення файлів: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Оновлення посилань: {done}/{total}',
 };
@@ -120,6 +120,18 @@ export default {
     'اسکرپٹ چلاتے وقت پلگ ان ڈائرکٹری کو خودکار طور پر PYTHONPATH میں شامل کریں، جس سے Python لائبریری کی براہ راست درآمد ممکن ہو (تجویز کردہ)۔ اگر غیر فعال ہے تو، آپ کو ObsidianPluginDevPythonToJS.py کو اپنے اسکرپٹ فولڈر میں کاپی کرنا ہوگا یا sys.path کو دستی طور پر منظم کرنا ہوگا۔',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'خودکار PYTHONPATH غیر فعال ہے۔ یقینی بنائیں کہ ObsidianPluginDevPythonToJS.py آپ کے اسکرپٹ فولڈر میں ہے یا sys.path کو دستی طور پر منظم کریں۔',
+  SETTINGS_FORK_SERVER_NAME: 'اسکرپٹس کا تیز آغاز (fork سرور)',
+  SETTINGS_FORK_SERVER_DESC:
+    'لائبریری پہلے سے لوڈ شدہ ایک Python پروسیس برقرار رکھیں اور ہر اسکرپٹ رن اسی سے fork کریں، تاکہ نیا انٹرپریٹر شروع کرنے کے بجائے اسکرپٹس ملی سیکنڈز میں شروع ہوں۔ صرف macOS اور Linux؛ uv کے ساتھ استعمال نہیں ہوتا۔',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: 'تمام اسکرپٹس چلائیں: متوازی رنز',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '"تمام اسکرپٹس چلائیں" ایک وقت میں کتنی اسکرپٹس چلاتا ہے (1 = ایک کے بعد ایک)۔ کوئی اسکرپٹ define_settings(..., run_after=[...]) کے ذریعے اعلان کر سکتی ہے کہ وہ درج اسکرپٹس ختم ہونے کے بعد ہی شروع ہو۔',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'درخواست کا زیادہ سے زیادہ سائز (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'سب سے بڑی درخواست جو برج کسی اسکرپٹ سے قبول کرتا ہے (مثلاً نوٹ لکھنا یا اٹیچمنٹ اپ لوڈ کرنا)۔ بڑی درخواستیں HTTP 413 کے ساتھ مسترد کر دی جاتی ہیں۔ ڈیفالٹ: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'ڈیبگ لاگنگ',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'تفصیلی ڈیبگ پیغامات (درخواستیں، جوابات، اسکرپٹ آؤٹ پٹ) ڈویلپر کنسول میں لکھیں۔ بہترین کارکردگی کے لیے بند رکھیں۔',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'پائیتھن ایگزیکیوٹیبل پاتھ',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -188,4 +200,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'سیکیورٹی غور و فکر کے بارے میں مزید پڑھیں',
   ACTIVATION_WARNING_CANCEL: 'منسوخ کریں',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'بھی فعال کریں',
+  NOTICE_MOVE_MANY_PROGRESS: 'فائلیں منتقل کی جا رہی ہیں: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'لنکس اپ ڈیٹ کیے جا رہے ہیں: {done}/{total}',
 };
@@ -117,6 +117,19 @@ export default {
     'Tự động thêm thư mục plugin vào PYTHONPATH khi chạy script, cho phép nhập trực tiếp thư viện Python (Khuyến nghị). Nếu bị tắt, bạn phải sao chép ObsidianPluginDevPythonToJS.py vào thư mục script của mình hoặc quản lý sys.path thủ công.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH tự động đã bị tắt. Đảm bảo ObsidianPluginDevPythonToJS.py nằm trong thư mục script của bạn hoặc quản lý sys.path thủ công.',
+  SETTINGS_FORK_SERVER_NAME: 'Khởi chạy script nhanh (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Giữ một tiến trình Python đã nạp sẵn thư viện và tạo mỗi lần chạy script bằng fork từ đó, để script khởi động trong vài mili giây thay vì khởi động trình thông dịch mới. Chỉ macOS và Linux; không dùng với uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Chạy tất cả script: số lần chạy song song',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Số script mà "Chạy tất cả script" chạy cùng lúc (1 = lần lượt từng script). Một script có thể khai báo define_settings(..., run_after=[...]) để chỉ bắt đầu sau khi các script được liệt kê đã kết thúc.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Kích thước yêu cầu tối đa (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Nội dung yêu cầu lớn nhất mà cầu nối chấp nhận từ một script (ví dụ ghi ghi chú hoặc tải lên tệp đính kèm). Yêu cầu lớn hơn bị từ chối với HTTP 413. Mặc định: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Ghi nhật ký gỡ lỗi',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Ghi thông báo gỡ lỗi chi tiết (yêu cầu, phản hồi, đầu ra script) vào bảng điều khiển nhà phát triển. Để tắt để có hiệu suất tốt nhất.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Đường dẫn Tệp Thực thi Python',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -183,4 +196,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Đọc thêm về các cân nhắc bảo mật',
   ACTIVATION_WARNING_CANCEL: 'Hủy',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Vẫn Bật',
+  NOTICE_MOVE_MANY_PROGRESS: 'Đang di chuyển tệp: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Đang cập nhật liên kết: {done}/{total}',
 };
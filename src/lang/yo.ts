@@ -115,6 +115,19 @@ export default {
     'Ṣafikun itọsọna itanna si PYTHONPATH laifọwọyi nigbati o nṣiṣẹ awọn iwe afọwọkọ, gbigba gbigbe wọle taara ti ile-ikawe Python (Iṣeduro). Ti o ba jẹ alaabo, o gbọdọ daakọ ObsidianPluginDevPythonToJS.py si folda iwe afọwọkọ rẹ tabi ṣakoso sys.path pẹlu ọwọ.',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     'PYTHONPATH aifọwọyi alaabo. Rii daju pe ObsidianPluginDevPythonToJS.py wa ninu folda iwe afọwọkọ rẹ tabi ṣakoso sys.path pẹlu ọwọ.',
+  SETTINGS_FORK_SERVER_NAME: 'Ìbẹ̀rẹ̀ ìwé-àfọwọ́kọ kíákíá (fork server)',
+  SETTINGS_FORK_SERVER_DESC:
+    'Pa ìlànà Python kan mọ́ tí a ti kó ìkàwé sínú rẹ̀ tẹ́lẹ̀, kí o sì ṣẹ̀dá ìṣiṣẹ́ ìwé-àfọwọ́kọ kọ̀ọ̀kan pẹ̀lú fork láti inú rẹ̀, kí àwọn ìwé-àfọwọ́kọ lè bẹ̀rẹ̀ láàárín milisekọndi dípò bíbẹ̀rẹ̀ olùtumọ̀ tuntun. macOS àti Linux nìkan; a kì í lò ó pẹ̀lú uv.',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME:
+    'Ṣiṣe gbogbo awọn iwe afọwọkọ: iṣiṣẹ ni akoko kan naa',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    'Iye awọn iwe afọwọkọ ti "Ṣiṣe gbogbo awọn iwe afọwọkọ" n ṣiṣẹ ni akoko kan naa (1 = ọkan lẹhin ekeji). Iwe afọwọkọ le kede define_settings(..., run_after=[...]) lati bẹrẹ nikan lẹhin ti awọn iwe afọwọkọ ti a ṣe akojọ ba pari.',
+  SETTINGS_MAX_REQUEST_BODY_NAME: 'Iwọn ibeere to pọ julọ (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    'Ara ibeere to tobi julọ ti afara gba lati inu iwe afọwọkọ (fun apẹẹrẹ kikọ akọsilẹ tabi gbigbe asomọ soke). Awọn ibeere to tobi ju bẹẹ lọ ni a kọ pẹlu HTTP 413. Aiyipada: 100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: 'Akọsilẹ atunṣe aṣiṣe',
+  SETTINGS_DEBUG_LOGGING_DESC:
+    'Kọ awọn ifiranṣẹ atunṣe aṣiṣe alaye (awọn ibeere, awọn idahun, iṣẹjade iwe afọwọkọ) si console olupilẹṣẹ. Fi silẹ ni pipa fun iṣẹ to dara julọ.',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Ọ̀nà Ètò Python Tí Ó Lè Ṣeéṣe',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -178,4 +191,6 @@ export default {
   ACTIVATION_WARNING_READMORE: 'Kà síi nípa àwọn nǹkan ààbò',
   ACTIVATION_WARNING_CANCEL: 'Fagile',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: 'Ṣe Ìṣe Bíkọ̀tá',
+  NOTICE_MOVE_MANY_PROGRESS: 'Ń gbé àwọn fáìlì lọ: {done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: 'Ń ṣe àtúnṣe àwọn ìjápọ̀: {done}/{total}',
 };
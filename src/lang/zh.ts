@@ -114,6 +114,17 @@ export default {
     '运行脚本时自动将插件目录添加到 PYTHONPATH，允许直接导入 Python 库（推荐）。如果禁用，您必须将 ObsidianPluginDevPythonToJS.py 复制到您的脚本文件夹或手动管理 sys.path。',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     '自动 PYTHONPATH 已禁用。请确保 ObsidianPluginDevPythonToJS.py 在您的脚本文件夹中，或手动管理 sys.path。',
+  SETTINGS_FORK_SERVER_NAME: '快速启动脚本（fork 服务器）',
+  SETTINGS_FORK_SERVER_DESC:
+    '保持一个已预加载库的 Python 进程，每次运行脚本时从中 fork，使脚本在几毫秒内启动，而不是启动新的解释器。仅限 macOS 和 Linux；使用 uv 时不启用。',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: '运行所有脚本：并行运行数',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '“运行所有脚本”同时运行的脚本数量（1 = 逐个运行）。脚本可以声明 define_settings(..., run_after=[...])，仅在所列脚本完成后才开始。',
+  SETTINGS_MAX_REQUEST_BODY_NAME: '最大请求大小 (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    '桥接从脚本接受的最大请求体（例如写入笔记或上传附件）。更大的请求会以 HTTP 413 拒绝。默认：100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: '调试日志',
+  SETTINGS_DEBUG_LOGGING_DESC: '将详细的调试信息（请求、响应、脚本输出）写入开发者控制台。为获得最佳性能请保持关闭。',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python 可执行文件路径',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -174,4 +185,6 @@ export default {
   ACTIVATION_WARNING_READMORE: '阅读更多关于安全注意事项',
   ACTIVATION_WARNING_CANCEL: '取消',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: '仍然激活',
+  NOTICE_MOVE_MANY_PROGRESS: '正在移动文件：{done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: '正在更新链接：{done}/{total}',
 };
@@ -108,6 +108,17 @@ export default {
     '執行腳本時自動將插件目錄添加到 PYTHONPATH，允許直接導入 Python 庫（推薦）。如果停用，您必須將 ObsidianPluginDevPythonToJS.py 複製到您的腳本資料夾或手動管理 sys.path。',
   NOTICE_AUTO_PYTHONPATH_DISABLED_DESC:
     '自動 PYTHONPATH 已停用。請確保 ObsidianPluginDevPythonToJS.py 在您的腳本資料夾中，或手動管理 sys.path。',
+  SETTINGS_FORK_SERVER_NAME: '快速啟動腳本（fork 伺服器）',
+  SETTINGS_FORK_SERVER_DESC:
+    '保持一個已預先載入程式庫的 Python 程序，每次執行腳本時從中 fork，使腳本在幾毫秒內啟動，而不是啟動新的直譯器。僅限 macOS 和 Linux；使用 uv 時不啟用。',
+  SETTINGS_RUN_ALL_CONCURRENCY_NAME: '執行所有腳本：平行執行數',
+  SETTINGS_RUN_ALL_CONCURRENCY_DESC:
+    '「執行所有腳本」同時執行的腳本數量（1 = 逐一執行）。腳本可以宣告 define_settings(..., run_after=[...])，僅在所列腳本完成後才開始。',
+  SETTINGS_MAX_REQUEST_BODY_NAME: '最大請求大小 (MB)',
+  SETTINGS_MAX_REQUEST_BODY_DESC:
+    '橋接從腳本接受的最大請求內容（例如寫入筆記或上傳附件）。更大的請求會以 HTTP 413 拒絕。預設：100MB',
+  SETTINGS_DEBUG_LOGGING_NAME: '除錯日誌',
+  SETTINGS_DEBUG_LOGGING_DESC: '將詳細的除錯訊息（請求、回應、腳本輸出）寫入開發者主控台。為獲得最佳效能請保持關閉。',
 
   SETTINGS_PYTHON_EXEC_PATH_TITLE: 'Python 可執行檔案路徑',
   SETTINGS_PYTHON_EXEC_PATH_DESC:
@@ -169,4 +180,6 @@ export default {
   ACTIVATION_WARNING_READMORE: '閱讀更多關於安全注意事項',
   ACTIVATION_WARNING_CANCEL: '取消',
   ACTIVATION_WARNING_ACTIVATE_ANYWAY: '仍然啟用',
+  NOTICE_MOVE_MANY_PROGRESS: '正在移動檔案：{done}/{total}',
+  NOTICE_MOVE_MANY_LINKS_PROGRESS: '正在更新連結：{done}/{total}',
 };
@@ -12,7 +12,7 @@ import { AddressInfo } from 'net';
 
 // Import types and constants
 import { PythonBridgeSettings, JsonResponse, JsonRequest } from './types'; // Keep if needed directly in main, otherwise remove
-import { DEFAULT_PORT } from './constants'; // Keep if needed directly in main, otherwise remove
+import { DEFAULT_MAX_REQUEST_BODY_SIZE, DEFAULT_PORT } from './constants'; // Keep if needed directly in main, otherwise remove
 
 // Import functions from new modules
 import { checkPythonEnvironment } from './environment_checker'; // Keep if used directly, e.g., in catch blocks
@@ -25,6 +25,20 @@ import {
 } from './python_executor'; // Keep for direct calls if any, or remove // Keep for command callback // Keep for command callback
 import { registerObsidianEventListeners } from './event_handler'; // Keep if used directly, otherwise remove
 import { dispatchAction } from './action_handler';
+import { handleStreamRequest } from './stream_handler';
+import { handleBinaryRequest } from './binary_handler';
+import { ChangeJournal } from './change_journal';
+import { ContentHashCache } from './content_hash_cache';
+import { ResponseCache } from './response_cache';
+import { ForkServer } from './fork_server';
+import { AuditLogWriter } from './audit_logger';
+import { EventPayloadBuilder } from './event_payload';
+import type { EventPayloadField } from './event_payload';
+import {
+  readRequestBody,
+  RequestBodyTooLargeError,
+  writeResponseBody,
+} from './http_body';
 
 // Import UI components
 import PythonBridgeSettingTab from './PythonBridgeSettingTab';
@@ -39,7 +53,13 @@ const DEFAULT_SETTINGS: PythonBridgeSettings = {
   disablePyCache: true,
   pythonExecutablePath: '', // Default to empty, meaning auto-detect
   autoSetPYTHONPATH: true,
+  useForkServer: false,
+  runAllConcurrency: 1,
+  maxRequestBodySize: DEFAULT_MAX_REQUEST_BODY_SIZE,
+  debugLogging: false,
   scriptSettingsDefinitions: {},
+  scriptSettingsHashes: {},
+  scriptRunAfter: {},
   scriptSettingsValues: {},
   scriptActivationStatus: {},
   scriptAutoStartStatus: {},
@@ -59,12 +79,19 @@ export default class ObsidianPythonBridge extends Plugin {
   initialHttpPort = 0; // Store the port used at server start
   pythonExecutable: string | null = null; // Managed by environment_checker
   dynamicScriptCommands: Map<string, Command> = new Map(); // Managed by python_executor
-  eventListeners: Map<string, Set<string>> = new Map(); // Managed by event_handler
+  eventListeners: Map<string, Map<string, EventPayloadField[]>> = new Map(); // Event -> script path -> requested note fields (managed by event_handler)
   pluginDirAbsPath: string | null = null; // Absolute path to the plugin's directory
+  changeJournal: ChangeJournal | null = null; // Started once the layout is ready
+  contentHashCache: ContentHashCache = new ContentHashCache(this); // Note hashes for change detection
+  responseCache: ResponseCache = new ResponseCache(this); // Memoized read-only action responses
+  forkServer: ForkServer = new ForkServer(this); // Pre-warmed interpreter for script runs (optional)
+  auditLogWriter: AuditLogWriter = new AuditLogWriter(this); // Buffered audit log appends
+  eventPayloads: EventPayloadBuilder = new EventPayloadBuilder(this); // Note fields for event payloads
 
   // --- Logging Helpers ---
   // (Keep these methods as they are used by other modules via the plugin instance)
   logDebug(message: string, ...optionalParams: unknown[]) {
+    if (!this.settings?.debugLogging) return; // Off by default (hot paths)
     console.debug(
       `plugin:obsidian-python-bridge:DEBUG: ${message}`,
       ...optionalParams
@@ -134,6 +161,7 @@ export default class ObsidianPythonBridge extends Plugin {
     const envCheckOk = await checkPythonEnvironment(this);
     if (envCheckOk) {
       this.startHttpServer(); // Start server only if Python env is okay
+      this.forkServer.update(); // Warm up the fork server, if enabled
 
       // Discover script settings and sync commands using the dedicated module
       // This now runs *after* pluginDirAbsPath is potentially determined
@@ -171,6 +199,15 @@ export default class ObsidianPythonBridge extends Plugin {
     );
     // Register Obsidian event listeners using the dedicated module
     registerObsidianEventListeners(this);
+    this.contentHashCache.start();
+    this.responseCache.start();
+
+    // Start the change journal after the initial vault indexing, so startup
+    // 'create' events are not recorded as changes.
+    this.app.workspace.onLayoutReady(() => {
+      this.changeJournal = new ChangeJournal(this);
+      this.changeJournal.start();
+    });
 
     this.logInfo('Obsidian Python Bridge plugin loaded.');
   } // --- End onload ---
@@ -179,6 +216,9 @@ export default class ObsidianPythonBridge extends Plugin {
     this.logInfo('Unloading Obsidian Python Bridge plugin...');
     this.stopHttpServer(); // Ensure server is stopped on unload
     this.eventListeners.clear(); // Clear listeners map
+    this.changeJournal?.flush(); // Persist pending journal entries
+    this.auditLogWriter.flush(); // Write buffered audit log entries
+    this.forkServer.stop(); // Stop the pre-warmed interpreter, if any
     this.logInfo('Obsidian Python Bridge plugin unloaded.');
   }
 
@@ -189,8 +229,16 @@ export default class ObsidianPythonBridge extends Plugin {
     this.settings.pythonExecutablePath =
       this.settings.pythonExecutablePath ?? ''; // Ensure default for existing users
     this.settings.autoSetPYTHONPATH = this.settings.autoSetPYTHONPATH ?? true; // Ensure default for existing users
+    this.settings.useForkServer = this.settings.useForkServer ?? false;
+    this.settings.runAllConcurrency = this.settings.runAllConcurrency ?? 1;
+    this.settings.maxRequestBodySize =
+      this.settings.maxRequestBodySize || DEFAULT_MAX_REQUEST_BODY_SIZE;
+    this.settings.debugLogging = this.settings.debugLogging ?? false;
     this.settings.scriptSettingsDefinitions =
       this.settings.scriptSettingsDefinitions || {};
+    this.settings.scriptSettingsHashes =
+      this.settings.scriptSettingsHashes || {};
+    this.settings.scriptRunAfter = this.settings.scriptRunAfter || {};
     this.settings.scriptSettingsValues =
       this.settings.scriptSettingsValues || {};
     this.settings.scriptActivationStatus =
@@ -374,6 +422,19 @@ export default class ObsidianPythonBridge extends Plugin {
           );
           return;
         }
+        // Streamed (NDJSON) requests are consumed incrementally by the stream handler
+        if (req.headers['content-type'] === 'application/x-ndjson') {
+          void handleStreamRequest(this, req).then(
+            ({ statusCode, response }) =>
+              this.sendJsonResponse(res, statusCode, response)
+          );
+          return;
+        }
+        // Binary requests (attachments) carry raw bytes instead of JSON
+        if (req.headers['content-type'] === 'application/octet-stream') {
+          void handleBinaryRequest(this, req, res);
+          return;
+        }
         // Check Content-Type
         if (req.headers['content-type'] !== 'application/json') {
           this.logWarn(
@@ -389,69 +450,51 @@ export default class ObsidianPythonBridge extends Plugin {
           return;
         }
         // Process request body
-        let body = '';
-        req.on('data', (chunk) => {
-          body += chunk.toString();
-        });
-        req.on('end', () => {
-          void (async () => {
-            let request: JsonRequest;
-            let response: JsonResponse;
-            let statusCode = 200; // Assume success initially
-            try {
-              this.logDebug(`Attempting to parse JSON request body: ${body}`);
-              request = JSON.parse(body);
-              if (
-                !request ||
-                typeof request !== 'object' ||
-                typeof request.action !== 'string' ||
-                !request.action
-              ) {
-                throw new Error(
-                  "Invalid JSON request structure. 'action' (non-empty string) is required."
-                );
-              }
-              // --- Delegate action handling ---
-              response = await dispatchAction(this, request);
-              // --- End Delegation ---
+        void (async () => {
+          let request: JsonRequest;
+          let response: JsonResponse;
+          let statusCode = 200; // Assume success initially
+          try {
+            const body = await readRequestBody(
+              req,
+              this.settings.maxRequestBodySize
+            );
+            if (this.settings.debugLogging)
               this.logDebug(
-                `Action ${request.action} handled, sending response:`,
-                response
+                `Parsing JSON request body (${body.byteLength} bytes): ${body.toString('utf8', 0, 500)}`
+              );
+            request = JSON.parse(body.toString('utf8'));
+            if (
+              !request ||
+              typeof request !== 'object' ||
+              typeof request.action !== 'string' ||
+              !request.action
+            ) {
+              throw new Error(
+                "Invalid JSON request structure. 'action' (non-empty string) is required."
               );
-            } catch (error) {
-              const errorMessage =
-                error instanceof Error ? error.message : String(error);
-              this.logError('Error processing request:', errorMessage);
-              statusCode = error instanceof SyntaxError ? 400 : 500; // Bad Request for JSON parse errors
-              response = {
-                status: 'error',
-                error: `Failed to process request: ${errorMessage}`,
-              };
-            }
-            // Send response
-            if (!res.writableEnded) {
-              const responseJson = JSON.stringify(response);
-              res.writeHead(statusCode, {
-                'Content-Type': 'application/json',
-                'Content-Length': Buffer.byteLength(responseJson),
-              });
-              res.end(responseJson);
-              this.logDebug(`HTTP Response sent (Status ${statusCode}).`);
             }
-          })();
-        });
-        req.on('error', (err) => {
-          this.logError('Error reading request stream:', err.message);
-          if (!res.writableEnded) {
-            res.writeHead(500, { 'Content-Type': 'application/json' });
-            res.end(
-              JSON.stringify({
-                status: 'error',
-                error: 'Error reading request data',
-              })
+            // --- Delegate action handling ---
+            response = await dispatchAction(this, request);
+            // --- End Delegation ---
+            this.logDebug(
+              `Action ${request.action} handled, sending response:`,
+              response
             );
+          } catch (error) {
+            const errorMessage =
+              error instanceof Error ? error.message : String(error);
+            this.logError('Error processing request:', errorMessage);
+            if (error instanceof RequestBodyTooLargeError) statusCode = 413;
+            else statusCode = error instanceof SyntaxError ? 400 : 500; // Bad Request for JSON parse errors
+            response = {
+              status: 'error',
+              error: `Failed to process request: ${errorMessage}`,
+            };
           }
-        });
+          // Send response
+          this.sendJsonResponse(res, statusCode, response);
+        })();
       }
     );
     this.server.on('error', (err: NodeJS.ErrnoException) => {
@@ -490,6 +533,22 @@ export default class ObsidianPythonBridge extends Plugin {
     }
   }
 
+  /** Serializes and sends a JSON response unless the response already ended. */
+  sendJsonResponse(
+    res: http.ServerResponse,
+    statusCode: number,
+    response: JsonResponse
+  ) {
+    if (res.writableEnded) return;
+    const body = Buffer.from(JSON.stringify(response), 'utf8'); // Encoded once
+    res.writeHead(statusCode, {
+      'Content-Type': 'application/json',
+      'Content-Length': body.byteLength,
+    });
+    void writeResponseBody(res, body);
+    this.logDebug(`HTTP Response sent (Status ${statusCode}).`);
+  }
+
   // --- Obsidian Interaction Helpers ---
   // These methods are called by action_handler and other modules via `plugin.xxx()`.
   showNotification(message: string, duration = 4000) {
@@ -11,25 +11,48 @@ export {
   getActiveNoteTitle,
 } from './api/active-note-path';
 export { getActiveNoteFrontmatter } from './api/active-note-frontmatter';
+export {
+  getActiveNoteSnapshot,
+  ACTIVE_NOTE_SNAPSHOT_FIELDS,
+} from './api/active-note-snapshot';
 
 // Vault Operations
 export {
   getCurrentVaultAbsolutePath,
   getAllNotePaths,
   getVaultName,
+  toVaultRelativePath,
 } from './api/vault-info';
 export {
   getNoteContentByPath,
   modifyNoteContentByRelativePath,
 } from './api/note-content';
 export { getNoteFrontmatterByPath } from './api/note-frontmatter';
+export {
+  getNoteContentIfModified,
+  getNoteFrontmatterIfModified,
+} from './api/conditional-read';
+export {
+  processFrontmatterBatch,
+  validateFrontmatterBatch,
+} from './api/frontmatter-ops';
+export { patchNoteByPath } from './api/note-patch';
+export { hashContent } from './api/content-hash';
 export {
   createNote,
   checkPathExists,
   deletePath,
   renamePath,
 } from './api/note-crud';
-export { createFolder, listFolder } from './api/folder-operations';
+export { moveMany } from './api/move-many';
+export { searchReplace, buildSearchRegExp } from './api/search-replace';
+export { readBinaryFile, writeBinaryFile } from './api/binary-files';
+export {
+  createFolder,
+  listFolder,
+  listTree,
+} from './api/folder-operations';
+export { listFiles } from './api/file-listing';
 
 // Link Operations
 export { getLinks } from './api/links';
@@ -54,4 +77,6 @@ export { toggleTheme } from './api/theme-control';
 // Utility Operations
 export { getObsidianLanguage } from './api/obsidian-info';
 export { runObsidianCommand } from './api/commands';
-export { getAllTags } from './api/tags';
+export { getScriptSettingsValues } from './api/script-settings';
+export { buildContextSnapshot } from './api/context-snapshot';
+export { getAllTags, getTagIndex } from './api/tags';
@@ -5,6 +5,7 @@
 import * as path from 'path';
 import * as os from 'os';
 import type ObsidianPythonBridge from './main';
+import { buildContextSnapshot } from './obsidian_api';
 
 // ---------------------------------------------------------------------------
 // Types
@@ -16,6 +17,8 @@ export interface PythonEnvOptions {
   extraVars?: Record<string, string>;
   /** Whether this is a settings-discovery invocation (sets OBSIDIAN_BRIDGE_MODE). */
   isDiscovery?: boolean;
+  /** Script path relative to the scripts folder; its settings go into the context snapshot. */
+  scriptRelativePath?: string;
 }
 
 // ---------------------------------------------------------------------------
@@ -30,9 +33,14 @@ export interface PythonEnvOptions {
  *   2. Common Obsidian env vars (OBSIDIAN_HTTP_PORT, OBSIDIAN_BRIDGE_ACTIVE, …)
  *   3. Optional overrides (discovery mode, event vars, token, etc.)
  *
+ * Non-discovery runs also receive OBSIDIAN_BRIDGE_CONTEXT, a JSON snapshot of
+ * the values scripts usually fetch right after connecting (vault path/name,
+ * active note, theme, language, script settings), so the Python client can
+ * serve them without a round trip each.
+ *
  * @param plugin   - The plugin instance (reads settings, port, plugin dir).
  * @param scriptDir - Absolute path to the directory containing the script.
- * @param options  - Optional overrides (extraVars, isDiscovery).
+ * @param options  - Optional overrides (extraVars, isDiscovery, scriptRelativePath).
  * @returns A plain object suitable for `spawn(cmd, args, { env })`.
  */
 export function buildPythonEnv(
@@ -40,7 +48,7 @@ export function buildPythonEnv(
   scriptDir: string,
   options: PythonEnvOptions = {}
 ): Record<string, string> {
-  const { extraVars = {}, isDiscovery = false } = options;
+  const { extraVars = {}, isDiscovery = false, scriptRelativePath } = options;
 
   // --- 1. Build PYTHONPATH ---
   const pythonPathEntries: string[] = [];
@@ -73,9 +81,18 @@ export function buildPythonEnv(
     PYTHONPATH: pythonPath,
   };
 
-  // --- 3. Optional: discovery mode ---
+  // --- 3. Discovery mode, or context snapshot for regular runs ---
   if (isDiscovery) {
     env.OBSIDIAN_BRIDGE_MODE = 'discovery';
+  } else {
+    try {
+      env.OBSIDIAN_BRIDGE_CONTEXT = JSON.stringify(
+        buildContextSnapshot(plugin, scriptRelativePath)
+      );
+    } catch (error) {
+      // Not fatal: the client falls back to regular API calls.
+      plugin.logWarn('Could not build context snapshot for script:', error);
+    }
   }
 
   // --- 4. Optional: __pycache__ suppression ---
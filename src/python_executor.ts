@@ -3,18 +3,24 @@
 
 import { Notice, normalizePath } from 'obsidian';
 import { spawn } from 'child_process';
+import { createHash } from 'crypto';
 import * as fs from 'fs';
 import * as path from 'path';
 import type ObsidianPythonBridge from './main'; // Import the main plugin type
 import { t } from './lang/translations'; // Import translation function
 import {
   SETTINGS_DISCOVERY_TIMEOUT,
+  SETTINGS_DISCOVERY_CONCURRENCY,
+  MAX_RUN_ALL_CONCURRENCY,
+  STATIC_SETTINGS_EXTRACTOR,
   PYTHON_LIBRARY_FILENAME,
 } from './constants';
 import type { ScriptSettingDefinition } from './types'; // Import types
 import ScriptSelectionModal from './ScriptSelectionModal'; // Import modal
 import { logScriptExecution } from './audit_logger'; // Import audit logger
 import { buildPythonEnv, buildPythonArgs } from './python_env'; // DRY env construction
+import { mapWithConcurrency, runWithDependencies } from './concurrency';
+import { launchPythonScript } from './fork_server';
 
 /**
  * Resolves the absolute path to the Python scripts folder based on settings.
@@ -69,6 +75,37 @@ export function getScriptsFolderPath(plugin: ObsidianPythonBridge): string {
   }
 }
 
+/** What a script declares with define_settings (its --get-settings-json output). */
+export interface DiscoveredSettings {
+  definitions: ScriptSettingDefinition[];
+  /** Scripts to run before this one in "Run all scripts" (relative paths). */
+  runAfter: string[];
+}
+
+/**
+ * Validates the --get-settings-json output of a script: a definitions array,
+ * or `{"settings": [...], "run_after": [...]}` when metadata is declared.
+ * @param output The parsed JSON output.
+ * @returns The declared settings, or null if the output is not valid.
+ */
+function parseSettingsOutput(output: unknown): DiscoveredSettings | null {
+  if (Array.isArray(output))
+    return { definitions: output as ScriptSettingDefinition[], runAfter: [] };
+  if (!output || typeof output !== 'object') return null;
+  const { settings, run_after } = output as Record<string, unknown>;
+  if (!Array.isArray(settings)) return null;
+  if (
+    run_after !== undefined &&
+    (!Array.isArray(run_after) ||
+      !run_after.every((entry) => typeof entry === 'string'))
+  )
+    return null;
+  return {
+    definitions: settings as ScriptSettingDefinition[],
+    runAfter: (run_after as string[] | undefined) ?? [],
+  };
+}
+
 /**
  * Executes a Python script to retrieve its settings definitions JSON.
  * @param plugin The ObsidianPythonBridge plugin instance.
@@ -78,7 +115,7 @@ export function getScriptsFolderPath(plugin: ObsidianPythonBridge): string {
 export async function discoverScriptSettings(
   plugin: ObsidianPythonBridge,
   scriptAbsolutePath: string
-): Promise<ScriptSettingDefinition[] | null> {
+): Promise<DiscoveredSettings | null> {
   const scriptName = path.basename(scriptAbsolutePath);
   plugin.logDebug(`Discovering settings for script: ${scriptName}`);
   if (!plugin.pythonExecutable) {
@@ -166,11 +203,11 @@ export async function discoverScriptSettings(
           plugin.logDebug(
             `Script ${scriptName} provided no settings output (empty stdout). Assuming no settings.`
           );
-          resolve([]);
+          resolve({ definitions: [], runAfter: [] });
           return;
         } // Success, but no settings defined
-        const definitions = JSON.parse(trimmedStdout);
-        if (!Array.isArray(definitions)) {
+        const discovered = parseSettingsOutput(JSON.parse(trimmedStdout));
+        if (!discovered) {
           plugin.logError(
             `Settings discovery failed for script '${scriptAbsolutePath}': Parsed output is not a valid settings array`
           );
@@ -185,9 +222,9 @@ export async function discoverScriptSettings(
         }
         // Optional: Add more validation for each definition object structure here
         plugin.logInfo(
-          `Successfully discovered ${definitions.length} settings for ${scriptName}.`
+          `Successfully discovered ${discovered.definitions.length} settings for ${scriptName}.`
         );
-        resolve(definitions as ScriptSettingDefinition[]);
+        resolve(discovered);
       } catch (error) {
         const errorMsg = error instanceof Error ? error.message : String(error);
         plugin.logError(
@@ -205,9 +242,203 @@ export async function discoverScriptSettings(
   });
 }
 
+/**
+ * Reads the settings definitions of several scripts from their source, without
+ * executing them, using the library's static extractor (one process for all).
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param scriptAbsolutePaths Absolute paths of the scripts.
+ * @returns The settings found, keyed by absolute path. Scripts whose
+ *   definitions are not literal are missing and must be executed instead.
+ */
+async function extractSettingsStatically(
+  plugin: ObsidianPythonBridge,
+  scriptAbsolutePaths: string[]
+): Promise<Map<string, DiscoveredSettings>> {
+  const found = new Map<string, DiscoveredSettings>();
+  if (!scriptAbsolutePaths.length || !plugin.pythonExecutable) return found;
+  const extractorPath = plugin.pluginDirAbsPath
+    ? path.join(plugin.pluginDirAbsPath, STATIC_SETTINGS_EXTRACTOR)
+    : '';
+  if (!extractorPath || !fs.existsSync(extractorPath)) {
+    plugin.logDebug(
+      'Static settings extractor not found in the plugin folder, executing scripts for discovery.'
+    );
+    return found;
+  }
+
+  const executableToRun = plugin.pythonExecutable;
+  const commandArgs = buildPythonArgs(
+    executableToRun,
+    extractorPath,
+    false,
+    scriptAbsolutePaths
+  );
+  const extractorDir = path.dirname(extractorPath);
+  const output = await new Promise<string | null>((resolve) => {
+    const extractorProcess = spawn(executableToRun, commandArgs, {
+      timeout: SETTINGS_DISCOVERY_TIMEOUT,
+      cwd: extractorDir,
+      env: buildPythonEnv(plugin, extractorDir, { isDiscovery: true }),
+    });
+    let stdoutData = '';
+    let stderrData = '';
+    extractorProcess.stdout?.on('data', (data) => {
+      stdoutData += data.toString();
+    });
+    extractorProcess.stderr?.on('data', (data) => {
+      stderrData += data.toString();
+    });
+    extractorProcess.on('error', (error) => {
+      plugin.logWarn(
+        `Static settings extraction could not start: ${error.message}`
+      );
+      resolve(null);
+    });
+    extractorProcess.on('close', (code) => {
+      if (code !== 0) {
+        plugin.logWarn(
+          `Static settings extraction exited with code ${code}: ${stderrData.trim()}`
+        );
+        resolve(null);
+        return;
+      }
+      resolve(stdoutData);
+    });
+  });
+  if (output === null) return found;
+
+  try {
+    const results = JSON.parse(output) as Record<string, unknown>;
+    for (const scriptAbsolutePath of scriptAbsolutePaths) {
+      const discovered = parseSettingsOutput(results[scriptAbsolutePath]);
+      if (discovered) found.set(scriptAbsolutePath, discovered);
+    }
+  } catch (error) {
+    plugin.logWarn('Static settings extraction returned invalid JSON:', error);
+  }
+  return found;
+}
+
+/** A script whose settings definitions must be determined. */
+interface SettingsDiscoveryTarget {
+  relativePath: string;
+  scriptAbsolutePath: string;
+}
+
+/** Outcome of settings discovery for one script. */
+interface SettingsDiscoveryResult {
+  /** The definitions, or null if discovery failed. */
+  definitions: ScriptSettingDefinition[] | null;
+  /** The scripts it must run after (see DiscoveredSettings). */
+  runAfter: string[];
+  /** SHA-256 of the script content the definitions belong to. */
+  hash: string | null;
+}
+
+/**
+ * Determines the settings definitions of several scripts, as cheaply as possible:
+ * 1. Unchanged scripts (same content hash) reuse their cached definitions.
+ * 2. Literal `define_settings([...])` calls are read statically, without
+ *    running the scripts.
+ * 3. The remaining scripts are executed with --get-settings-json, a bounded
+ *    number at a time.
+ * @param plugin The ObsidianPythonBridge plugin instance.
+ * @param scripts The scripts to discover.
+ * @param useCache False to ignore cached definitions (manual refresh: a script
+ *   may build its definitions from other, changed files).
+ * @returns The result for every script, keyed by relative path.
+ */
+async function resolveScriptSettings(
+  plugin: ObsidianPythonBridge,
+  scripts: SettingsDiscoveryTarget[],
+  useCache: boolean
+): Promise<Map<string, SettingsDiscoveryResult>> {
+  const results = new Map<string, SettingsDiscoveryResult>();
+  const { scriptSettingsDefinitions, scriptSettingsHashes, scriptRunAfter } =
+    plugin.settings;
+
+  // 1. Content-hash cache
+  const changed: (SettingsDiscoveryTarget & { hash: string | null })[] = [];
+  await Promise.all(
+    scripts.map(async (script) => {
+      let hash: string | null = null;
+      try {
+        const content = await fs.promises.readFile(script.scriptAbsolutePath);
+        hash = createHash('sha256').update(content).digest('hex');
+      } catch (error) {
+        plugin.logWarn(`Could not hash script ${script.relativePath}:`, error);
+      }
+      const cached = scriptSettingsDefinitions[script.relativePath];
+      if (
+        useCache &&
+        hash !== null &&
+        hash === scriptSettingsHashes[script.relativePath] &&
+        cached
+      )
+        results.set(script.relativePath, {
+          definitions: cached,
+          runAfter: scriptRunAfter[script.relativePath] ?? [],
+          hash,
+        });
+      else changed.push({ ...script, hash });
+    })
+  );
+  const cachedCount = results.size;
+
+  // 2. Static extraction
+  const extracted = await extractSettingsStatically(
+    plugin,
+    changed.map((script) => script.scriptAbsolutePath)
+  );
+  const toExecute: typeof changed = [];
+  for (const script of changed) {
+    const discovered = extracted.get(script.scriptAbsolutePath);
+    if (discovered) {
+      plugin.logDebug(
+        `Read ${discovered.definitions.length} settings for ${script.relativePath} statically.`
+      );
+      results.set(script.relativePath, { ...discovered, hash: script.hash });
+    } else {
+      toExecute.push(script);
+    }
+  }
+
+  // 3. Execution, for scripts whose definitions are not literal
+  await mapWithConcurrency(
+    toExecute,
+    SETTINGS_DISCOVERY_CONCURRENCY,
+    async (script) => {
+      let discovered: DiscoveredSettings | null = null;
+      try {
+        discovered = await discoverScriptSettings(
+          plugin,
+          script.scriptAbsolutePath
+        );
+      } catch (error) {
+        // Catch unexpected errors during the discoverScriptSettings call itself
+        plugin.logError(
+          `Unexpected error during settings discovery call for ${script.relativePath}:`,
+          error
+        );
+      }
+      results.set(script.relativePath, {
+        definitions: discovered?.definitions ?? null,
+        runAfter: discovered?.runAfter ?? [],
+        hash: script.hash,
+      });
+    }
+  );
+
+  plugin.logInfo(
+    `Settings discovery: ${cachedCount} cached, ${extracted.size} read statically, ${toExecute.length} executed.`
+  );
+  return results;
+}
+
 /**
  * Scans the scripts folder, discovers settings for each script, and updates the cache.
  * Handles clearing cached definitions if discovery fails for a script.
+ * Unchanged scripts are not re-executed unless the refresh is manual.
  * @param plugin The ObsidianPythonBridge plugin instance.
  * @param scriptsFolder Absolute path to the Python scripts folder.
  */
@@ -256,6 +487,9 @@ export async function updateScriptSettingsCache(
   const newDefinitions: Record<string, ScriptSettingDefinition[]> = {};
   let changesMade = false; // Track if any updates require saving settings
   const currentScriptPaths = new Set<string>(); // Keep track of scripts found in the folder
+  const newHashes: Record<string, string> = {}; // Content hashes of discovered scripts
+  const newRunAfter: Record<string, string[]> = {}; // Declared run_after of discovered scripts
+  const scriptsToDiscover: SettingsDiscoveryTarget[] = [];
 
   for (const file of pythonFiles) {
     const scriptAbsolutePath = path.join(scriptsFolder, file);
@@ -264,7 +498,6 @@ export async function updateScriptSettingsCache(
       path.relative(scriptsFolder, scriptAbsolutePath)
     );
     currentScriptPaths.add(relativePath);
-    let discoveryFailed = false; // Flag to track failure for the current script
 
     // Security: Default new scripts to disabled state
     if (!(relativePath in plugin.settings.scriptActivationStatus)) {
@@ -319,42 +552,25 @@ export async function updateScriptSettingsCache(
       continue; // Skip to next script
     }
 
-    try {
-      // Attempt to discover settings by running the script with --get-settings-json
-      const definitions = await discoverScriptSettings(
-        plugin,
-        scriptAbsolutePath
-      );
+    scriptsToDiscover.push({ relativePath, scriptAbsolutePath });
+  } // --- End of script file loop ---
 
-      // discoverScriptSettings returns null on failure (timeout, non-zero exit, parse error, etc.)
-      if (definitions === null) {
-        discoveryFailed = true;
-        failedScripts.push(relativePath);
-      } else {
-        // Discovery succeeded (definitions can be an empty array if no settings are defined)
-        newDefinitions[relativePath] = definitions;
-        // Check if the discovered definitions differ from the cached ones
-        if (
-          JSON.stringify(definitions) !==
-          JSON.stringify(
-            plugin.settings.scriptSettingsDefinitions[relativePath]
-          )
-        ) {
-          changesMade = true;
-          plugin.logDebug(`Definitions updated or added for ${relativePath}`);
-        }
-      }
-    } catch (error) {
-      // Catch unexpected errors during the discoverScriptSettings call itself
-      plugin.logError(
-        `Unexpected error during settings discovery call for ${file}:`,
-        error
-      );
-      discoveryFailed = true;
-    }
+  // --- Discover settings of enabled scripts (cache, static, then execution) ---
+  const discovered = await resolveScriptSettings(
+    plugin,
+    scriptsToDiscover,
+    !isManualRefresh
+  );
+  for (const { relativePath } of scriptsToDiscover) {
+    const { definitions, runAfter, hash } = discovered.get(relativePath) ?? {
+      definitions: null,
+      runAfter: [],
+      hash: null,
+    };
 
-    // --- Handle Cache Clearing on Discovery Failure ---
-    if (discoveryFailed) {
+    // discoverScriptSettings returns null on failure (timeout, non-zero exit, parse error, etc.)
+    if (definitions === null) {
+      failedScripts.push(relativePath);
       // If discovery failed, check if there were old definitions cached
       if (
         Object.prototype.hasOwnProperty.call(
@@ -368,9 +584,22 @@ export async function updateScriptSettingsCache(
         // By *not* adding this script to newDefinitions, we effectively remove it.
         changesMade = true; // Mark that a change (removal) occurred
       }
-      // If no old cache existed, we just logged the failure above.
+      continue;
     }
-  } // --- End of script file loop ---
+
+    // Discovery succeeded (definitions can be an empty array if no settings are defined)
+    newDefinitions[relativePath] = definitions;
+    if (hash !== null) newHashes[relativePath] = hash;
+    if (runAfter.length) newRunAfter[relativePath] = runAfter;
+    // Check if the discovered definitions differ from the cached ones
+    if (
+      JSON.stringify(definitions) !==
+      JSON.stringify(plugin.settings.scriptSettingsDefinitions[relativePath])
+    ) {
+      changesMade = true;
+      plugin.logDebug(`Definitions updated or added for ${relativePath}`);
+    }
+  }
 
   // --- Final Cleanup: Remove data for scripts no longer present and orphaned values ---
   const previouslyCachedPaths = Object.keys(
@@ -442,7 +671,11 @@ export async function updateScriptSettingsCache(
   // Check if the overall structure of definitions changed (covers additions/removals)
   if (
     JSON.stringify(newDefinitions) !==
-    JSON.stringify(plugin.settings.scriptSettingsDefinitions)
+      JSON.stringify(plugin.settings.scriptSettingsDefinitions) ||
+    JSON.stringify(newHashes) !==
+      JSON.stringify(plugin.settings.scriptSettingsHashes) ||
+    JSON.stringify(newRunAfter) !==
+      JSON.stringify(plugin.settings.scriptRunAfter)
   ) {
     changesMade = true;
   }
@@ -451,6 +684,8 @@ export async function updateScriptSettingsCache(
   if (changesMade) {
     plugin.logInfo('Script settings definitions cache updated.');
     plugin.settings.scriptSettingsDefinitions = newDefinitions;
+    plugin.settings.scriptSettingsHashes = newHashes;
+    plugin.settings.scriptRunAfter = newRunAfter;
     // Note: scriptSettingsValues and statuses might have been modified directly above
     await plugin.saveSettings();
   } else {
@@ -569,11 +804,13 @@ export async function runPythonScript(
 
   // Log script execution start
   logScriptExecution(plugin, scriptFilename, context, 'start');
+  const startedAt = Date.now();
   // Prepare environment variables using centralized builder
   const env = buildPythonEnv(plugin, scriptDir, {
     extraVars: {
       ...(relativePath && { OBSIDIAN_SCRIPT_RELATIVE_PATH: relativePath }),
     },
+    scriptRelativePath: relativePath || undefined,
   });
   plugin.logDebug(
     `Setting OBSIDIAN_HTTP_PORT=${plugin.initialHttpPort} for script.`
@@ -595,10 +832,13 @@ export async function runPythonScript(
   try {
     await new Promise<void>((resolve, reject) => {
       plugin.logDebug(`Executing: ${executableToRun} ${fullArgs.join(' ')}`);
-      const pythonProcess = spawn(executableToRun, fullArgs, {
-        env,
-        cwd: scriptDir,
-      });
+      const pythonProcess = launchPythonScript(
+        plugin,
+        scriptPath,
+        executableToRun,
+        fullArgs,
+        { env, cwd: scriptDir }
+      );
       let stderrOutput = '';
       pythonProcess.stderr?.on('data', (data) => {
         const msg = data.toString();
@@ -641,7 +881,8 @@ export async function runPythonScript(
             context,
             'error',
             code || undefined,
-            stderrOutput.trim()
+            stderrOutput.trim(),
+            Date.now() - startedAt
           );
 
           reject(new Error(`Script exited with non-zero code: ${code}`));
@@ -652,7 +893,9 @@ export async function runPythonScript(
             scriptFilename,
             context,
             'success',
-            code || undefined
+            code || undefined,
+            undefined,
+            Date.now() - startedAt
           );
           resolve(); // Success
         }
@@ -673,7 +916,8 @@ export async function runPythonScript(
       context,
       'error',
       undefined,
-      error instanceof Error ? error.message : String(error)
+      error instanceof Error ? error.message : String(error),
+      Date.now() - startedAt
     );
 
     // Notices are handled inside the promise callbacks/rejections for manual context
@@ -725,7 +969,9 @@ export function chooseAndRunPythonScript(plugin: ObsidianPythonBridge): void {
 }
 
 /**
- * Runs all active Python scripts found in the configured folder sequentially.
+ * Runs all active Python scripts found in the configured folder, in name
+ * order, `runAllConcurrency` at a time (one after another by default). A
+ * script that declares `run_after` starts once those scripts have finished.
  * @param plugin The ObsidianPythonBridge plugin instance.
  */
 export async function runAllPythonScripts(
@@ -771,14 +1017,35 @@ export async function runAllPythonScripts(
   new Notice(
     `${t('NOTICE_RUNNING_ALL_SCRIPTS_PREFIX')} ${activeScriptsToRun.length} ${t('NOTICE_RUNNING_ALL_SCRIPTS_SUFFIX')}`
   );
+  const concurrency = Math.min(
+    Math.max(1, Math.floor(plugin.settings.runAllConcurrency) || 1),
+    MAX_RUN_ALL_CONCURRENCY
+  );
   plugin.logInfo(
-    `Starting batch run of ${activeScriptsToRun.length} active scripts...`
+    `Starting batch run of ${activeScriptsToRun.length} active scripts (${concurrency} at a time)...`
+  );
+  // run_after entries name scripts relative to the scripts folder; ".py" is optional
+  const dependenciesOf = (file: string) =>
+    (plugin.settings.scriptRunAfter[file] ?? []).map((entry) => {
+      const dependency = normalizePath(entry);
+      return dependency.toLowerCase().endsWith('.py')
+        ? dependency
+        : `${dependency}.py`;
+    });
+  await runWithDependencies(
+    activeScriptsToRun,
+    concurrency,
+    dependenciesOf,
+    async (file) => {
+      plugin.logInfo(`Run All: Running next script: ${file}`);
+      const scriptPath = path.join(scriptsFolder, file);
+      await runPythonScript(plugin, scriptPath, 'manual'); // Context is still manual trigger
+    },
+    (blocked) =>
+      plugin.logWarn(
+        `Run All: run_after cycle between ${blocked.join(', ')}; starting ${blocked[0]} anyway.`
+      )
   );
-  for (const file of activeScriptsToRun) {
-    const scriptPath = path.join(scriptsFolder, file);
-    plugin.logInfo(`Run All: Running next script: ${file}`);
-    await runPythonScript(plugin, scriptPath, 'manual'); // Use await here to ensure scripts run one after another // Context is still manual trigger
-  }
   plugin.logInfo('Finished batch run of active scripts.');
 }
 
@@ -0,0 +1,151 @@
+// --- src/response_cache.ts ---
+// Memoizes the responses of expensive read-only actions until a vault or
+// metadata event makes them stale.
+
+import type ObsidianPythonBridge from './main';
+import { RESPONSE_CACHE_MAX_ENTRIES } from './constants';
+
+/**
+ * What a cached response depends on:
+ * - 'structure': the set of files (vault create/delete/rename).
+ * - 'metadata': parsed note metadata — links, tags, frontmatter
+ *   (metadataCache changed/deleted/resolve, vault rename).
+ */
+export type CacheDependency = 'structure' | 'metadata';
+
+interface CacheEntry {
+  data: unknown;
+  dependsOn: CacheDependency[];
+}
+
+/** Identifies a missed lookup and the cache state it was made against. */
+export interface CacheToken {
+  key: string;
+  generations: Record<CacheDependency, number>;
+}
+
+interface ActionStats {
+  hits: number;
+  misses: number;
+}
+
+export class ResponseCache {
+  /** Insertion-ordered, so the first key is the least recently used. */
+  private entries = new Map<string, CacheEntry>();
+  /** Bumped on invalidation, so results computed meanwhile are not stored. */
+  private generations: Record<CacheDependency, number> = {
+    structure: 0,
+    metadata: 0,
+  };
+  private stats = new Map<string, ActionStats>();
+  private evictions = 0;
+  private invalidations: Record<CacheDependency, number> = {
+    structure: 0,
+    metadata: 0,
+  };
+
+  constructor(private plugin: ObsidianPythonBridge) {}
+
+  /** Starts invalidating cached responses on vault and metadata events. */
+  start(): void {
+    const { vault, metadataCache } = this.plugin.app;
+    const on = (dependency: CacheDependency) => () =>
+      this.invalidate(dependency);
+    this.plugin.registerEvent(vault.on('create', on('structure')));
+    this.plugin.registerEvent(vault.on('delete', on('structure')));
+    this.plugin.registerEvent(vault.on('rename', on('structure')));
+    this.plugin.registerEvent(vault.on('rename', on('metadata')));
+    this.plugin.registerEvent(metadataCache.on('changed', on('metadata')));
+    this.plugin.registerEvent(metadataCache.on('deleted', on('metadata')));
+    this.plugin.registerEvent(metadataCache.on('resolve', on('metadata')));
+  }
+
+  /**
+   * Returns the cached response for an action call and a token to store
+   * the computed response with, on a miss.
+   * @param action The action name.
+   * @param payload The request payload (part of the cache key).
+   */
+  lookup(
+    action: string,
+    payload: Record<string, unknown>
+  ): { hit: true; data: unknown } | { hit: false; token: CacheToken } {
+    const key = `${action}\u0000${JSON.stringify(payload)}`;
+    const stats = this.statsFor(action);
+    const entry = this.entries.get(key);
+    if (entry) {
+      stats.hits++;
+      // Refresh the entry's position in the LRU order.
+      this.entries.delete(key);
+      this.entries.set(key, entry);
+      return { hit: true, data: entry.data };
+    }
+    stats.misses++;
+    return {
+      hit: false,
+      token: { key, generations: { ...this.generations } },
+    };
+  }
+
+  /**
+   * Stores a computed response, unless one of its dependencies was
+   * invalidated while it was being computed.
+   * @param token The token returned by the missed lookup.
+   * @param dependsOn The events that make the response stale.
+   * @param data The response data.
+   */
+  store(
+    token: CacheToken,
+    dependsOn: CacheDependency[],
+    data: unknown
+  ): void {
+    if (dependsOn.some((d) => token.generations[d] !== this.generations[d]))
+      return;
+    this.entries.set(token.key, { data, dependsOn });
+    while (this.entries.size > RESPONSE_CACHE_MAX_ENTRIES) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      this.evictions++;
+    }
+  }
+
+  /** Drops every cached response that depends on `dependency`. */
+  invalidate(dependency: CacheDependency): void {
+    this.generations[dependency]++;
+    this.invalidations[dependency]++;
+    for (const [key, entry] of this.entries) {
+      if (entry.dependsOn.includes(dependency)) this.entries.delete(key);
+    }
+  }
+
+  /** Hit/miss statistics, for the get_bridge_diagnostics action. */
+  getStats(): Record<string, unknown> {
+    let hits = 0;
+    let misses = 0;
+    const actions: Record<string, ActionStats> = {};
+    for (const [action, stats] of this.stats) {
+      hits += stats.hits;
+      misses += stats.misses;
+      actions[action] = { ...stats };
+    }
+    return {
+      entries: this.entries.size,
+      max_entries: RESPONSE_CACHE_MAX_ENTRIES,
+      hits,
+      misses,
+      hit_rate: hits + misses ? hits / (hits + misses) : null,
+      evictions: this.evictions,
+      invalidations: { ...this.invalidations },
+      actions,
+    };
+  }
+
+  private statsFor(action: string): ActionStats {
+    let stats = this.stats.get(action);
+    if (!stats) {
+      stats = { hits: 0, misses: 0 };
+      this.stats.set(action, stats);
+    }
+    return stats;
+  }
+}
@@ -0,0 +1,88 @@
+// --- src/stream_actions.ts ---
+// Registry of streaming actions. A streaming action receives its payload in the
+// first line of an NDJSON request body and then consumes one item per
+// following line, while the body is still arriving (see stream_handler.ts).
+
+import type ObsidianPythonBridge from './main';
+import type { PayloadValidator } from './action_registry';
+import { openEditorStream, StreamInsertAnchor } from './api/editor-stream';
+import { NoteImporter, ImportIfExists } from './api/note-import';
+
+// ---------------------------------------------------------------------------
+// Types
+// ---------------------------------------------------------------------------
+
+/** An open stream: consumes items in order, then produces the response data. */
+export interface StreamSession {
+  /**
+   * Applies one item. May return a promise; the handler stops reading the
+   * request body until it settles (back-pressure).
+   */
+  write(item: Record<string, unknown>): Promise<void> | void;
+  /** Called once the whole body has been consumed; returns response data. */
+  finish(): Promise<unknown>;
+  /** Called instead of `finish` when the stream fails part-way through. */
+  abort?(): void;
+}
+
+export interface StreamActionDefinition {
+  validate?: PayloadValidator;
+  open: (
+    plugin: ObsidianPythonBridge,
+    payload: Record<string, unknown>
+  ) => Promise<StreamSession> | StreamSession;
+}
+
+// ---------------------------------------------------------------------------
+// Stream action registry
+// ---------------------------------------------------------------------------
+
+export const streamActionRegistry: Record<string, StreamActionDefinition> = {
+  // =========================================================================
+  // Editor — Streamed insertion
+  // =========================================================================
+
+  stream_insert: {
+    validate: (p) => {
+      if (p.at !== 'cursor' && p.at !== 'end' && p.at !== 'position')
+        return "Invalid payload: 'at' must be 'cursor', 'end' or 'position'.";
+      if (
+        p.at === 'position' &&
+        (typeof p.line !== 'number' || typeof p.ch !== 'number')
+      )
+        return "Invalid payload: 'line' and 'ch' (numbers) required for 'position'.";
+      return null;
+    },
+    open: (plugin, payload) => {
+      const writer = openEditorStream(plugin, payload as StreamInsertAnchor);
+      return {
+        write: (item) => {
+          if (typeof item.text !== 'string')
+            throw new Error("Invalid stream item: 'text' (string) required.");
+          return writer.write(item.text);
+        },
+        finish: () => writer.finish(),
+        abort: () => writer.abort(),
+      };
+    },
+  },
+
+  // =========================================================================
+  // Vault — Bulk import
+  // =========================================================================
+
+  import_notes: {
+    validate: (p) =>
+      p.if_exists === undefined ||
+      p.if_exists === 'error' ||
+      p.if_exists === 'skip' ||
+      p.if_exists === 'overwrite'
+        ? null
+        : "Invalid payload: 'if_exists' must be 'error', 'skip' or 'overwrite'.",
+    open: (plugin, payload) =>
+      new NoteImporter(
+        plugin,
+        (payload.if_exists as ImportIfExists | undefined) ?? 'error'
+      ),
+  },
+};
@@ -0,0 +1,157 @@
+// --- src/stream_handler.ts ---
+// Handles streamed (NDJSON) requests: the first line is the usual
+// {action, payload} header, every following line is one item for the
+// streaming action. Items are applied while the body is still arriving;
+// reading pauses whenever the action applies back-pressure.
+
+import type * as http from 'http';
+import { StringDecoder } from 'string_decoder';
+import type ObsidianPythonBridge from './main';
+import type { JsonRequest, JsonResponse } from './types';
+import { streamActionRegistry, StreamSession } from './stream_actions';
+import { logApiAction } from './audit_logger';
+import { STREAM_MAX_LINE_LENGTH } from './constants';
+
+/** Result of a streamed request, ready to be sent by the HTTP server. */
+export interface StreamRequestResult {
+  statusCode: number;
+  response: JsonResponse;
+}
+
+/**
+ * Consumes an NDJSON request body and dispatches it to a streaming action.
+ *
+ * Once an error occurs the rest of the body is still drained (and ignored),
+ * so the client receives the error response instead of a broken pipe.
+ *
+ * @param plugin - The plugin instance.
+ * @param req    - The incoming HTTP request (body not yet consumed).
+ * @returns The status code and JSON response to send.
+ */
+export async function handleStreamRequest(
+  plugin: ObsidianPythonBridge,
+  req: http.IncomingMessage
+): Promise<StreamRequestResult> {
+  const decoder = new StringDecoder('utf8');
+  let buffered = '';
+  let action = '';
+  let sourceScript: string | undefined;
+  // Declared via `as` so TypeScript does not narrow them to null: both are
+  // reassigned from the closures below.
+  let session = null as StreamSession | null;
+  let failure = null as { statusCode: number; message: string } | null;
+
+  const fail = (statusCode: number, message: string) => {
+    if (failure) return;
+    failure = { statusCode, message };
+    session?.abort?.();
+  };
+
+  // Handles one complete line; returns a promise when the action applies back-pressure.
+  const handleLine = async (line: string): Promise<void> => {
+    if (!line.trim()) return;
+    let parsed: unknown;
+    try {
+      parsed = JSON.parse(line);
+    } catch (error) {
+      fail(400, `Invalid JSON line in stream: ${String(error)}`);
+      return;
+    }
+    if (!parsed || typeof parsed !== 'object') {
+      fail(400, 'Invalid stream line: JSON object expected.');
+      return;
+    }
+
+    if (!action) {
+      // --- Header line: look up, validate and open the streaming action ---
+      const header = parsed as JsonRequest;
+      if (typeof header.action !== 'string' || !header.action) {
+        fail(
+          400,
+          "Invalid stream header. 'action' (non-empty string) is required."
+        );
+        return;
+      }
+      action = header.action;
+      const payload = header.payload ?? {};
+      sourceScript = payload.scriptPath as string | undefined;
+      const definition = streamActionRegistry[action];
+      if (!definition) {
+        fail(200, `Unknown streaming action: ${action}`);
+        return;
+      }
+      const validationError = definition.validate?.(payload);
+      if (validationError) {
+        fail(200, validationError);
+        return;
+      }
+      plugin.logDebug(`Opening streaming action: ${action}`);
+      session = await definition.open(plugin, payload);
+      return;
+    }
+
+    // --- Item line ---
+    await session?.write(parsed as Record<string, unknown>);
+  };
+
+  try {
+    for await (const chunk of req) {
+      if (failure) continue; // Drain the remaining body
+      buffered += decoder.write(chunk as Buffer);
+      let newline = buffered.indexOf('\n');
+      while (newline !== -1 && !failure) {
+        const line = buffered.slice(0, newline);
+        buffered = buffered.slice(newline + 1);
+        try {
+          await handleLine(line);
+        } catch (error) {
+          fail(200, error instanceof Error ? error.message : String(error));
+        }
+        newline = buffered.indexOf('\n');
+      }
+      if (buffered.length > STREAM_MAX_LINE_LENGTH)
+        fail(413, 'Stream line exceeds the maximum allowed length.');
+    }
+    buffered += decoder.end();
+    if (!failure && buffered.trim()) {
+      try {
+        await handleLine(buffered);
+      } catch (error) {
+        fail(200, error instanceof Error ? error.message : String(error));
+      }
+    }
+  } catch (error) {
+    fail(
+      500,
+      `Error reading request stream: ${error instanceof Error ? error.message : String(error)}`
+    );
+  }
+
+  let data: unknown = null;
+  if (!failure) {
+    if (!session) {
+      fail(400, 'Empty stream: a header line is required.');
+    } else {
+      try {
+        data = await session.finish();
+      } catch (error) {
+        fail(200, error instanceof Error ? error.message : String(error));
+      }
+    }
+  }
+
+  if (failure) {
+    const { statusCode, message } = failure;
+    plugin.logError(`Error executing streaming action "${action}":`, message);
+    logApiAction(plugin, action || 'unknown', 'error', sourceScript, message);
+    return {
+      statusCode,
+      response: {
+        status: 'error',
+        error: `Failed to execute action "${action}": ${message}`,
+      },
+    };
+  }
+  logApiAction(plugin, action, 'success', sourceScript);
+  return { statusCode: 200, response: { status: 'success', data } };
+}
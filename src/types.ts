@@ -25,6 +25,10 @@ export interface PythonBridgeSettings {
   pythonExecutablePath: string; // Path to custom Python/uv executable
   /** Cache of settings definitions discovered from Python scripts. Key: relative script path */
   scriptSettingsDefinitions: Record<string, ScriptSettingDefinition[]>;
+  /** SHA-256 of each script's content when its definitions were discovered. Key: relative script path */
+  scriptSettingsHashes: Record<string, string>;
+  /** Scripts each script must run after in "Run all scripts" (define_settings run_after). Key: relative script path */
+  scriptRunAfter: Record<string, string[]>;
   /** User-configured values for script settings. Key: relative script path, Value: { settingKey: value } */
   scriptSettingsValues: Record<
     string,
@@ -37,6 +41,10 @@ export interface PythonBridgeSettings {
   /** User-configured auto-start delay (in seconds) for scripts. Key: relative script path, Value: number */
   scriptAutoStartDelay: Record<string, number>;
   autoSetPYTHONPATH: boolean; // Setting to control automatic PYTHONPATH modification
+  useForkServer: boolean; // Fork script runs from a pre-warmed interpreter (POSIX only)
+  runAllConcurrency: number; // Scripts run at once by "Run all scripts" (1 = one after another)
+  maxRequestBodySize: number; // Largest accepted HTTP request body, in bytes (413 above)
+  debugLogging: boolean; // Write debug messages to the developer console
   /** Audit log settings */
   auditLog: {
     enabled: boolean;
@@ -75,4 +83,6 @@ export interface AuditLogEntry {
   status?: 'success' | 'error';
   error?: string;
   sourceScript?: string;
+  /** Wall-clock duration of a finished script run, in milliseconds. */
+  durationMs?: number;
 }
@@ -0,0 +1,111 @@
+"""
+Import budget of settings discovery.
+
+The plugin re-runs every script with ``--get-settings-json`` to discover its
+settings, so what the library imports before ``_handle_cli_args()`` exits is
+paid once per script on every discovery.  These tests run a minimal script
+that imports the client like real scripts do, the way the plugin runs it,
+and check that the HTTP stack, ``argparse`` and the process/thread pools
+stay unloaded and that all its imports stay within a time budget.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+#: Modules that settings discovery must not import.
+FORBIDDEN_MODULES = ("requests", "urllib3", "argparse", "multiprocessing", "concurrent.futures")
+
+#: Ceiling for the total time of the imports made by the script, in
+#: microseconds.  They take about 20 ms; loading requests takes over 100 ms.
+IMPORT_BUDGET_US = 50_000
+
+SCRIPT = """
+import atexit
+import sys
+
+from ObsidianPluginDevPythonToJS import ObsidianPluginDevPythonToJS, _handle_cli_args, define_settings
+
+FORBIDDEN = {forbidden!r}
+atexit.register(
+    lambda: print("LOADED:" + ",".join(m for m in FORBIDDEN if m in sys.modules), file=sys.stderr)
+)
+define_settings([{{"key": "name", "type": "text", "label": "Name", "default": ""}}])
+_handle_cli_args()
+print("NOT EXITED")
+"""
+
+
+def _environ_without_obsidian() -> dict[str, str]:
+    """Return the environment minus the variables the plugin passes to scripts."""
+    return {key: value for key, value in os.environ.items() if not key.startswith("OBSIDIAN_")}
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={**_environ_without_obsidian(), "PYTHONPATH": str(REPO_ROOT)},
+        timeout=60,
+        check=False,
+    )
+
+
+def _run_discovery(tmp_path: Path) -> subprocess.CompletedProcess[str]:
+    script = tmp_path / "discovery_script.py"
+    script.write_text(SCRIPT.format(forbidden=FORBIDDEN_MODULES), encoding="utf-8")
+    return _run_python(str(script), "--get-settings-json")
+
+
+def _top_level_imports(stderr: str) -> dict[str, int]:
+    """Return the cumulative time (µs) of each top-level import in ``-X importtime`` output.
+
+    Nested imports are indented below the import that triggered them and
+    included in its cumulative time.
+    """
+    imports: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit() and name.startswith(" ") and not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def test_discovery_prints_settings_and_exits(tmp_path: Path) -> None:
+    result = _run_discovery(tmp_path)
+
+    assert result.returncode == 0, result.stderr
+    assert "NOT EXITED" not in result.stdout
+    assert [setting["key"] for setting in json.loads(result.stdout)] == ["name"]
+
+
+def test_discovery_does_not_import_heavy_modules(tmp_path: Path) -> None:
+    result = _run_discovery(tmp_path)
+
+    loaded = [line for line in result.stderr.splitlines() if line.startswith("LOADED:")]
+    assert loaded == ["LOADED:"], result.stderr
+
+
+def test_discovery_import_time_is_within_budget(tmp_path: Path) -> None:
+    startup = _top_level_imports(_run_python("-c", "pass").stderr)
+    result = _run_discovery(tmp_path)
+
+    # Everything imported after interpreter startup: the shim, then the
+    # lazily loaded client chain (importlib.import_module is not reported
+    # by -X importtime, but the client's own imports are, at top level).
+    imports = {name: us for name, us in _top_level_imports(result.stderr).items() if name not in startup}
+    assert "ObsidianPluginDevPythonToJS" in imports, result.stderr
+    assert "obsidian_python_bridge._vault" in imports, result.stderr
+    total = sum(imports.values())
+    slowest = sorted(imports.items(), key=lambda item: -item[1])[:5]
+    assert total < IMPORT_BUDGET_US, f"imports took {total} µs; slowest: {slowest}"
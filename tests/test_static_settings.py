@@ -0,0 +1,80 @@
+"""
+Static settings discovery: scripts whose definitions can be read from the
+source, and scripts that must be run with ``--get-settings-json`` instead.
+"""
+
+from __future__ import annotations
+
+import textwrap
+
+from obsidian_python_bridge._static_settings import extract_settings
+
+HEADER = "from ObsidianPluginDevPythonToJS import _handle_cli_args, define_settings\n"
+
+
+def _extract(body: str) -> object:
+    return extract_settings(HEADER + textwrap.dedent(body))
+
+
+def test_literal_definitions_are_extracted() -> None:
+    result = _extract(
+        """
+        define_settings([{"key": "a", "type": "text", "label": "A"}], run_after=["b.py"])
+        _handle_cli_args()
+        """
+    )
+
+    assert result == {"settings": [{"key": "a", "type": "text", "label": "A"}], "run_after": ["b.py"]}
+
+
+def test_name_bound_once_to_a_literal_is_extracted() -> None:
+    result = _extract(
+        """
+        SETTINGS = [{"key": "a", "type": "text", "label": "A"}]
+        define_settings(SETTINGS)
+        _handle_cli_args()
+        """
+    )
+
+    assert result == [{"key": "a", "type": "text", "label": "A"}]
+
+
+def test_name_mutated_with_append_is_unknown() -> None:
+    result = _extract(
+        """
+        SETTINGS = [{"key": "a", "type": "text", "label": "A"}]
+        SETTINGS.append({"key": "b", "type": "text", "label": "B"})
+        define_settings(SETTINGS)
+        _handle_cli_args()
+        """
+    )
+
+    assert result is None
+
+
+def test_name_mutated_by_subscript_assignment_is_unknown() -> None:
+    result = _extract(
+        """
+        import os
+
+        SETTINGS = [{"key": "a", "type": "text", "label": "A", "default": ""}]
+        SETTINGS[0]["default"] = os.getcwd()
+        define_settings(SETTINGS)
+        _handle_cli_args()
+        """
+    )
+
+    assert result is None
+
+
+def test_name_passed_elsewhere_is_unknown() -> None:
+    result = _extract(
+        """
+        SETTINGS = [{"key": "a", "type": "text", "label": "A"}]
+        add_defaults(SETTINGS)
+        define_settings(SETTINGS)
+        _handle_cli_args()
+        """
+    )
+
+    assert result is None